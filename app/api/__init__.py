@@ -1 +1 @@
-# API module for REST endpoints
+# API module for REST endpoints
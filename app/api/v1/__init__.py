@@ -1 +1 @@
-# API v1 endpoints
+# API v1 endpoints
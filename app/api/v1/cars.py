@@ -1,214 +1,348 @@
-"""
-REST API endpoints for car operations
-Provides JSON API for mobile apps and third-party integrations
-"""
-from flask import Blueprint, jsonify, request, current_app
-from app.services.fleet_service import FleetService
-from app.utils.exceptions import CarNotFoundException, ValidationException
-from functools import wraps
-
-api_cars_bp = Blueprint('api_cars', __name__, url_prefix='/api/v1/cars')
-fleet_service = FleetService()
-
-
-def api_key_required(f):
-    """Decorator to require API key for protected endpoints"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        api_key = request.headers.get('X-API-Key')
-        # In production, validate against stored API keys
-        if not api_key:
-            return jsonify({'error': 'API key required'}), 401
-        return f(*args, **kwargs)
-    return decorated_function
-
-
-@api_cars_bp.route('/', methods=['GET'])
-def get_all_cars():
-    """
-    Get all cars in the fleet
-    
-    Query Parameters:
-        - status: Filter by status (available, booked, maintenance, etc.)
-        - category: Filter by category (economy, luxury, suv)
-        - limit: Maximum number of results (default: 50)
-        - offset: Pagination offset (default: 0)
-    
-    Returns:
-        JSON array of car objects
-    """
-    try:
-        status = request.args.get('status')
-        category = request.args.get('category')
-        limit = int(request.args.get('limit', 50))
-        offset = int(request.args.get('offset', 0))
-        
-        current_app.logger.info(f'API: Fetching cars (status={status}, category={category})')
-        
-        # Get cars based on filters
-        if status:
-            cars = fleet_service.get_cars_by_status(status)
-        else:
-            cars = fleet_service.get_all_cars()
-        
-        # Filter by category if specified
-        if category:
-            cars = [c for c in cars if c.category.lower() == category.lower()]
-        
-        # Apply pagination
-        total = len(cars)
-        cars = cars[offset:offset + limit]
-        
-        # Convert to dict
-        cars_data = [{
-            'id': car.id,
-            'license_plate': car.license_plate,
-            'model': car.model,
-            'category': car.category,
-            'status': car.status,
-            'price_tier': car.price_tier,
-            'daily_rate': car.price_tier * 50,
-            'location': {
-                'latitude': car.rental_location_lat,
-                'longitude': car.rental_location_lng
-            } if car.rental_location_lat else None
-        } for car in cars]
-        
-        return jsonify({
-            'success': True,
-            'total': total,
-            'limit': limit,
-            'offset': offset,
-            'data': cars_data
-        }), 200
-        
-    except ValueError as e:
-        return jsonify({'success': False, 'error': 'Invalid query parameters'}), 400
-    except Exception as e:
-        current_app.logger.error(f'API Error: {str(e)}')
-        return jsonify({'success': False, 'error': 'Internal server error'}), 500
-
-
-@api_cars_bp.route('/<int:car_id>', methods=['GET'])
-def get_car(car_id):
-    """
-    Get a specific car by ID
-    
-    Args:
-        car_id: Car ID
-    
-    Returns:
-        JSON object with car details
-    """
-    try:
-        car = fleet_service.get_car_by_id(car_id)
-        
-        if not car:
-            return jsonify({
-                'success': False,
-                'error': 'Car not found'
-            }), 404
-        
-        car_data = {
-            'id': car.id,
-            'license_plate': car.license_plate,
-            'model': car.model,
-            'category': car.category,
-            'status': car.status,
-            'price_tier': car.price_tier,
-            'daily_rate': car.price_tier * 50,
-            'location': {
-                'current': {
-                    'latitude': car.current_location_lat,
-                    'longitude': car.current_location_lng
-                } if car.current_location_lat else None,
-                'rental': {
-                    'latitude': car.rental_location_lat,
-                    'longitude': car.rental_location_lng
-                } if car.rental_location_lat else None
-            },
-            'created_at': car.created_at.isoformat() if car.created_at else None
-        }
-        
-        return jsonify({
-            'success': True,
-            'data': car_data
-        }), 200
-        
-    except Exception as e:
-        current_app.logger.error(f'API Error: {str(e)}')
-        return jsonify({'success': False, 'error': 'Internal server error'}), 500
-
-
-@api_cars_bp.route('/available', methods=['GET'])
-def get_available_cars():
-    """
-    Get all available cars for booking
-    
-    Query Parameters:
-        - category: Filter by category
-        - min_price: Minimum daily rate
-        - max_price: Maximum daily rate
-    
-    Returns:
-        JSON array of available cars
-    """
-    try:
-        category = request.args.get('category')
-        min_price = float(request.args.get('min_price', 0))
-        max_price = float(request.args.get('max_price', 10000))
-        
-        cars = fleet_service.get_available_cars()
-        
-        # Apply filters
-        if category:
-            cars = [c for c in cars if c.category.lower() == category.lower()]
-        
-        # Filter by price range
-        cars = [c for c in cars if min_price <= (c.price_tier * 50) <= max_price]
-        
-        cars_data = [{
-            'id': car.id,
-            'license_plate': car.license_plate,
-            'model': car.model,
-            'category': car.category,
-            'daily_rate': car.price_tier * 50,
-            'location': {
-                'latitude': car.rental_location_lat,
-                'longitude': car.rental_location_lng
-            } if car.rental_location_lat else None
-        } for car in cars]
-        
-        return jsonify({
-            'success': True,
-            'count': len(cars_data),
-            'data': cars_data
-        }), 200
-        
-    except ValueError:
-        return jsonify({'success': False, 'error': 'Invalid price range'}), 400
-    except Exception as e:
-        current_app.logger.error(f'API Error: {str(e)}')
-        return jsonify({'success': False, 'error': 'Internal server error'}), 500
-
-
-@api_cars_bp.route('/statistics', methods=['GET'])
-@api_key_required
-def get_statistics():
-    """
-    Get fleet statistics (requires API key)
-    
-    Returns:
-        JSON object with fleet statistics
-    """
-    try:
-        stats = fleet_service.get_fleet_statistics()
-        
-        return jsonify({
-            'success': True,
-            'data': stats
-        }), 200
-        
-    except Exception as e:
-        current_app.logger.error(f'API Error: {str(e)}')
-        return jsonify({'success': False, 'error': 'Internal server error'}), 500
+"""
+REST API endpoints for car operations
+Provides JSON API for mobile apps and third-party integrations
+"""
+from flask import Blueprint, jsonify, request, current_app
+from app.services.fleet_service import FleetService
+from app.services.availability_service import AvailabilityService
+from app.utils.exceptions import CarNotFoundException, ValidationException
+from datetime import datetime
+from functools import wraps
+
+api_cars_bp = Blueprint('api_cars', __name__, url_prefix='/api/v1/cars')
+fleet_service = FleetService()
+availability_service = AvailabilityService()
+
+
+def api_key_required(f):
+    """Decorator to require API key for protected endpoints"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        api_key = request.headers.get('X-API-Key')
+        # In production, validate against stored API keys
+        if not api_key:
+            return jsonify({'error': 'API key required'}), 401
+        return f(*args, **kwargs)
+    return decorated_function
+
+
+@api_cars_bp.route('/', methods=['GET'])
+def get_all_cars():
+    """
+    Get all cars in the fleet
+    
+    Query Parameters:
+        - status: Filter by status (available, booked, maintenance, etc.)
+        - category: Filter by category (economy, luxury, suv)
+        - limit: Maximum number of results (default: 50, max: 500)
+        - offset: Pagination offset (default: 0)
+        - after_id: Return cars with id greater than this (keyset pagination,
+          takes precedence over offset)
+        - include_total: Set to false to skip the total count query
+    
+    Returns:
+        JSON array of car objects
+    """
+    try:
+        status = request.args.get('status')
+        category = request.args.get('category')
+        limit = min(int(request.args.get('limit', 50)), 500)
+        offset = int(request.args.get('offset', 0))
+        after_id = request.args.get('after_id')
+        after_id = int(after_id) if after_id else None
+        include_total = request.args.get('include_total', 'true').lower() != 'false'
+        
+        if limit < 1 or offset < 0:
+            raise ValueError('limit and offset must be positive')
+        
+        current_app.logger.info(f'API: Fetching cars (status={status}, category={category})')
+        
+        # Filters and pagination run in SQL
+        cars = fleet_service.get_cars_page(status, category, limit, offset, after_id)
+        total = fleet_service.count_cars(status, category) if include_total else None
+        next_after_id = cars[-1].id if len(cars) == limit else None
+        
+        # Convert to dict
+        cars_data = [{
+            'id': car.id,
+            'license_plate': car.license_plate,
+            'model': car.model,
+            'category': car.category,
+            'status': car.status,
+            'price_tier': car.price_tier,
+            'daily_rate': car.price_tier * 50,
+            'location': {
+                'latitude': car.rental_location_lat,
+                'longitude': car.rental_location_lng
+            } if car.rental_location_lat else None
+        } for car in cars]
+        
+        return jsonify({
+            'success': True,
+            'total': total,
+            'limit': limit,
+            'offset': offset,
+            'after_id': after_id,
+            'next_after_id': next_after_id,
+            'data': cars_data
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'success': False, 'error': 'Invalid query parameters'}), 400
+    except Exception as e:
+        current_app.logger.error(f'API Error: {str(e)}')
+        return jsonify({'success': False, 'error': 'Internal server error'}), 500
+
+
+@api_cars_bp.route('/<int:car_id>', methods=['GET'])
+def get_car(car_id):
+    """
+    Get a specific car by ID
+    
+    Args:
+        car_id: Car ID
+    
+    Returns:
+        JSON object with car details
+    """
+    try:
+        car = fleet_service.get_car_by_id(car_id)
+        
+        if not car:
+            return jsonify({
+                'success': False,
+                'error': 'Car not found'
+            }), 404
+        
+        car_data = {
+            'id': car.id,
+            'license_plate': car.license_plate,
+            'model': car.model,
+            'category': car.category,
+            'status': car.status,
+            'price_tier': car.price_tier,
+            'daily_rate': car.price_tier * 50,
+            'location': {
+                'current': {
+                    'latitude': car.current_location_lat,
+                    'longitude': car.current_location_lng
+                } if car.current_location_lat else None,
+                'rental': {
+                    'latitude': car.rental_location_lat,
+                    'longitude': car.rental_location_lng
+                } if car.rental_location_lat else None
+            },
+            'created_at': car.created_at.isoformat() if car.created_at else None
+        }
+        
+        return jsonify({
+            'success': True,
+            'data': car_data
+        }), 200
+        
+    except Exception as e:
+        current_app.logger.error(f'API Error: {str(e)}')
+        return jsonify({'success': False, 'error': 'Internal server error'}), 500
+
+
+@api_cars_bp.route('/available', methods=['GET'])
+def get_available_cars():
+    """
+    Get all available cars for booking
+    
+    Query Parameters:
+        - category: Filter by category
+        - min_price: Minimum daily rate
+        - max_price: Maximum daily rate
+        - start: Start of rental period (YYYY-MM-DD, requires end)
+        - end: End of rental period (YYYY-MM-DD, requires start)
+    
+    Without start/end, returns cars whose status is currently available.
+    With both, returns cars with no active booking overlapping the period.
+    
+    Returns:
+        JSON array of available cars
+    """
+    try:
+        category = request.args.get('category')
+        min_price = float(request.args.get('min_price', 0))
+        max_price = float(request.args.get('max_price', 10000))
+        start = request.args.get('start')
+        end = request.args.get('end')
+        
+        if start or end:
+            if not (start and end):
+                return jsonify({'success': False, 'error': 'Both start and end are required'}), 400
+            try:
+                start_date = datetime.strptime(start, '%Y-%m-%d')
+                end_date = datetime.strptime(end, '%Y-%m-%d')
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+            if end_date <= start_date:
+                return jsonify({'success': False, 'error': 'end must be after start'}), 400
+            
+            cars = availability_service.get_available_cars(start_date, end_date, category)
+        else:
+            cars = fleet_service.get_available_cars()
+            
+            # Apply filters
+            if category:
+                cars = [c for c in cars if c.category.lower() == category.lower()]
+        
+        # Filter by price range
+        cars = [c for c in cars if min_price <= (c.price_tier * 50) <= max_price]
+        
+        cars_data = [{
+            'id': car.id,
+            'license_plate': car.license_plate,
+            'model': car.model,
+            'category': car.category,
+            'daily_rate': car.price_tier * 50,
+            'location': {
+                'latitude': car.rental_location_lat,
+                'longitude': car.rental_location_lng
+            } if car.rental_location_lat else None
+        } for car in cars]
+        
+        return jsonify({
+            'success': True,
+            'count': len(cars_data),
+            'data': cars_data
+        }), 200
+        
+    except ValueError:
+        return jsonify({'success': False, 'error': 'Invalid price range'}), 400
+    except Exception as e:
+        current_app.logger.error(f'API Error: {str(e)}')
+        return jsonify({'success': False, 'error': 'Internal server error'}), 500
+
+
+@api_cars_bp.route('/nearby', methods=['GET'])
+def get_nearby_cars():
+    """
+    Get cars near a coordinate, nearest first
+    
+    Query Parameters:
+        - lat: Latitude of the search point (required)
+        - lng: Longitude of the search point (required)
+        - radius_km: Search radius in km (default: 10, max: 200)
+        - status: Filter by status (e.g. available)
+        - limit: Maximum number of results (default: 50, max: 500)
+    
+    Returns:
+        JSON array of cars with their distance from the point
+    """
+    try:
+        lat = float(request.args['lat'])
+        lng = float(request.args['lng'])
+        radius_km = float(request.args.get('radius_km', 10))
+        status = request.args.get('status')
+        limit = min(int(request.args.get('limit', 50)), 500)
+        
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            raise ValueError('coordinates out of bounds')
+        if not (0 < radius_km <= 200) or limit < 1:
+            raise ValueError('radius_km must be in (0, 200] and limit positive')
+        
+        nearby = fleet_service.get_nearby_cars(lat, lng, radius_km, status, limit)
+        
+        cars_data = [{
+            'id': car.id,
+            'license_plate': car.license_plate,
+            'model': car.model,
+            'category': car.category,
+            'status': car.status,
+            'daily_rate': car.price_tier * 50,
+            'distance_km': round(distance, 3),
+            'location': {
+                'latitude': car.current_location_lat,
+                'longitude': car.current_location_lng
+            }
+        } for car, distance in nearby]
+        
+        return jsonify({
+            'success': True,
+            'count': len(cars_data),
+            'data': cars_data
+        }), 200
+        
+    except (KeyError, ValueError):
+        return jsonify({'success': False, 'error': 'Invalid query parameters'}), 400
+    except Exception as e:
+        current_app.logger.error(f'API Error: {str(e)}')
+        return jsonify({'success': False, 'error': 'Internal server error'}), 500
+
+
+@api_cars_bp.route('/bulk-status', methods=['POST'])
+@api_key_required
+def bulk_update_status():
+    """
+    Change the status of many cars in one transaction (requires API key)
+    
+    Request Body (JSON):
+        {
+            "car_ids": [int, ...],
+            "status": str
+        }
+    
+    Each car must be allowed to move to the status by the State pattern;
+    the others are reported in `failed` without blocking the rest.
+    
+    Returns:
+        JSON with updated car ids and per-car failures
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        car_ids = data.get('car_ids')
+        new_status = data.get('status')
+        
+        if not isinstance(car_ids, list) or not car_ids or not new_status:
+            return jsonify({
+                'success': False,
+                'error': 'car_ids (non-empty list) and status are required'
+            }), 400
+        # JSON integers only: int() would also accept 1.9, true or "1"
+        if not all(isinstance(car_id, int) and not isinstance(car_id, bool) for car_id in car_ids):
+            return jsonify({'success': False, 'error': 'car_ids must be integers'}), 400
+        
+        result = fleet_service.bulk_update_status(car_ids, new_status)
+        if not result['success']:
+            return jsonify({'success': False, 'error': result['message']}), 400
+        
+        current_app.logger.info(
+            f"API: Moved {len(result['updated'])} cars to {new_status} "
+            f"({len(result['failed'])} failed)"
+        )
+        
+        return jsonify({
+            'success': True,
+            'status': new_status,
+            'updated': result['updated'],
+            'failed': result['failed']
+        }), 200
+        
+    except Exception as e:
+        current_app.logger.error(f'API Error: {str(e)}')
+        return jsonify({'success': False, 'error': 'Internal server error'}), 500
+
+
+@api_cars_bp.route('/statistics', methods=['GET'])
+@api_key_required
+def get_statistics():
+    """
+    Get fleet statistics (requires API key)
+    
+    Returns:
+        JSON object with fleet statistics
+    """
+    try:
+        stats = fleet_service.get_fleet_statistics()
+        
+        return jsonify({
+            'success': True,
+            'data': stats
+        }), 200
+        
+    except Exception as e:
+        current_app.logger.error(f'API Error: {str(e)}')
+        return jsonify({'success': False, 'error': 'Internal server error'}), 500
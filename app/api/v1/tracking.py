@@ -0,0 +1,97 @@
+"""
+REST API endpoints for vehicle telemetry
+Lets GPS trackers and gateways push location fixes in bulk
+"""
+from flask import Blueprint, jsonify, request, current_app
+from app.api.v1.cars import api_key_required
+from app.services.tracking_service import TrackingService
+
+api_tracking_bp = Blueprint('api_tracking', __name__, url_prefix='/api/v1/tracking')
+tracking_service = TrackingService()
+
+
+@api_tracking_bp.route('/locations', methods=['POST'])
+@api_key_required
+def ingest_locations():
+    """
+    Ingest a batch of GPS fixes (requires API key)
+
+    Request Body (JSON):
+        {
+            "points": [
+                {"car_id": int, "lat": float, "lng": float, "ts": str|number (optional)},
+                ...
+            ]
+        }
+
+    A bare JSON array of points is also accepted. `ts` may be an ISO 8601
+    timestamp or epoch seconds and defaults to the time of receipt.
+
+    Returns:
+        JSON summary of accepted and rejected points
+    """
+    try:
+        data = request.get_json(silent=True)
+        points = data.get('points') if isinstance(data, dict) else data
+
+        if not isinstance(points, list) or not points:
+            return jsonify({
+                'success': False,
+                'error': 'Request body must contain a non-empty list of points'
+            }), 400
+
+        result = tracking_service.ingest_batch(points)
+
+        if not result['success']:
+            return jsonify({'success': False, 'error': result['message']}), 413
+
+        current_app.logger.info(
+            f"API: Ingested {result['accepted']} location fixes "
+            f"({len(result['rejected'])} rejected)"
+        )
+
+        return jsonify({
+            'success': True,
+            'accepted': result['accepted'],
+            'stored': result['stored'],
+            'rejected': result['rejected'],
+            'cars_updated': result['cars_updated'],
+            'out_of_range': result['out_of_range']
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f'API Tracking Error: {str(e)}')
+        return jsonify({'success': False, 'error': 'Internal server error'}), 500
+
+
+@api_tracking_bp.route('/offline', methods=['GET'])
+@api_key_required
+def get_offline_trackers():
+    """
+    Get cars whose tracker stopped reporting (requires API key)
+
+    A tracker is offline once it has missed TRACKER_OFFLINE_MISSED_INTERVALS
+    of its update intervals in a row, and back online with its next fix.
+
+    Returns:
+        JSON list of offline cars, longest silent first
+    """
+    try:
+        cars = tracking_service.get_offline_trackers()
+        return jsonify({
+            'success': True,
+            'count': len(cars),
+            'cars': [{
+                'car_id': car.id,
+                'license_plate': car.license_plate,
+                'model': car.model,
+                'tracker_type': car.tracker_type or 'BasicGPS',
+                'tracker_update_interval': car.tracker_update_interval,
+                'last_seen': car.location_updated_at.isoformat() if car.location_updated_at else None,
+                'offline_since': car.tracker_offline_since.isoformat()
+            } for car in cars]
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f'API Tracking Error: {str(e)}')
+        return jsonify({'success': False, 'error': 'Internal server error'}), 500
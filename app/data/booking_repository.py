@@ -1,71 +1,112 @@
-from app.models import db, Booking
-from datetime import datetime
-
-class BookingRepository:
-    """Repository for booking data access"""
-    
-    @staticmethod
-    def create(car_id, customer_name, customer_phone, customer_cnic, 
-               start_date, end_date, total_amount, access_code):
-        """Create a new booking"""
-        booking = Booking(
-            car_id=car_id,
-            customer_name=customer_name,
-            customer_phone=customer_phone,
-            customer_cnic=customer_cnic,
-            start_date=start_date,
-            end_date=end_date,
-            total_amount=total_amount,
-            access_code=access_code,
-            status='active'
-        )
-        db.session.add(booking)
-        db.session.commit()
-        return booking
-    
-    @staticmethod
-    def get_by_id(booking_id):
-        """Get booking by ID"""
-        return Booking.query.get(booking_id)
-    
-    @staticmethod
-    def get_all():
-        """Get all bookings"""
-        return Booking.query.all()
-    
-    @staticmethod
-    def get_active_bookings():
-        """Get all active bookings"""
-        return Booking.query.filter_by(status='active').all()
-    
-    @staticmethod
-    def get_by_car(car_id):
-        """Get all bookings for a specific car"""
-        return Booking.query.filter_by(car_id=car_id).all()
-    
-    @staticmethod
-    def get_active_booking_for_car(car_id):
-        """Get active booking for a car"""
-        return Booking.query.filter_by(car_id=car_id, status='active').first()
-    
-    @staticmethod
-    def update_status(booking_id, new_status):
-        """Update booking status"""
-        booking = Booking.query.get(booking_id)
-        if booking:
-            booking.status = new_status
-            db.session.commit()
-        return booking
-    
-    @staticmethod
-    def get_by_access_code(access_code):
-        """Get booking by access code"""
-        return Booking.query.filter_by(access_code=access_code).first()
-    
-    @staticmethod
-    def verify_access_code(booking_id, access_code):
-        """Verify access code for a booking"""
-        booking = Booking.query.get(booking_id)
-        if booking and booking.access_code == access_code:
-            return True
-        return False
+from app.models import db, Booking, Car
+from app.data.unit_of_work import UnitOfWork
+from sqlalchemy.orm import joinedload, selectinload
+from datetime import datetime
+
+class BookingRepository:
+    """Repository for booking data access"""
+    
+    @staticmethod
+    def create(car_id, customer_name, customer_phone, customer_cnic, 
+               start_date, end_date, total_amount, access_code):
+        """Create a new booking"""
+        booking = Booking(
+            car_id=car_id,
+            customer_name=customer_name,
+            customer_phone=customer_phone,
+            customer_cnic=customer_cnic,
+            start_date=start_date,
+            end_date=end_date,
+            total_amount=total_amount,
+            access_code=access_code,
+            status='active'
+        )
+        db.session.add(booking)
+        UnitOfWork.commit()
+        return booking
+    
+    @staticmethod
+    def with_car(strategy='joined'):
+        """Loader option that fetches each booking's car along with the bookings"""
+        if strategy == 'selectin':
+            return selectinload(Booking.car)
+        return joinedload(Booking.car)
+    
+    @staticmethod
+    def get_by_id(booking_id, options=()):
+        """Get booking by ID"""
+        return db.session.get(Booking, booking_id, options=options)
+    
+    @staticmethod
+    def get_all(options=()):
+        """Get all bookings"""
+        return Booking.query.options(*options).all()
+    
+    @staticmethod
+    def get_active_bookings(options=()):
+        """Get all active bookings"""
+        return Booking.query.options(*options).filter_by(status='active').all()
+    
+    @staticmethod
+    def get_by_car(car_id):
+        """Get all bookings for a specific car"""
+        return Booking.query.filter_by(car_id=car_id).all()
+    
+    @staticmethod
+    def get_active_booking_for_car(car_id):
+        """Get active booking for a car"""
+        return Booking.query.filter_by(car_id=car_id, status='active').first()
+    
+    @staticmethod
+    def has_overlapping_booking(car_id, start_date, end_date):
+        """Check if an active booking for the car overlaps [start_date, end_date)"""
+        overlapping = Booking.query.filter(
+            Booking.car_id == car_id,
+            Booking.status == 'active',
+            Booking.start_date < end_date,
+            Booking.end_date > start_date
+        )
+        return db.session.query(overlapping.exists()).scalar()
+
+    @staticmethod
+    def get_active_periods(since):
+        """Get (car_id, start_date, end_date, id) rows for active bookings ending after `since`"""
+        return db.session.query(
+            Booking.car_id, Booking.start_date, Booking.end_date, Booking.id
+        ).filter(
+            Booking.status == 'active',
+            Booking.end_date > since
+        ).all()
+
+    @staticmethod
+    def get_started_car_ids(now):
+        """Get ids of available cars whose active booking covers `now`"""
+        rows = db.session.query(Booking.car_id).join(Car, Car.id == Booking.car_id).filter(
+            Booking.status == 'active',
+            Booking.start_date <= now,
+            Booking.end_date > now,
+            Car.status == 'available'
+        ).distinct().all()
+        return [car_id for car_id, in rows]
+
+    @staticmethod
+    def update_status(booking_id, new_status):
+        """Update booking status"""
+        booking = Booking.query.get(booking_id)
+        if booking:
+            booking.status = new_status
+            UnitOfWork.commit()
+        return booking
+    
+    @staticmethod
+    def get_by_access_code(access_code, options=()):
+        """Get booking by access code"""
+        return Booking.query.options(*options).filter_by(access_code=access_code).first()
+    
+    @staticmethod
+    def verify_access_code(booking_id, access_code):
+        """Verify access code for a booking"""
+        booking = Booking.query.get(booking_id)
+        if booking and booking.access_code == access_code:
+            return True
+        return False
@@ -1,112 +1,446 @@
-from app.models import db, Car
-from app.domain.car import Car as CarDomain
-from app.patterns.state.available import AvailableState
-from app.patterns.state.booked import BookedState
-from app.patterns.state.in_service import InServiceState
-from app.patterns.state.maintenance import MaintenanceState
-from app.patterns.state.out_of_range import OutOfRangeState
-
-class CarRepository:
-    """Repository for car data access"""
-    
-    STATE_MAP = {
-        'available': AvailableState,
-        'booked': BookedState,
-        'in_service': InServiceState,
-        'maintenance': MaintenanceState,
-        'out_of_range': OutOfRangeState
-    }
-    
-    @staticmethod
-    def create(license_plate, model, category, price_tier, tracker_type='BasicGPS', 
-               tracker_update_interval=300, rental_lat=None, rental_lng=None):
-        """Create a new car with tracker"""
-        car = Car(
-            license_plate=license_plate,
-            model=model,
-            category=category,
-            price_tier=price_tier,
-            status='available',
-            tracker_type=tracker_type,
-            tracker_update_interval=tracker_update_interval,
-            rental_location_lat=rental_lat,
-            rental_location_lng=rental_lng
-        )
-        db.session.add(car)
-        db.session.commit()
-        return car
-    
-    @staticmethod
-    def get_by_id(car_id):
-        """Get car by ID"""
-        return Car.query.get(car_id)
-    
-    @staticmethod
-    def get_all():
-        """Get all cars"""
-        return Car.query.all()
-    
-    @staticmethod
-    def get_by_status(status):
-        """Get cars by status"""
-        return Car.query.filter_by(status=status).all()
-    
-    @staticmethod
-    def get_available_cars():
-        """Get all available cars"""
-        return Car.query.filter_by(status='available').all()
-    
-    @staticmethod
-    def update_status(car_id, new_status):
-        """Update car status"""
-        car = Car.query.get(car_id)
-        if car:
-            car.status = new_status
-            db.session.commit()
-        return car
-    
-    @staticmethod
-    def update_location(car_id, latitude, longitude):
-        """Update car's current location"""
-        car = Car.query.get(car_id)
-        if car:
-            car.current_location_lat = latitude
-            car.current_location_lng = longitude
-            db.session.commit()
-        return car
-    
-    @staticmethod
-    def delete(car_id):
-        """Delete a car"""
-        car = Car.query.get(car_id)
-        if car:
-            db.session.delete(car)
-            db.session.commit()
-            return True
-        return False
-    
-    @staticmethod
-    def to_domain(car_model):
-        """Convert database model to domain entity"""
-        if not car_model:
-            return None
-        
-        car_domain = CarDomain(
-            car_id=car_model.id,
-            license_plate=car_model.license_plate,
-            model=car_model.model,
-            category=car_model.category
-        )
-        
-        # Set the appropriate state
-        state_class = CarRepository.STATE_MAP.get(car_model.status, AvailableState)
-        car_domain.set_state(state_class())
-        
-        # Set locations
-        if car_model.current_location_lat and car_model.current_location_lng:
-            car_domain.current_location = (car_model.current_location_lat, car_model.current_location_lng)
-        
-        if car_model.rental_location_lat and car_model.rental_location_lng:
-            car_domain.rental_location = (car_model.rental_location_lat, car_model.rental_location_lng)
-        
-        return car_domain
+from app.models import db, Car, Booking
+from app.data.unit_of_work import UnitOfWork
+from sqlalchemy import bindparam, func, insert, or_, update
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from app.domain.car import Car as CarDomain
+from app.domain.spatial_grid import SpatialGrid
+from datetime import datetime
+from app.patterns.state.available import AvailableState
+from app.patterns.state.transitions import StateTransitions
+
+class CarRepository:
+    """Repository for car data access"""
+    
+    @staticmethod
+    def create(license_plate, model, category, price_tier, tracker_type='BasicGPS', 
+               tracker_update_interval=300, rental_lat=None, rental_lng=None, interval_km=None):
+        """Create a new car with tracker and maintenance interval"""
+        car = Car(
+            license_plate=license_plate,
+            model=model,
+            category=category,
+            price_tier=price_tier,
+            status='available',
+            tracker_type=tracker_type,
+            tracker_update_interval=tracker_update_interval,
+            rental_location_lat=rental_lat,
+            rental_location_lng=rental_lng,
+            interval_km=interval_km,
+            odometer_km=0.0,
+            service_due_km=interval_km
+        )
+        db.session.add(car)
+        UnitOfWork.commit()
+        return car
+    
+    @staticmethod
+    def bulk_create(rows):
+        """Insert many cars with one executemany INSERT (caller commits)
+
+        `rows` holds dicts of the `create` arguments; new cars start
+        available with a zero odometer, like cars added one by one.
+        """
+        if not rows:
+            return
+        db.session.execute(insert(Car), [dict(
+            license_plate=row['license_plate'],
+            model=row['model'],
+            category=row['category'],
+            price_tier=row['price_tier'],
+            status='available',
+            tracker_type=row.get('tracker_type', 'BasicGPS'),
+            tracker_update_interval=row.get('tracker_update_interval', 300),
+            rental_location_lat=row.get('rental_lat'),
+            rental_location_lng=row.get('rental_lng'),
+            interval_km=row.get('interval_km'),
+            odometer_km=0.0,
+            service_due_km=row.get('interval_km')
+        ) for row in rows])
+    
+    @staticmethod
+    def get_existing_plates(license_plates):
+        """Get which of the given license plates are already in the fleet"""
+        if not license_plates:
+            return set()
+        rows = db.session.query(Car.license_plate)\
+            .filter(Car.license_plate.in_(list(license_plates))).all()
+        return {plate for plate, in rows}
+    
+    @staticmethod
+    def with_bookings():
+        """Loader option that fetches each car's bookings in one extra query"""
+        return selectinload(Car.bookings)
+    
+    @staticmethod
+    def with_claims():
+        """Loader option that fetches each car's claims in one extra query"""
+        return selectinload(Car.claims)
+    
+    @staticmethod
+    def get_by_id(car_id, options=()):
+        """Get car by ID"""
+        return db.session.get(Car, car_id, options=options)
+    
+    @staticmethod
+    def get_by_ids(car_ids, options=()):
+        """Get many cars by ID in a single query"""
+        if not car_ids:
+            return []
+        return Car.query.options(*options).filter(Car.id.in_(car_ids)).all()
+
+    @staticmethod
+    def get_all(options=()):
+        """Get all cars"""
+        return Car.query.options(*options).all()
+    
+    @staticmethod
+    def get_by_status(status, options=()):
+        """Get cars by status"""
+        return Car.query.options(*options).filter_by(status=status).all()
+    
+    @staticmethod
+    def get_available_cars(options=()):
+        """Get all available cars"""
+        return Car.query.options(*options).filter_by(status='available').all()
+    
+    @staticmethod
+    def _filtered(status=None, category=None):
+        """Build a car query with optional status/category predicates"""
+        query = Car.query
+        if status:
+            query = query.filter(Car.status == status)
+        if category:
+            query = query.filter(Car.category == category.lower())
+        return query
+    
+    @staticmethod
+    def get_page(status=None, category=None, limit=50, offset=0, after_id=None):
+        """Get one page of cars ordered by id
+
+        With `after_id` the page starts right after that id (keyset
+        pagination), so deep pages cost the same as the first one.
+        """
+        query = CarRepository._filtered(status, category).order_by(Car.id)
+        if after_id is not None:
+            query = query.filter(Car.id > after_id)
+        elif offset:
+            query = query.offset(offset)
+        return query.limit(limit).all()
+    
+    @staticmethod
+    def count(status=None, category=None):
+        """Count cars matching optional status/category predicates"""
+        return CarRepository._filtered(status, category).count()
+    
+    @staticmethod
+    def count_by_status_and_category():
+        """Get (status, category, count) rows aggregated in a single GROUP BY"""
+        return db.session.query(
+            Car.status, Car.category, func.count(Car.id)
+        ).group_by(Car.status, Car.category).all()
+    
+    @staticmethod
+    def _free_for(start_date, end_date):
+        """NOT EXISTS predicate: the car has no active booking overlapping [start_date, end_date)"""
+        return ~Booking.query.filter(
+            Booking.car_id == Car.id,
+            Booking.status == 'active',
+            Booking.start_date < end_date,
+            Booking.end_date > start_date
+        ).exists()
+
+    @staticmethod
+    def get_bookable(excluded_statuses, start_date, end_date, category=None):
+        """Get cars free for [start_date, end_date) whose status allows a booking
+
+        The overlap exclusion runs in the database (NOT EXISTS on the
+        bookings index), so only free cars are loaded.
+        """
+        query = CarRepository._filtered(category=category)
+        return query.filter(Car.status.notin_(excluded_statuses),
+                            CarRepository._free_for(start_date, end_date))\
+            .order_by(Car.id).all()
+
+    @staticmethod
+    def lock_by_id(car_id):
+        """Get a car and lock its row for the rest of the unit of work"""
+        return UnitOfWork.lock(Car.query.filter(Car.id == car_id)).first()
+
+    @staticmethod
+    def lock_first_bookable(category, start_date, end_date, excluded_statuses, skip_ids=()):
+        """Lock the lowest-id car of a category that is free for [start_date, end_date)
+
+        Rows already locked by concurrent transactions are skipped (SKIP
+        LOCKED), so simultaneous requests each get a different car instead
+        of queueing behind the same one.
+        """
+        query = CarRepository._filtered(category=category).filter(
+            Car.status.notin_(excluded_statuses), CarRepository._free_for(start_date, end_date))
+        if skip_ids:
+            query = query.filter(Car.id.notin_(skip_ids))
+        query = query.order_by(Car.id).limit(1)
+        return UnitOfWork.lock(query, skip_locked=True).first()
+
+    @staticmethod
+    def update_status(car_id, new_status):
+        """Update car status"""
+        car = Car.query.get(car_id)
+        if car:
+            if car.status == 'maintenance' and new_status != 'maintenance':
+                CarRepository.mark_serviced(car)
+            car.status = new_status
+            UnitOfWork.commit()
+        return car
+    
+    @staticmethod
+    def mark_serviced(car):
+        """Schedule a car's next service one interval after its current odometer"""
+        if car.interval_km:
+            car.service_due_km = (car.odometer_km or 0.0) + car.interval_km
+    
+    @staticmethod
+    def bulk_mark_serviced(car_ids, chunk_size=1000):
+        """Schedule the next service of many cars with set-based UPDATEs (caller commits)"""
+        car_ids = list(car_ids)
+        for i in range(0, len(car_ids), chunk_size):
+            Car.query.filter(Car.id.in_(car_ids[i:i + chunk_size]), Car.interval_km.isnot(None))\
+                .update({Car.service_due_km: func.coalesce(Car.odometer_km, 0.0) + Car.interval_km},
+                        synchronize_session=False)
+    
+    @staticmethod
+    def add_odometer(car, distance_km):
+        """Atomically add to a car's odometer and get the new reading (caller commits)
+
+        The increment runs as an UPDATE ... RETURNING, so concurrent ingests
+        never lose distance, and `car.odometer_km` holds the stored number
+        afterwards rather than a pending SQL expression.
+        """
+        table = Car.__table__
+        odometer_km = db.session.execute(
+            update(table).where(table.c.id == car.id)
+            .values(odometer_km=func.coalesce(table.c.odometer_km, 0.0) + distance_km)
+            .returning(table.c.odometer_km)
+        ).scalar_one()
+        set_committed_value(car, 'odometer_km', odometer_km)
+        return odometer_km
+    
+    @staticmethod
+    def get_statuses(car_ids, lock=False, chunk_size=1000):
+        """Get {car_id: status} for many cars without loading them
+
+        With `lock=True` the rows stay locked until the transaction ends.
+        """
+        car_ids = list(car_ids)
+        statuses = {}
+        for i in range(0, len(car_ids), chunk_size):
+            query = db.session.query(Car.id, Car.status)\
+                .filter(Car.id.in_(car_ids[i:i + chunk_size]))
+            if lock:
+                query = UnitOfWork.lock(query)
+            statuses.update(query.all())
+        return statuses
+    
+    @staticmethod
+    def bulk_update_status(car_ids, new_status, chunk_size=1000):
+        """Set the status of many cars with set-based UPDATEs and one commit"""
+        car_ids = list(car_ids)
+        for i in range(0, len(car_ids), chunk_size):
+            Car.query.filter(Car.id.in_(car_ids[i:i + chunk_size]))\
+                .update({Car.status: new_status}, synchronize_session=False)
+        UnitOfWork.commit()
+    
+    @staticmethod
+    def bulk_set_range_pending(car_ids, since, chunk_size=1000):
+        """Set (or clear with None) when many cars started crossing their zone boundary (caller commits)"""
+        car_ids = list(car_ids)
+        for i in range(0, len(car_ids), chunk_size):
+            Car.query.filter(Car.id.in_(car_ids[i:i + chunk_size]))\
+                .update({Car.range_pending_since: since}, synchronize_session=False)
+    
+    @staticmethod
+    def get_geofence_rows():
+        """Get (id, status, current lat/lng, rental lat/lng, range_pending_since) for every tracked car"""
+        return db.session.query(
+            Car.id, Car.status,
+            Car.current_location_lat, Car.current_location_lng,
+            Car.rental_location_lat, Car.rental_location_lng,
+            Car.range_pending_since
+        ).filter(
+            Car.current_location_lat.isnot(None),
+            Car.rental_location_lat.isnot(None)
+        ).all()
+    
+    @staticmethod
+    def set_location(car, latitude, longitude, timestamp=None):
+        """Set a car's current position and keep its spatial index cell in sync"""
+        car.current_location_lat = latitude
+        car.current_location_lng = longitude
+        car.location_cell = SpatialGrid.cell_for(latitude, longitude)
+        car.location_updated_at = timestamp or datetime.now()
+    
+    @staticmethod
+    def bulk_update_positions(positions):
+        """Write many cars' last positions in one executemany UPDATE
+
+        `positions` holds (car_id, latitude, longitude, timestamp) tuples. A
+        row already holding a newer fix (e.g. flushed by another worker) is
+        left untouched.
+        """
+        if not positions:
+            return
+        table = Car.__table__
+        stmt = update(table).where(
+            table.c.id == bindparam('b_id'),
+            or_(table.c.location_updated_at.is_(None),
+                table.c.location_updated_at < bindparam('b_ts'))
+        ).values(
+            current_location_lat=bindparam('b_lat'),
+            current_location_lng=bindparam('b_lng'),
+            location_cell=bindparam('b_cell'),
+            location_updated_at=bindparam('b_ts')
+        )
+        db.session.execute(stmt, [{
+            'b_id': car_id,
+            'b_lat': latitude,
+            'b_lng': longitude,
+            'b_cell': SpatialGrid.cell_for(latitude, longitude),
+            'b_ts': timestamp
+        } for car_id, latitude, longitude, timestamp in positions])
+        UnitOfWork.commit()
+    
+    @staticmethod
+    def get_heartbeat_rows():
+        """Get (id, location_updated_at, tracker_update_interval, offline) of every reporting car"""
+        return db.session.query(
+            Car.id, Car.location_updated_at, Car.tracker_update_interval,
+            Car.tracker_offline_since.isnot(None)
+        ).filter(Car.location_updated_at.isnot(None)).all()
+    
+    @staticmethod
+    def mark_tracker_offline(car_id, last_seen, since):
+        """Flag a silent tracker offline; False if already flagged or a newer fix is stored
+
+        The conditional UPDATE lets exactly one worker claim the transition.
+        """
+        count = Car.query.filter(
+            Car.id == car_id,
+            Car.tracker_offline_since.is_(None),
+            or_(Car.location_updated_at.is_(None), Car.location_updated_at <= last_seen)
+        ).update({Car.tracker_offline_since: since}, synchronize_session=False)
+        UnitOfWork.commit()
+        return count == 1
+    
+    @staticmethod
+    def clear_tracker_offline(car_ids):
+        """Clear the offline flag of trackers that reported again"""
+        if not car_ids:
+            return
+        Car.query.filter(Car.id.in_(list(car_ids)), Car.tracker_offline_since.isnot(None))\
+            .update({Car.tracker_offline_since: None}, synchronize_session=False)
+        UnitOfWork.commit()
+    
+    @staticmethod
+    def get_tracker_offline():
+        """Get cars whose tracker is flagged offline, longest silent first"""
+        return Car.query.filter(Car.tracker_offline_since.isnot(None))\
+            .order_by(Car.location_updated_at).all()
+    
+    @staticmethod
+    def get_in_cells(cell_ranges, status=None):
+        """Get cars whose location cell falls in any of the (low, high) ranges"""
+        if not cell_ranges:
+            return []
+        query = Car.query.filter(or_(*(Car.location_cell.between(low, high)
+                                       for low, high in cell_ranges)))
+        if status:
+            query = query.filter(Car.status == status)
+        return query.all()
+    
+    @staticmethod
+    def get_pending_return_alert_ids(alerted_before):
+        """Get ids of cars back in range whose returned alert is still deferred"""
+        rows = db.session.query(Car.id).filter(
+            Car.status != 'out_of_range',
+            Car.range_alert_open.is_(True),
+            Car.range_alert_at <= alerted_before
+        ).all()
+        return [row[0] for row in rows]
+    
+    @staticmethod
+    def backfill_range_alerts():
+        """Mark cars already out of range as having an open alert"""
+        count = Car.query.filter(Car.range_alert_open.is_(None),
+                                 Car.status == 'out_of_range')\
+            .update({'range_alert_open': True}, synchronize_session=False)
+        UnitOfWork.commit()
+        return count
+    
+    @staticmethod
+    def backfill_maintenance_profiles(interval_km_by_category):
+        """Set the maintenance interval and first service of cars created without one"""
+        count = 0
+        for category, interval_km in interval_km_by_category.items():
+            count += Car.query.filter(Car.interval_km.is_(None), Car.category == category)\
+                .update({
+                    Car.interval_km: interval_km,
+                    Car.odometer_km: func.coalesce(Car.odometer_km, 0.0),
+                    Car.service_due_km: func.coalesce(Car.odometer_km, 0.0) + interval_km
+                }, synchronize_session=False)
+        UnitOfWork.commit()
+        return count
+    
+    @staticmethod
+    def backfill_location_cells():
+        """Compute location_cell for positioned cars that do not have one yet"""
+        cars = Car.query.filter(Car.location_cell.is_(None),
+                                Car.current_location_lat.isnot(None),
+                                Car.current_location_lng.isnot(None)).all()
+        for car in cars:
+            car.location_cell = SpatialGrid.cell_for(car.current_location_lat, car.current_location_lng)
+        UnitOfWork.commit()
+        return len(cars)
+    
+    @staticmethod
+    def update_location(car_id, latitude, longitude):
+        """Update car's current location"""
+        car = Car.query.get(car_id)
+        if car:
+            CarRepository.set_location(car, latitude, longitude)
+            UnitOfWork.commit()
+        return car
+    
+    @staticmethod
+    def delete(car_id):
+        """Delete a car"""
+        car = Car.query.get(car_id)
+        if car:
+            db.session.delete(car)
+            UnitOfWork.commit()
+            return True
+        return False
+    
+    @staticmethod
+    def to_domain(car_model):
+        """Convert database model to domain entity"""
+        if not car_model:
+            return None
+        
+        car_domain = CarDomain(
+            car_id=car_model.id,
+            license_plate=car_model.license_plate,
+            model=car_model.model,
+            category=car_model.category
+        )
+        
+        # Set the appropriate (shared) state
+        car_domain.set_state(StateTransitions.get_state(car_model.status, AvailableState()))
+        
+        # Set locations
+        if car_model.current_location_lat and car_model.current_location_lng:
+            car_domain.current_location = (car_model.current_location_lat, car_model.current_location_lng)
+        
+        if car_model.rental_location_lat and car_model.rental_location_lng:
+            car_domain.rental_location = (car_model.rental_location_lat, car_model.rental_location_lng)
+        
+        return car_domain
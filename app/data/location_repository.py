@@ -0,0 +1,110 @@
+from app.models import db, Car, HistoryCompaction, LocationHistory
+from sqlalchemy import delete, func, insert, select, text
+
+class LocationRepository:
+    """Repository for location history data access"""
+
+    @staticmethod
+    def bulk_add(rows):
+        """Stage many history rows as one multi-row INSERT (caller commits)"""
+        if rows:
+            db.session.execute(insert(LocationHistory), rows)
+
+    @staticmethod
+    def get_history(car_id, limit=50):
+        """Get the most recent location history for a car"""
+        return LocationHistory.query.filter_by(car_id=car_id)\
+            .order_by(LocationHistory.timestamp.desc())\
+            .limit(limit).all()
+
+    @staticmethod
+    def get_last_points(car_ids):
+        """Get {car_id: (latitude, longitude, timestamp)} of each car's newest history row"""
+        if not car_ids:
+            return {}
+        newest = db.session.query(
+            LocationHistory.car_id, func.max(LocationHistory.timestamp).label('timestamp')
+        ).filter(LocationHistory.car_id.in_(car_ids))\
+            .group_by(LocationHistory.car_id).subquery()
+        rows = db.session.query(
+            LocationHistory.car_id, LocationHistory.latitude,
+            LocationHistory.longitude, LocationHistory.timestamp
+        ).join(newest, (LocationHistory.car_id == newest.c.car_id) &
+               (LocationHistory.timestamp == newest.c.timestamp)).all()
+        return {car_id: (latitude, longitude, timestamp)
+                for car_id, latitude, longitude, timestamp in rows}
+
+    @staticmethod
+    def get_car_ids():
+        """Get the ids of every car, in order"""
+        return [car_id for (car_id,) in db.session.query(Car.id).order_by(Car.id)]
+
+    @staticmethod
+    def get_first_timestamp(car_id, before, after=None):
+        """Get the time of a car's oldest history row in [after, before) (None if none)"""
+        query = db.session.query(func.min(LocationHistory.timestamp))\
+            .filter(LocationHistory.car_id == car_id, LocationHistory.timestamp < before)
+        if after is not None:
+            query = query.filter(LocationHistory.timestamp >= after)
+        return query.scalar()
+
+    @staticmethod
+    def get_track(car_id, start, end):
+        """Get (id, latitude, longitude, timestamp, is_out_of_range) rows of a car in [start, end)"""
+        return db.session.query(
+            LocationHistory.id, LocationHistory.latitude, LocationHistory.longitude,
+            LocationHistory.timestamp, LocationHistory.is_out_of_range
+        ).filter(LocationHistory.car_id == car_id,
+                 LocationHistory.timestamp >= start,
+                 LocationHistory.timestamp < end)\
+            .order_by(LocationHistory.timestamp, LocationHistory.id).all()
+
+    @staticmethod
+    def iter_track_batches(car_id, after=None, before=None, batch_size=10000):
+        """Stream (timestamp, latitude, longitude, is_out_of_range) rows of a car in time order
+
+        Yields lists of at most `batch_size` plain tuples without building ORM objects.
+        """
+        query = select(
+            LocationHistory.timestamp, LocationHistory.latitude,
+            LocationHistory.longitude, LocationHistory.is_out_of_range
+        ).where(LocationHistory.car_id == car_id)
+        if after is not None:
+            query = query.where(LocationHistory.timestamp > after)
+        if before is not None:
+            query = query.where(LocationHistory.timestamp < before)
+        query = query.order_by(LocationHistory.timestamp, LocationHistory.id)
+        result = db.session.execute(query.execution_options(yield_per=batch_size))
+        for batch in result.partitions():
+            yield [tuple(row) for row in batch]
+
+    @staticmethod
+    def delete_ids(ids):
+        """Stage deletion of history rows by id (caller commits)"""
+        if ids:
+            db.session.execute(delete(LocationHistory).where(LocationHistory.id.in_(ids)))
+
+    @staticmethod
+    def get_compacted_until(car_id):
+        """Get the time before which a car's history is already compacted"""
+        state = db.session.get(HistoryCompaction, car_id)
+        return state.compacted_until if state else None
+
+    @staticmethod
+    def set_compacted_until(car_id, until):
+        """Stage the compaction watermark of a car (caller commits)"""
+        state = db.session.get(HistoryCompaction, car_id)
+        if state is None:
+            db.session.add(HistoryCompaction(car_id=car_id, compacted_until=until))
+        else:
+            state.compacted_until = until
+
+    @staticmethod
+    def vacuum():
+        """Let Postgres reuse the space of deleted history rows (no-op elsewhere)"""
+        if db.engine.dialect.name != 'postgresql':
+            return False
+        # VACUUM cannot run in a transaction; it does not block inserts
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.execute(text(f'VACUUM (ANALYZE) {LocationHistory.__tablename__}'))
+        return True
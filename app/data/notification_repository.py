@@ -0,0 +1,55 @@
+from app.models import db, Notification
+from app.data.unit_of_work import UnitOfWork
+import json
+
+class NotificationRepository:
+    """Repository for persisted admin notifications"""
+    
+    @staticmethod
+    def create(event_type, message, data):
+        """Store a notification; its id orders notifications across workers"""
+        notification = Notification(
+            type=event_type,
+            message=message,
+            data=json.dumps(data, default=str)
+        )
+        db.session.add(notification)
+        UnitOfWork.commit()
+        return notification
+    
+    @staticmethod
+    def get_since(after_id=0, limit=100):
+        """Get notifications with id > after_id, oldest first"""
+        return Notification.query.filter(Notification.id > after_id)\
+            .order_by(Notification.id).limit(limit).all()
+    
+    @staticmethod
+    def get_latest(limit=10):
+        """Get the newest notifications, oldest first"""
+        rows = Notification.query.order_by(Notification.id.desc()).limit(limit).all()
+        return rows[::-1]
+    
+    @staticmethod
+    def get_last_id():
+        """Get the id of the newest notification (0 if none)"""
+        return db.session.query(db.func.max(Notification.id)).scalar() or 0
+    
+    @staticmethod
+    def prune(keep):
+        """Delete all but the newest `keep` notifications"""
+        cutoff = NotificationRepository.get_last_id() - keep
+        if cutoff > 0:
+            Notification.query.filter(Notification.id <= cutoff)\
+                .delete(synchronize_session=False)
+            UnitOfWork.commit()
+    
+    @staticmethod
+    def to_dict(notification):
+        """Convert a stored notification to the notifier's dict format"""
+        return {
+            'id': notification.id,
+            'type': notification.type,
+            'message': notification.message,
+            'data': json.loads(notification.data) if notification.data else {},
+            'created_at': notification.created_at.isoformat() if notification.created_at else None
+        }
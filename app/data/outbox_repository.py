@@ -0,0 +1,41 @@
+from app.models import db, OutboxEvent
+from app.data.unit_of_work import UnitOfWork
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+import json
+
+class OutboxRepository:
+    """Repository for the event bus outbox table"""
+    
+    @staticmethod
+    def add(connection, event_type, data):
+        """Append an event on `connection`; get its id, which orders events across workers
+
+        Written outside the request's session so publishing never commits or
+        breaks the caller's pending changes.
+        """
+        table = OutboxEvent.__table__
+        return connection.execute(
+            insert(table).values(event_type=event_type, payload=json.dumps(data, default=str))
+            .returning(table.c.id)
+        ).scalar_one()
+    
+    @staticmethod
+    def get_since(after_id, limit=500):
+        """Get (id, event_type, payload) rows with id > after_id, oldest first"""
+        return db.session.query(
+            OutboxEvent.id, OutboxEvent.event_type, OutboxEvent.payload
+        ).filter(OutboxEvent.id > after_id).order_by(OutboxEvent.id).limit(limit).all()
+    
+    @staticmethod
+    def get_last_id():
+        """Get the id of the newest event (0 if none)"""
+        return db.session.query(db.func.max(OutboxEvent.id)).scalar() or 0
+    
+    @staticmethod
+    def delete_older_than(seconds):
+        """Delete events every worker has had time to consume"""
+        cutoff = datetime.now() - timedelta(seconds=seconds)
+        OutboxEvent.query.filter(OutboxEvent.created_at < cutoff)\
+            .delete(synchronize_session=False)
+        UnitOfWork.commit()
@@ -0,0 +1,84 @@
+from app.models import db
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+class SchemaUpgrade:
+    """Idempotent in-place upgrade of an existing database to the current models
+
+    `db.create_all()` only creates missing tables. This also adds model
+    columns and indexes that are missing from tables created by an older
+    version of the application, so it is safe to run on every deploy.
+    """
+    
+    @staticmethod
+    def add_missing_columns():
+        """Add model columns missing from existing tables (as nullable columns)"""
+        inspector = inspect(db.engine)
+        added = []
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                db.session.execute(text(
+                    f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+                ))
+                added.append(f'{table.name}.{column.name}')
+        db.session.commit()
+        return added
+    
+    @staticmethod
+    def create_missing_indexes():
+        """Create model indexes missing from existing tables"""
+        inspector = inspect(db.engine)
+        created = []
+        for table in db.metadata.sorted_tables:
+            existing = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    SchemaUpgrade._create_index(index)
+                    created.append(index.name)
+        return created
+    
+    @staticmethod
+    def _create_index(index):
+        """Create one index, without blocking writes on Postgres"""
+        if db.engine.dialect.name != 'postgresql':
+            index.create(bind=db.engine)
+            return
+        
+        # CONCURRENTLY keeps large tables writable but cannot run in a transaction
+        ddl = str(CreateIndex(index).compile(dialect=db.engine.dialect))
+        ddl = ddl.replace('INDEX ', 'INDEX CONCURRENTLY IF NOT EXISTS ', 1)
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.execute(text(ddl))
+    
+    @staticmethod
+    def run():
+        """Bring the database schema up to date and backfill derived columns"""
+        from app.data.car_repository import CarRepository
+        from app.patterns.abstact_factory.economy_vehicle_factory import EconomyVehicleFactory
+        from app.patterns.abstact_factory.luxury_vehicle_factory import LuxuryVehicleFactory
+        from app.patterns.abstact_factory.suv_vehicle_factory import SUVVehicleFactory
+        
+        db.create_all()
+        columns = SchemaUpgrade.add_missing_columns()
+        indexes = SchemaUpgrade.create_missing_indexes()
+        backfilled = CarRepository.backfill_location_cells()
+        open_alerts = CarRepository.backfill_range_alerts()
+        profiles = CarRepository.backfill_maintenance_profiles({
+            category: factory().create_maintenance_profile()['interval_km']
+            for category, factory in (('economy', EconomyVehicleFactory),
+                                      ('luxury', LuxuryVehicleFactory),
+                                      ('suv', SUVVehicleFactory))
+        })
+        return {
+            'columns_added': columns,
+            'indexes_created': indexes,
+            'location_cells_backfilled': backfilled,
+            'range_alerts_backfilled': open_alerts,
+            'maintenance_profiles_backfilled': profiles
+        }
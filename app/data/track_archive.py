@@ -0,0 +1,110 @@
+from config import Config
+from datetime import datetime
+import numpy as np
+import os
+import re
+
+class ArchivedTrack:
+    """Time-ordered columns of one car's archived fixes (read-only array views)"""
+
+    def __init__(self, timestamp, latitude, longitude, out_of_range):
+        self.timestamp = timestamp  # datetime64[us]
+        self.latitude = latitude
+        self.longitude = longitude
+        self.out_of_range = out_of_range
+
+    def __len__(self):
+        return len(self.timestamp)
+
+
+class TrackArchive:
+    """Columnar, memory-mapped archive of location history for analytics
+
+    Each car has one append-only raw file per column under
+    `<root>/car_<id>/` (timestamp, latitude, longitude, out_of_range), kept
+    in timestamp order. Reads memory-map the files and slice time ranges
+    with a binary search, so a month of fixes is a set of array views
+    rather than millions of ORM objects. The timestamp column is written
+    last, and the row count is taken from it, so readers never see a row
+    whose other columns are still being appended.
+    """
+
+    COLUMNS = (
+        ('latitude', np.dtype(np.float64)),
+        ('longitude', np.dtype(np.float64)),
+        ('out_of_range', np.dtype(np.bool_)),
+        ('timestamp', np.dtype('datetime64[us]'))
+    )
+
+    CAR_DIR = re.compile(r'^car_(\d+)$')
+
+    def __init__(self, root=None):
+        self.root = root or Config.TRACK_ARCHIVE_DIR
+
+    def _path(self, car_id, column):
+        return os.path.join(self.root, f'car_{car_id}', f'{column}.bin')
+
+    def get_car_ids(self):
+        """Get the ids of cars with an archive"""
+        if not os.path.isdir(self.root):
+            return []
+        matches = (self.CAR_DIR.match(name) for name in os.listdir(self.root))
+        return sorted(int(match.group(1)) for match in matches if match)
+
+    def count(self, car_id):
+        """Get the number of archived fixes of a car"""
+        try:
+            size = os.path.getsize(self._path(car_id, 'timestamp'))
+        except FileNotFoundError:
+            return 0
+        return size // self.COLUMNS[-1][1].itemsize
+
+    def get_last_timestamp(self, car_id):
+        """Get the time of a car's newest archived fix (None if none)"""
+        count = self.count(car_id)
+        if not count:
+            return None
+        last = self._map(car_id, 'timestamp', np.dtype('datetime64[us]'), count)[-1]
+        return last.astype(datetime)
+
+    def append(self, car_id, timestamps, latitudes, longitudes, out_of_range):
+        """Append fixes newer than the archive's last one, in timestamp order"""
+        values = {
+            'timestamp': np.asarray(timestamps, dtype='datetime64[us]'),
+            'latitude': np.asarray(latitudes, dtype=np.float64),
+            'longitude': np.asarray(longitudes, dtype=np.float64),
+            'out_of_range': np.asarray(out_of_range, dtype=np.bool_)
+        }
+        if not len(values['timestamp']):
+            return 0
+        if np.any(values['timestamp'][1:] < values['timestamp'][:-1]):
+            raise ValueError("Archived fixes must be appended in timestamp order")
+        last = self.get_last_timestamp(car_id)
+        if last is not None and values['timestamp'][0] < np.datetime64(last, 'us'):
+            raise ValueError(f"Fixes before {last} are already archived for car {car_id}")
+
+        count = self.count(car_id)
+        os.makedirs(os.path.dirname(self._path(car_id, 'timestamp')), exist_ok=True)
+        for column, dtype in self.COLUMNS:
+            path = self._path(car_id, column)
+            with open(path, 'ab') as f:
+                # Drop a partial tail left by an interrupted append
+                f.truncate(count * dtype.itemsize)
+                f.write(values[column].astype(dtype, copy=False).tobytes())
+        return len(values['timestamp'])
+
+    def read(self, car_id, start=None, end=None):
+        """Get a car's archived fixes in [start, end) as zero-copy views"""
+        count = self.count(car_id)
+        columns = {column: self._map(car_id, column, dtype, count)
+                   for column, dtype in self.COLUMNS}
+        timestamps = columns['timestamp']
+        first = 0 if start is None else int(np.searchsorted(timestamps, np.datetime64(start, 'us')))
+        last = count if end is None else int(np.searchsorted(timestamps, np.datetime64(end, 'us')))
+        return ArchivedTrack(**{column: values[first:last] for column, values in columns.items()})
+
+    def _map(self, car_id, column, dtype, count):
+        """Memory-map the first `count` values of a column read-only"""
+        if not count:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._path(car_id, column), dtype=dtype, mode='r', shape=(count,))
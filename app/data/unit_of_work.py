@@ -0,0 +1,64 @@
+from app.models import db
+
+class UnitOfWork:
+    """Groups repository writes of one service operation into a single transaction
+
+    Repositories call `UnitOfWork.commit()` instead of committing directly.
+    Outside a unit of work that commits as before; inside
+    `with UnitOfWork():` it only flushes (so generated ids are available)
+    and the outermost unit commits once on exit, or rolls back if the block
+    raises. State lives on the scoped session, so units are per request.
+    """
+    
+    _DEPTH_KEY = 'unit_of_work_depth'
+    
+    def __enter__(self):
+        info = db.session.info
+        info[self._DEPTH_KEY] = info.get(self._DEPTH_KEY, 0) + 1
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        info = db.session.info
+        info[self._DEPTH_KEY] -= 1
+        if info[self._DEPTH_KEY] > 0:
+            return False
+        
+        del info[self._DEPTH_KEY]
+        if exc_type is not None:
+            db.session.rollback()
+            return False
+        
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return False
+    
+    @classmethod
+    def active(cls):
+        """Check whether a unit of work is open on the current session"""
+        return db.session.info.get(cls._DEPTH_KEY, 0) > 0
+    
+    @classmethod
+    def commit(cls):
+        """Commit now, or only flush when inside a unit of work"""
+        if cls.active():
+            db.session.flush()
+        else:
+            db.session.commit()
+    
+    @staticmethod
+    def lock(query, skip_locked=False):
+        """Make a query lock the rows it returns until the transaction ends
+
+        Emits SELECT ... FOR UPDATE (optionally SKIP LOCKED). SQLite has no
+        row locks, so there the transaction is opened with BEGIN IMMEDIATE
+        instead, taking the database write lock before anything is read.
+        """
+        if db.session.get_bind().dialect.name == 'sqlite':
+            connection = db.session.connection()
+            if not connection.connection.dbapi_connection.in_transaction:
+                connection.exec_driver_sql('BEGIN IMMEDIATE')
+            return query.populate_existing()
+        return query.with_for_update(skip_locked=skip_locked).populate_existing()
@@ -0,0 +1,34 @@
+import numpy as np
+
+class GeofenceEvaluator:
+    """Vectorized haversine geofence over many cars or fixes at once
+
+    Same formula as `Car.calculate_distance_from_rental`, evaluated with
+    NumPy over whole arrays instead of one car at a time. Entries with a
+    missing (NaN) current or rental coordinate get distance 0 and are never
+    out of range, matching the scalar domain behaviour.
+    """
+
+    EARTH_RADIUS_KM = 6371
+
+    def __init__(self, max_distance):
+        self.max_distance = max_distance
+
+    @classmethod
+    def distances(cls, current_lat, current_lng, rental_lat, rental_lng):
+        """Get distances in km between current and rental coordinates"""
+        lat1 = np.radians(np.asarray(rental_lat, dtype=np.float64))
+        lon1 = np.radians(np.asarray(rental_lng, dtype=np.float64))
+        lat2 = np.radians(np.asarray(current_lat, dtype=np.float64))
+        lon2 = np.radians(np.asarray(current_lng, dtype=np.float64))
+
+        a = np.sin((lat2 - lat1) / 2) ** 2 + \
+            np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+        return np.nan_to_num(cls.EARTH_RADIUS_KM * c, nan=0.0)
+
+    def evaluate(self, current_lat, current_lng, rental_lat, rental_lng):
+        """Get (distances, out_of_range mask) for parallel coordinate arrays"""
+        distances = self.distances(current_lat, current_lng, rental_lat, rental_lng)
+        return distances, distances > self.max_distance
@@ -0,0 +1,34 @@
+from app.domain.geofence import GeofenceEvaluator
+
+class IngestPolicy:
+    """Decides which GPS fixes are worth a location history row
+
+    A fix is stored when it arrives at least the car's tracker update
+    interval after the last stored fix and has moved at least
+    `min_move_m` from it. Faster or near-stationary fixes from chatty or
+    retrying devices only refresh the car's last known position. Fixes that
+    change the car's range status are always stored by the caller.
+    """
+
+    # Trackers jitter around their interval; accept fixes slightly early
+    INTERVAL_SLACK = 0.9
+
+    DEFAULT_INTERVAL = 300  # seconds, BasicGPS
+
+    def __init__(self, min_move_m):
+        self.min_move_m = min_move_m
+
+    def should_store(self, fix, last_stored, interval):
+        """Check a fix against the last stored (latitude, longitude, timestamp)"""
+        if last_stored is None:
+            return True
+        last_lat, last_lng, last_time = last_stored
+        elapsed = (fix['timestamp'] - last_time).total_seconds()
+        if elapsed < (interval or self.DEFAULT_INTERVAL) * self.INTERVAL_SLACK:
+            return False
+        return self.distance_m(last_lat, last_lng, fix['latitude'], fix['longitude']) >= self.min_move_m
+
+    @staticmethod
+    def distance_m(lat1, lng1, lat2, lng2):
+        """Haversine distance in metres between two points (see GeofenceEvaluator)"""
+        return float(GeofenceEvaluator.distances(lat2, lng2, lat1, lng1)) * 1000
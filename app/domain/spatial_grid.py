@@ -0,0 +1,60 @@
+from math import cos, floor, radians
+
+class SpatialGrid:
+    """Fixed lat/lng grid used as a spatial index for car positions
+
+    Every position maps to one integer cell id (row-major, rows by latitude),
+    stored on `cars.location_cell`. A radius query becomes one contiguous id
+    range per latitude row, which an ordinary B-tree index answers without
+    scanning the fleet; exact distances are then computed on the candidates.
+    """
+
+    CELL_SIZE_DEG = 0.1  # ~11 km of latitude
+    KM_PER_DEG_LAT = 111.32
+    ROWS = int(180 / CELL_SIZE_DEG)
+    COLUMNS = int(360 / CELL_SIZE_DEG)
+
+    @classmethod
+    def _row(cls, latitude):
+        return min(int(floor((latitude + 90) / cls.CELL_SIZE_DEG)), cls.ROWS - 1)
+
+    @classmethod
+    def _column(cls, longitude):
+        return int(floor((longitude + 180) / cls.CELL_SIZE_DEG)) % cls.COLUMNS
+
+    @classmethod
+    def cell_for(cls, latitude, longitude):
+        """Get the cell id containing a position (None if unknown)"""
+        if latitude is None or longitude is None:
+            return None
+        return cls._row(latitude) * cls.COLUMNS + cls._column(longitude)
+
+    @classmethod
+    def cell_ranges(cls, latitude, longitude, radius_km):
+        """Get inclusive (low, high) cell id ranges covering a circle"""
+        dlat = radius_km / cls.KM_PER_DEG_LAT
+        lat_low = max(-90.0, latitude - dlat)
+        lat_high = min(90.0, latitude + dlat)
+
+        # Longitude degrees shrink towards the poles; size the band for the
+        # highest latitude it touches so the circle is always covered
+        widest = cos(radians(max(abs(lat_low), abs(lat_high))))
+        dlng = radius_km / (cls.KM_PER_DEG_LAT * widest) if widest > 1e-6 else 360.0
+
+        if dlng >= 180:
+            column_spans = [(0, cls.COLUMNS - 1)]
+        else:
+            low = int(floor((longitude - dlng + 180) / cls.CELL_SIZE_DEG))
+            high = int(floor((longitude + dlng + 180) / cls.CELL_SIZE_DEG))
+            if low < 0:
+                column_spans = [(low + cls.COLUMNS, cls.COLUMNS - 1), (0, high)]
+            elif high >= cls.COLUMNS:
+                column_spans = [(low, cls.COLUMNS - 1), (0, high - cls.COLUMNS)]
+            else:
+                column_spans = [(low, high)]
+
+        ranges = []
+        for row in range(cls._row(lat_low), cls._row(lat_high) + 1):
+            base = row * cls.COLUMNS
+            ranges.extend((base + low, base + high) for low, high in column_spans)
+        return ranges
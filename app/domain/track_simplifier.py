@@ -0,0 +1,86 @@
+import numpy as np
+
+class TrackSimplifier:
+    """Picks the location history points worth keeping for an old track
+
+    Works on one car's points ordered by time and returns a boolean mask of
+    the points to keep. The first and last point are always kept, as are
+    out-of-range points and the in-range points on either side of a range
+    change, so alerts can still be traced on the compacted track.
+
+    - 'douglas_peucker': keep the points needed to stay within
+      `tolerance_m` metres of the original path
+    - 'bucket': keep the first point of every `bucket_seconds` window
+    """
+
+    EARTH_RADIUS_M = 6371000
+
+    METHODS = ('douglas_peucker', 'bucket')
+
+    def __init__(self, method='douglas_peucker', tolerance_m=25, bucket_seconds=300):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown simplification method: {method}")
+        if tolerance_m < 0 or bucket_seconds <= 0:
+            raise ValueError("Tolerance must be non-negative and buckets positive")
+        self.method = method
+        self.tolerance_m = tolerance_m
+        self.bucket_seconds = bucket_seconds
+
+    def keep_mask(self, latitudes, longitudes, timestamps, out_of_range):
+        """Get a boolean mask of the points to keep"""
+        out_of_range = np.asarray(out_of_range, dtype=bool)
+        count = len(out_of_range)
+        if count <= 2:
+            return np.ones(count, dtype=bool)
+
+        if self.method == 'bucket':
+            keep = self._bucket(timestamps)
+        else:
+            keep = self._douglas_peucker(*self._project(latitudes, longitudes))
+
+        keep[0] = keep[-1] = True
+        keep |= out_of_range
+        # Keep both sides of every range change
+        changes = np.flatnonzero(out_of_range[1:] != out_of_range[:-1])
+        keep[changes] = True
+        keep[changes + 1] = True
+        return keep
+
+    def _project(self, latitudes, longitudes):
+        """Project to local x/y metres (equirectangular, fine at track scale)"""
+        lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+        lng = np.radians(np.asarray(longitudes, dtype=np.float64))
+        x = lng * np.cos(lat.mean()) * self.EARTH_RADIUS_M
+        y = lat * self.EARTH_RADIUS_M
+        return x, y
+
+    def _douglas_peucker(self, x, y):
+        """Iterative Douglas-Peucker, vectorized over each segment's points"""
+        keep = np.zeros(len(x), dtype=bool)
+        stack = [(0, len(x) - 1)]
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+            dx, dy = x[end] - x[start], y[end] - y[start]
+            px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+            length = np.hypot(dx, dy)
+            if length == 0:
+                distances = np.hypot(px, py)
+            else:
+                distances = np.abs(dx * py - dy * px) / length
+            farthest = int(np.argmax(distances))
+            if distances[farthest] > self.tolerance_m:
+                index = start + 1 + farthest
+                keep[index] = True
+                stack.append((start, index))
+                stack.append((index, end))
+        return keep
+
+    def _bucket(self, timestamps):
+        """Keep the first point of each fixed time bucket"""
+        seconds = np.array([t.timestamp() for t in timestamps], dtype=np.float64)
+        buckets = np.floor(seconds / self.bucket_seconds)
+        keep = np.ones(len(buckets), dtype=bool)
+        keep[1:] = buckets[1:] != buckets[:-1]
+        return keep
@@ -1,113 +1,174 @@
-from flask_sqlalchemy import SQLAlchemy
-from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
-
-db = SQLAlchemy()
-
-class Car(db.Model):
-    """Car model representing vehicles in the fleet"""
-    __tablename__ = 'cars'
-    
-    id = db.Column(db.Integer, primary_key=True)
-    license_plate = db.Column(db.String(20), unique=True, nullable=False)
-    model = db.Column(db.String(100), nullable=False)
-    category = db.Column(db.String(20), nullable=False)  # economy, luxury, suv
-    status = db.Column(db.String(20), default='available')  # available, booked, in_service, maintenance, out_of_range
-    price_tier = db.Column(db.Float, nullable=False)
-    
-    # GPS Tracker Information (from Abstract Factory)
-    tracker_type = db.Column(db.String(50), default='BasicGPS')
-    tracker_update_interval = db.Column(db.Integer, default=300)  # seconds
-    
-    # Location tracking
-    current_location_lat = db.Column(db.Float)
-    current_location_lng = db.Column(db.Float)
-    rental_location_lat = db.Column(db.Float)
-    rental_location_lng = db.Column(db.Float)
-    
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    # Relationships
-    bookings = db.relationship('Booking', backref='car', lazy=True)
-    claims = db.relationship('Claim', backref='car', lazy=True)
-    location_history = db.relationship('LocationHistory', backref='car', lazy=True)
-    
-    def __repr__(self):
-        return f'<Car {self.license_plate} - {self.model}>'
-
-
-class Booking(db.Model):
-    """Booking model for car reservations"""
-    __tablename__ = 'bookings'
-    
-    id = db.Column(db.Integer, primary_key=True)
-    car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), nullable=False)
-    customer_name = db.Column(db.String(100), nullable=False)
-    customer_phone = db.Column(db.String(20), nullable=False)
-    customer_cnic = db.Column(db.String(15), nullable=False)
-    start_date = db.Column(db.DateTime, nullable=False)
-    end_date = db.Column(db.DateTime, nullable=False)
-    total_amount = db.Column(db.Float, nullable=False)
-    status = db.Column(db.String(20), default='active')  # active, completed, cancelled
-    access_code = db.Column(db.String(50), unique=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    def __repr__(self):
-        return f'<Booking {self.id} - {self.customer_name}>'
-
-
-class Claim(db.Model):
-    """Damage claim model"""
-    __tablename__ = 'claims'
-    
-    id = db.Column(db.Integer, primary_key=True)
-    car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), nullable=False)
-    booking_id = db.Column(db.Integer, db.ForeignKey('bookings.id'))
-    damage_type = db.Column(db.String(50), nullable=False)  # minor, major, insurance_required
-    description = db.Column(db.Text, nullable=False)
-    estimated_cost = db.Column(db.Float)
-    status = db.Column(db.String(20), default='pending')  # pending, approved, rejected, processed
-    handler = db.Column(db.String(50))  # Which handler processed it
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    processed_at = db.Column(db.DateTime)
-    
-    def __repr__(self):
-        return f'<Claim {self.id} - {self.damage_type}>'
-
-
-class LocationHistory(db.Model):
-    """Location tracking history"""
-    __tablename__ = 'location_history'
-    
-    id = db.Column(db.Integer, primary_key=True)
-    car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), nullable=False)
-    latitude = db.Column(db.Float, nullable=False)
-    longitude = db.Column(db.Float, nullable=False)
-    is_out_of_range = db.Column(db.Boolean, default=False)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    def __repr__(self):
-        return f'<Location {self.car_id} at {self.timestamp}>'
-
-
-class Admin(UserMixin, db.Model):
-    """Admin user model with Flask-Login integration"""
-    __tablename__ = 'admins'
-    
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(50), unique=True, nullable=False)
-    password_hash = db.Column(db.String(200), nullable=False)
-    email = db.Column(db.String(100), unique=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    def set_password(self, password):
-        """Hash and set password"""
-        self.password_hash = generate_password_hash(password)
-    
-    def check_password(self, password):
-        """Verify password"""
-        return check_password_hash(self.password_hash, password)
-    
-    def __repr__(self):
-        return f'<Admin {self.username}>'
+from flask_sqlalchemy import SQLAlchemy
+from flask_login import UserMixin
+from werkzeug.security import generate_password_hash, check_password_hash
+from datetime import datetime
+
+db = SQLAlchemy()
+
+class Car(db.Model):
+    """Car model representing vehicles in the fleet"""
+    __tablename__ = 'cars'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    license_plate = db.Column(db.String(20), unique=True, nullable=False)
+    model = db.Column(db.String(100), nullable=False)
+    category = db.Column(db.String(20), nullable=False, index=True)  # economy, luxury, suv
+    status = db.Column(db.String(20), default='available', index=True)  # available, booked, in_service, maintenance, out_of_range
+    price_tier = db.Column(db.Float, nullable=False)
+    
+    # GPS Tracker Information (from Abstract Factory)
+    tracker_type = db.Column(db.String(50), default='BasicGPS')
+    tracker_update_interval = db.Column(db.Integer, default=300)  # seconds
+    
+    # Location tracking
+    current_location_lat = db.Column(db.Float)
+    current_location_lng = db.Column(db.Float)
+    rental_location_lat = db.Column(db.Float)
+    rental_location_lng = db.Column(db.Float)
+    location_cell = db.Column(db.Integer, index=True)  # SpatialGrid cell of current location
+    location_updated_at = db.Column(db.DateTime)  # time of the fix stored above
+    
+    # Geofence hysteresis and alert coalescing (see TrackingService)
+    range_pending_since = db.Column(db.DateTime)  # first fix of a possible zone crossing
+    range_alert_at = db.Column(db.DateTime)  # last out-of-range alert sent
+    range_alert_open = db.Column(db.Boolean, default=False)  # alert sent, return not yet
+    
+    # Set by HeartbeatMonitor when the tracker misses its expected fixes
+    tracker_offline_since = db.Column(db.DateTime, index=True)
+    
+    # Maintenance profile (from the Abstract Factory) and telemetry odometer
+    interval_km = db.Column(db.Integer)  # distance between services
+    odometer_km = db.Column(db.Float, default=0.0)  # accumulated from GPS fixes
+    service_due_km = db.Column(db.Float)  # odometer reading of the next service
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    bookings = db.relationship('Booking', backref='car', lazy=True)
+    claims = db.relationship('Claim', backref='car', lazy=True)
+    location_history = db.relationship('LocationHistory', backref='car', lazy=True)
+    
+    def __repr__(self):
+        return f'<Car {self.license_plate} - {self.model}>'
+
+
+class Booking(db.Model):
+    """Booking model for car reservations"""
+    __tablename__ = 'bookings'
+    __table_args__ = (
+        # Covers the availability overlap query (car_id = ? AND start < ? AND end > ?)
+        db.Index('ix_bookings_car_period_status', 'car_id', 'start_date', 'end_date', 'status'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), nullable=False)
+    customer_name = db.Column(db.String(100), nullable=False)
+    customer_phone = db.Column(db.String(20), nullable=False, index=True)
+    customer_cnic = db.Column(db.String(15), nullable=False)
+    start_date = db.Column(db.DateTime, nullable=False)
+    end_date = db.Column(db.DateTime, nullable=False)
+    total_amount = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(20), default='active', index=True)  # active, completed, cancelled
+    access_code = db.Column(db.String(50), unique=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<Booking {self.id} - {self.customer_name}>'
+
+
+class Claim(db.Model):
+    """Damage claim model"""
+    __tablename__ = 'claims'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), nullable=False, index=True)
+    booking_id = db.Column(db.Integer, db.ForeignKey('bookings.id'))
+    damage_type = db.Column(db.String(50), nullable=False)  # minor, major, insurance_required
+    description = db.Column(db.Text, nullable=False)
+    estimated_cost = db.Column(db.Float)
+    status = db.Column(db.String(20), default='pending', index=True)  # pending, approved, rejected, processed
+    handler = db.Column(db.String(50))  # Which handler processed it
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    processed_at = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<Claim {self.id} - {self.damage_type}>'
+
+
+class LocationHistory(db.Model):
+    """Location tracking history"""
+    __tablename__ = 'location_history'
+    __table_args__ = (
+        # Latest-N history per car is a backward range scan, no sort
+        db.Index('ix_location_history_car_timestamp', 'car_id', 'timestamp'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), nullable=False)
+    latitude = db.Column(db.Float, nullable=False)
+    longitude = db.Column(db.Float, nullable=False)
+    is_out_of_range = db.Column(db.Boolean, default=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<Location {self.car_id} at {self.timestamp}>'
+
+
+class HistoryCompaction(db.Model):
+    """How far each car's location history has been compacted"""
+    __tablename__ = 'location_history_compaction'
+    
+    car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), primary_key=True)
+    compacted_until = db.Column(db.DateTime, nullable=False)  # rows before this are simplified
+    
+    def __repr__(self):
+        return f'<HistoryCompaction {self.car_id} until {self.compacted_until}>'
+
+
+class Notification(db.Model):
+    """Admin notification raised by the Observer pattern (optional persistence)"""
+    __tablename__ = 'notifications'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    type = db.Column(db.String(50), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    data = db.Column(db.Text)  # JSON payload of the event
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    
+    def __repr__(self):
+        return f'<Notification {self.id} {self.type}>'
+
+
+class OutboxEvent(db.Model):
+    """Observer event published for every worker through the event bus"""
+    __tablename__ = 'event_outbox'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    event_type = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.Text, nullable=False)  # JSON event data
+    created_at = db.Column(db.DateTime, default=datetime.now, index=True)
+    
+    def __repr__(self):
+        return f'<OutboxEvent {self.id} {self.event_type}>'
+
+
+class Admin(UserMixin, db.Model):
+    """Admin user model with Flask-Login integration"""
+    __tablename__ = 'admins'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(50), unique=True, nullable=False)
+    password_hash = db.Column(db.String(200), nullable=False)
+    email = db.Column(db.String(100), unique=True, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def set_password(self, password):
+        """Hash and set password"""
+        self.password_hash = generate_password_hash(password)
+    
+    def check_password(self, password):
+        """Verify password"""
+        return check_password_hash(self.password_hash, password)
+    
+    def __repr__(self):
+        return f'<Admin {self.username}>'
@@ -1,67 +1,133 @@
-from flask import session
-
-class AdminNotifier:
-    """Observer that sends notifications to admin dashboard and UI"""
-    
-    def __init__(self):
-        self.notifications = []
-    
-    def update(self, event_type, data):
-        """Receive notification and store it, also trigger UI notification"""
-        notification = {
-            'type': event_type,
-            'message': self._format_message(event_type, data),
-            'data': data
-        }
-        self.notifications.append(notification)
-        print(f"[ADMIN NOTIFICATION] {notification['message']}")
-        
-        # Store in session for UI toast notification (Observer Pattern)
-        self._store_notification_for_ui(event_type, notification['message'])
-    
-    def _format_message(self, event_type, data):
-        """Format notification message based on event type"""
-        if event_type == 'car_out_of_range':
-            model = data.get('model', 'Unknown Model')
-            plate = data.get('license_plate', 'Unknown')
-            distance = data.get('distance', 0)
-            max_allowed = data.get('max_allowed', 0)
-            tracker = data.get('tracker_type', 'GPS')
-            current_loc = data.get('current_location', (0, 0))
-            
-            return (f"🚨 VEHICLE OUT OF RANGE! {model} ({plate}) has moved {distance:.2f} km "
-                   f"from rental location (Max: {max_allowed} km). "
-                   f"Tracked via {tracker} at {current_loc[0]:.4f}, {current_loc[1]:.4f}")
-        
-        elif event_type == 'car_returned_to_range':
-            model = data.get('model', 'Unknown Model')
-            plate = data.get('license_plate', 'Unknown')
-            return f"✅ {model} ({plate}) has returned to the allowed zone"
-        
-        messages = {
-            'car_booked': f"Car {data.get('license_plate')} has been booked",
-            'booking_completed': f"Booking {data.get('booking_id')} completed",
-            'damage_claim_filed': f"New damage claim filed for car {data.get('license_plate')}",
-            'car_returned': f"Car {data.get('license_plate')} has been returned",
-            'maintenance_required': f"Car {data.get('license_plate')} requires maintenance"
-        }
-        return messages.get(event_type, f"Event: {event_type}")
-    
-    def _store_notification_for_ui(self, event_type, message):
-        """Store notification in session for UI toast display"""
-        try:
-            session['pending_notification'] = {
-                'type': event_type,
-                'message': message
-            }
-        except RuntimeError:
-            # Session not available (e.g., outside request context)
-            pass
-    
-    def get_recent_notifications(self, limit=10):
-        """Get recent notifications"""
-        return self.notifications[-limit:]
-    
-    def clear_notifications(self):
-        """Clear all notifications"""
-        self.notifications = []
+from app.data.notification_repository import NotificationRepository
+from app.data.unit_of_work import UnitOfWork
+from app.patterns.observer.event_bus import EventBus
+from app.utils.ring_buffer import RingBuffer
+from config import Config
+from datetime import datetime
+
+class AdminNotifier:
+    """Observer that sends notifications to admin dashboard and UI
+    
+    Notifications get monotonically increasing ids so the UI can poll for
+    everything after the last id it has shown. By default they reach a
+    bounded ring buffer shared by every notifier of the worker through the
+    event bus, so each worker's buffer holds the same events under the same
+    ids. With `Config.NOTIFICATIONS_PERSIST` they are written to the
+    notifications table instead and read back from it.
+    """
+    
+    _buffer = RingBuffer(Config.NOTIFICATION_CAPACITY)
+    
+    # Bus events that feed live views rather than notifications
+    IGNORED_EVENTS = frozenset({'car_positions_updated'})
+    
+    # Persisted notifications are pruned to the capacity every this many inserts
+    PRUNE_EVERY = 50
+    
+    def __init__(self, persist=None):
+        self.persist = Config.NOTIFICATIONS_PERSIST if persist is None else persist
+        # Database writes need the caller's app context, so async Subjects
+        # call a persisting notifier inline
+        self.synchronous = self.persist
+        # In-memory notifiers are fed by the event bus (see Subject.notify)
+        self.broadcast = not self.persist
+        if self.broadcast:
+            EventBus.shared().subscribe(AdminNotifier._receive)
+    
+    @classmethod
+    def _receive(cls, event_id, event_type, data):
+        """Event bus subscriber: store an event from any worker under its bus id"""
+        if event_type in cls.IGNORED_EVENTS:
+            return
+        message = cls._format_message(event_type, data)
+        cls._buffer.append({
+            'type': event_type,
+            'message': message,
+            'data': data,
+            'created_at': datetime.now().isoformat()
+        }, item_id=event_id)
+        print(f"[ADMIN NOTIFICATION #{event_id}] {message}")
+    
+    def update(self, event_type, data):
+        """Receive notification and store it for the admin UI"""
+        message = self._format_message(event_type, data)
+        try:
+            notification = self._store(event_type, message, data)
+        except Exception as e:
+            print(f"Error storing notification: {e}")
+            return
+        print(f"[ADMIN NOTIFICATION #{notification['id']}] {message}")
+    
+    def _store(self, event_type, message, data):
+        """Append to the table or the ring buffer, returning the stored dict"""
+        if not self.persist:
+            return self._buffer.append({
+                'type': event_type,
+                'message': message,
+                'data': data,
+                'created_at': datetime.now().isoformat()
+            })
+        
+        with UnitOfWork():
+            stored = NotificationRepository.create(event_type, message, data)
+            if stored.id % self.PRUNE_EVERY == 0:
+                NotificationRepository.prune(self._buffer.capacity)
+        return NotificationRepository.to_dict(stored)
+    
+    @staticmethod
+    def _format_message(event_type, data):
+        """Format notification message based on event type"""
+        if event_type == 'car_out_of_range':
+            model = data.get('model', 'Unknown Model')
+            plate = data.get('license_plate', 'Unknown')
+            distance = data.get('distance', 0)
+            max_allowed = data.get('max_allowed', 0)
+            tracker = data.get('tracker_type', 'GPS')
+            current_loc = data.get('current_location', (0, 0))
+            
+            return (f"🚨 VEHICLE OUT OF RANGE! {model} ({plate}) has moved {distance:.2f} km "
+                   f"from rental location (Max: {max_allowed} km). "
+                   f"Tracked via {tracker} at {current_loc[0]:.4f}, {current_loc[1]:.4f}")
+        
+        elif event_type == 'car_returned_to_range':
+            model = data.get('model', 'Unknown Model')
+            plate = data.get('license_plate', 'Unknown')
+            return f"✅ {model} ({plate}) has returned to the allowed zone"
+        
+        messages = {
+            'car_booked': f"Car {data.get('license_plate')} has been booked",
+            'booking_completed': f"Booking {data.get('booking_id')} completed",
+            'damage_claim_filed': f"New damage claim filed for car {data.get('license_plate')}",
+            'car_returned': f"Car {data.get('license_plate')} has been returned",
+            'maintenance_required': f"Car {data.get('license_plate')} requires maintenance",
+            'car_status_changed': f"Car {data.get('license_plate')} changed from "
+                                  f"{data.get('old_status')} to {data.get('new_status')}",
+            'fleet_status_changed': f"{data.get('count')} cars moved to {data.get('new_status')}",
+            'tracker_offline': f"📡 Tracker of {data.get('model')} ({data.get('license_plate')}) "
+                               f"has not reported since {data.get('last_seen')}"
+        }
+        return messages.get(event_type, f"Event: {event_type}")
+    
+    def get_notifications_since(self, after_id=0, limit=100):
+        """Get notifications newer than `after_id`, oldest first"""
+        if self.persist:
+            return [NotificationRepository.to_dict(n)
+                    for n in NotificationRepository.get_since(after_id, limit)]
+        return self._buffer.since(after_id, limit)
+    
+    def get_last_id(self):
+        """Get the id of the newest notification, the cursor for later polls"""
+        if self.persist:
+            return NotificationRepository.get_last_id()
+        return self._buffer.last_id
+    
+    def get_recent_notifications(self, limit=10):
+        """Get recent notifications"""
+        if self.persist:
+            return [NotificationRepository.to_dict(n)
+                    for n in NotificationRepository.get_latest(limit)]
+        return self._buffer.latest(limit)
+    
+    def clear_notifications(self):
+        """Clear all notifications"""
+        self._buffer.clear()
@@ -1,38 +1,189 @@
-from datetime import datetime
-import os
-
-class AlertLogger:
-    """Observer that logs all system alerts to a file"""
-    
-    def __init__(self, log_file='logs/alerts.log'):
-        self.log_file = log_file
-        self._ensure_log_directory()
-    
-    def _ensure_log_directory(self):
-        """Create logs directory if it doesn't exist"""
-        log_dir = os.path.dirname(self.log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-    
-    def update(self, event_type, data):
-        """Log the event to file"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"[{timestamp}] {event_type.upper()}: {data}\n"
-        
-        try:
-            with open(self.log_file, 'a') as f:
-                f.write(log_entry)
-            print(f"[ALERT LOGGED] {event_type}")
-        except Exception as e:
-            print(f"Error logging alert: {e}")
-    
-    def get_logs(self, lines=50):
-        """Get recent log entries"""
-        try:
-            if os.path.exists(self.log_file):
-                with open(self.log_file, 'r') as f:
-                    all_lines = f.readlines()
-                    return all_lines[-lines:]
-        except Exception as e:
-            print(f"Error reading logs: {e}")
-        return []
+from config import Config
+from datetime import datetime
+import atexit
+import json
+import os
+import threading
+import weakref
+
+class AlertLogger:
+    """Observer that logs all system alerts to a file
+
+    Alerts are written as JSON lines through a persistent append-only file
+    descriptor. Lines are buffered and written in one call once `flush_every`
+    alerts are pending or `flush_interval` seconds have passed, and the file
+    is rotated to `alerts.log.1`, `.2`, ... once it reaches `max_bytes`.
+    """
+
+    READ_BLOCK_SIZE = 8192
+
+    # Alerts kept for a retry while writes fail; older ones are dropped beyond this
+    MAX_PENDING = 10000
+
+    # Open loggers, closed by one exit hook without keeping them alive
+    _instances = weakref.WeakSet()
+    _instances_lock = threading.Lock()
+    _exit_hook = False
+
+    def __init__(self, log_file='logs/alerts.log', max_bytes=None, backup_count=None,
+                 flush_every=20, flush_interval=1.0):
+        self.log_file = log_file
+        self.max_bytes = max_bytes or Config.ALERT_LOG_MAX_BYTES
+        self.backup_count = Config.ALERT_LOG_BACKUP_COUNT if backup_count is None else backup_count
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._fd = None
+        self._timer = None
+        self._lock = threading.RLock()
+        self._ensure_log_directory()
+        self._track()
+
+    def _ensure_log_directory(self):
+        """Create logs directory if it doesn't exist"""
+        log_dir = os.path.dirname(self.log_file)
+        if log_dir and not os.path.exists(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+
+    def update(self, event_type, data):
+        """Log the event to file"""
+        entry = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'event': event_type,
+            'data': data
+        }
+        line = json.dumps(entry, default=str, ensure_ascii=False) + '\n'
+
+        with self._lock:
+            self._buffer.append(line.encode('utf-8'))
+            if len(self._buffer) >= self.flush_every:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        print(f"[ALERT LOGGED] {event_type}")
+
+    def flush(self):
+        """Write buffered alerts to disk, rotating the file when it is full"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer:
+                return
+
+            payload = b''.join(self._buffer)
+            try:
+                fd = self._open()
+                if os.fstat(fd).st_size + len(payload) > self.max_bytes:
+                    self._rotate()
+                    fd = self._open()
+                # A single write on an O_APPEND descriptor keeps whole lines
+                # together even when several workers share the file
+                os.write(fd, payload)
+            except OSError as e:
+                # Keep the alerts for the next flush
+                print(f"Error logging alert: {e}")
+                del self._buffer[:-self.MAX_PENDING]
+                return
+            self._buffer = []
+
+    def _track(self):
+        """Have the shared exit hook close this logger (registered once per process)"""
+        with AlertLogger._instances_lock:
+            AlertLogger._instances.add(self)
+            if not AlertLogger._exit_hook:
+                AlertLogger._exit_hook = True
+                atexit.register(AlertLogger._close_all)
+
+    @classmethod
+    def _close_all(cls):
+        """Exit hook: close every logger still open"""
+        with cls._instances_lock:
+            loggers = list(cls._instances)
+        for logger in loggers:
+            logger.close()
+
+    def close(self):
+        """Flush pending alerts and release the file descriptor"""
+        with AlertLogger._instances_lock:
+            AlertLogger._instances.discard(self)
+        with self._lock:
+            self.flush()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _open(self):
+        """Get the append descriptor, reopening it if another process rotated the file"""
+        if self._fd is not None:
+            try:
+                if os.stat(self.log_file).st_ino == os.fstat(self._fd).st_ino:
+                    return self._fd
+            except FileNotFoundError:
+                pass
+            os.close(self._fd)
+        self._fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _rotate(self):
+        """Shift alerts.log -> alerts.log.1 -> ... dropping the oldest backup"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self.backup_count <= 0:
+            self._move(self.log_file, None)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            self._move(f'{self.log_file}.{i}', f'{self.log_file}.{i + 1}')
+        self._move(self.log_file, f'{self.log_file}.1')
+
+    @staticmethod
+    def _move(source, target):
+        """Rename (or delete, without a target) a log file that may already be gone
+
+        Another worker rotating at the same time may have moved it first.
+        """
+        try:
+            if target is None:
+                os.remove(source)
+            else:
+                os.replace(source, target)
+        except FileNotFoundError:
+            pass
+
+    def get_logs(self, lines=50):
+        """Get recent log entries
+
+        Reads backwards from the end of the file (and its backups when it
+        holds fewer than `lines` alerts), so the cost depends on `lines`
+        rather than on the size of the log.
+        """
+        self.flush()
+        collected = []
+        paths = [self.log_file] + [f'{self.log_file}.{i}' for i in range(1, self.backup_count + 1)]
+        try:
+            for path in paths:
+                if len(collected) >= lines or not os.path.exists(path):
+                    break
+                collected = self._tail(path, lines - len(collected)) + collected
+        except OSError as e:
+            print(f"Error reading logs: {e}")
+        return collected
+
+    def _tail(self, path, count):
+        """Read the last `count` lines of a file by seeking back block by block"""
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b''
+            # One extra newline is needed to know the earliest line is complete
+            while position > 0 and data.count(b'\n') <= count:
+                step = min(self.READ_BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+
+        tail = data.splitlines(keepends=True)[-count:] if count > 0 else []
+        return [line.decode('utf-8', errors='replace') for line in tail]
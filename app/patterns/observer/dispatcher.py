@@ -0,0 +1,123 @@
+from config import Config
+import atexit
+import queue
+import threading
+
+class AsyncDispatcher:
+    """Bounded queue plus worker threads that deliver events to observers
+
+    Each queued item is one (observer, event_type, data) delivery, so a slow
+    or failing observer never delays or breaks the others. When the queue is
+    full the caller waits up to `put_timeout` seconds and then delivers the
+    event itself (backpressure instead of dropping alerts); those fallbacks
+    are counted in `metrics()`. Pending events are flushed at interpreter exit.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, workers=None, max_queue=None, put_timeout=0.05):
+        self.workers = workers or Config.OBSERVER_ASYNC_WORKERS
+        self.put_timeout = put_timeout
+        self._queue = queue.Queue(maxsize=max_queue or Config.OBSERVER_QUEUE_SIZE)
+        self._threads = []
+        self._closed = False
+        self._lock = threading.Lock()
+        self._metrics = {
+            'enqueued': 0,
+            'delivered': 0,
+            'failed': 0,
+            'inline_fallbacks': 0,
+            'max_queue_depth': 0
+        }
+
+    @classmethod
+    def shared(cls):
+        """Get the worker-wide dispatcher used by async Subjects by default"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.shutdown)
+            return cls._shared
+
+    def submit(self, observer, event_type, data):
+        """Queue one delivery, running it inline if the queue stays full"""
+        if self._closed:
+            self._deliver(observer, event_type, data)
+            return
+        self._start()
+
+        try:
+            self._queue.put((observer, event_type, data), timeout=self.put_timeout)
+        except queue.Full:
+            self._count('inline_fallbacks')
+            self._deliver(observer, event_type, data)
+            return
+
+        with self._lock:
+            self._metrics['enqueued'] += 1
+            depth = self._queue.qsize()
+            if depth > self._metrics['max_queue_depth']:
+                self._metrics['max_queue_depth'] = depth
+
+    def flush(self, timeout=None):
+        """Wait until every queued delivery has run (True if drained in time)"""
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: self._queue.unfinished_tasks == 0, timeout)
+
+    def shutdown(self, timeout=5):
+        """Flush pending events and stop the worker threads"""
+        self._closed = True
+        drained = self.flush(timeout)
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        return drained
+
+    def metrics(self):
+        """Get delivery counters and the current queue depth"""
+        with self._lock:
+            stats = dict(self._metrics)
+        stats['queue_depth'] = self._queue.qsize()
+        stats['queue_capacity'] = self._queue.maxsize
+        stats['workers'] = len(self._threads)
+        return stats
+
+    def _start(self):
+        """Start the worker threads on first use"""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'observer-dispatch-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self):
+        """Worker loop: deliver queued events until a stop marker arrives"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._deliver(*item)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, observer, event_type, data):
+        """Call one observer, isolating its failures from everything else"""
+        try:
+            observer.update(event_type, data)
+            self._count('delivered')
+        except Exception as e:
+            self._count('failed')
+            print(f"Error delivering {event_type} to {type(observer).__name__}: {e}")
+
+    def _count(self, key):
+        with self._lock:
+            self._metrics[key] += 1
@@ -0,0 +1,261 @@
+from abc import ABC, abstractmethod
+from app.data.outbox_repository import OutboxRepository
+from app.data.unit_of_work import UnitOfWork
+from config import Config
+from sqlalchemy import text
+import atexit
+import itertools
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)  # propagates to the Flask app logger
+
+class EventBus(ABC):
+    """Delivers observer events to subscribers in every worker
+
+    `Subject` publishes events for broadcast observers (the admin
+    notification store) here instead of calling them directly. Subscribers
+    receive `(event_id, event_type, data)` with ids increasing in the same
+    order on every worker. The backend is picked by `Config.EVENT_BUS`:
+
+    - 'inprocess': deliver immediately, only within this process (tests, dev)
+    - 'outbox': append to the event_outbox table, each worker polls it
+    - 'postgres': outbox plus LISTEN/NOTIFY wake-ups instead of fixed polling
+      (needs the optional psycopg driver)
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._subscribers = []
+
+    @classmethod
+    def shared(cls):
+        """Get the worker's bus (in-process until `configure` is called)"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = InProcessEventBus()
+            return cls._shared
+
+    @classmethod
+    def configure(cls, app):
+        """Create the bus selected by the app config
+
+        Publishing works straight away. Consuming other workers' events
+        needs `start()`, which only the web process calls (run.py), so CLI
+        scripts do not run an outbox poller.
+        """
+        backends = {
+            'inprocess': InProcessEventBus,
+            'outbox': OutboxEventBus,
+            'postgres': PostgresNotifyEventBus
+        }
+        backend = backends.get(app.config.get('EVENT_BUS', 'inprocess'), InProcessEventBus)
+        bus = InProcessEventBus() if backend is InProcessEventBus else backend(app)
+
+        with cls._shared_lock:
+            previous, cls._shared = cls._shared, bus
+        if previous is not None:
+            # Subscribers registered before configuration move to the new bus
+            for callback in previous._subscribers:
+                bus.subscribe(callback)
+            previous.stop()
+        return bus
+
+    def subscribe(self, callback):
+        """Register a callback(event_id, event_type, data) for this worker"""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    @abstractmethod
+    def publish(self, event_type, data):
+        """Publish an event to the subscribers of every worker"""
+
+    def start(self):
+        """Start consuming events from other workers"""
+
+    def stop(self):
+        """Stop consuming events"""
+
+    def _deliver(self, event_id, event_type, data):
+        """Hand one event to every local subscriber, isolating failures"""
+        for callback in self._subscribers:
+            try:
+                callback(event_id, event_type, data)
+            except Exception:
+                logger.exception(f'Error delivering event {event_id} ({event_type})')
+
+
+class InProcessEventBus(EventBus):
+    """Bus that only reaches subscribers of the current process"""
+
+    def __init__(self):
+        super().__init__()
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def publish(self, event_type, data):
+        # Deliver under the lock so subscribers see ids in increasing order
+        with self._lock:
+            self._deliver(next(self._ids), event_type, data)
+
+
+class OutboxEventBus(EventBus):
+    """Bus backed by the event_outbox table, polled in batches by each worker
+
+    Publishing inserts a row. A background thread per worker reads rows
+    after the last id it delivered, so dashboards are fed from memory
+    rather than querying the database on every request. Ids that are
+    skipped (a transaction still in flight) are waited for up to
+    `GAP_TIMEOUT` seconds so late commits are not lost.
+    """
+
+    GAP_TIMEOUT = 2.0
+
+    def __init__(self, app, poll_interval=None, batch_size=None, retention=None):
+        super().__init__()
+        self.app = app
+        self.poll_interval = poll_interval or Config.EVENT_BUS_POLL_INTERVAL
+        self.batch_size = batch_size or Config.EVENT_BUS_BATCH_SIZE
+        self.retention = retention or Config.EVENT_OUTBOX_RETENTION
+        self._cursor = None
+        self._gap_since = None
+        self._last_prune = time.monotonic()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def publish(self, event_type, data):
+        """Append the event in its own transaction on a separate connection
+
+        The caller's session is neither committed nor rolled back. A failed
+        write is logged and the event dropped, as for in-process delivery.
+        """
+        from app.models import db
+        try:
+            with db.engine.begin() as connection:
+                event_id = OutboxRepository.add(connection, event_type, data)
+                self._after_insert(connection, event_id)
+        except Exception:
+            logger.exception(f'Could not publish {event_type} to the outbox')
+
+    def _after_insert(self, connection, event_id):
+        """Hook run in the publishing transaction"""
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='event-bus', daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        """Consume the outbox until stopped, starting from its current end"""
+        while not self._stopped.is_set():
+            try:
+                with self.app.app_context():
+                    if self._cursor is None:
+                        self._cursor = OutboxRepository.get_last_id()
+                    full_batch = self._poll_once()
+                    self._prune()
+            except Exception:
+                logger.exception('Event bus poll failed')
+                full_batch = False
+            if not full_batch:
+                self._wait()
+
+    def _poll_once(self):
+        """Deliver the next batch of events; True if more are likely waiting"""
+        rows = OutboxRepository.get_since(self._cursor, self.batch_size)
+        for event_id, event_type, payload in rows:
+            if event_id != self._cursor + 1:
+                # Hold back until the missing id commits or is given up on
+                if self._gap_since is None:
+                    self._gap_since = time.monotonic()
+                if time.monotonic() - self._gap_since < self.GAP_TIMEOUT:
+                    return False
+            self._gap_since = None
+            self._deliver(event_id, event_type, json.loads(payload))
+            self._cursor = event_id
+        return len(rows) == self.batch_size
+
+    def _prune(self):
+        """Drop events older than the retention period, at most once a minute"""
+        if time.monotonic() - self._last_prune > 60:
+            self._last_prune = time.monotonic()
+            with UnitOfWork():
+                OutboxRepository.delete_older_than(self.retention)
+
+    def _wait(self):
+        """Block until the next poll"""
+        self._stopped.wait(self.poll_interval)
+
+
+class PostgresNotifyEventBus(OutboxEventBus):
+    """Outbox bus woken by Postgres LISTEN/NOTIFY instead of fixed polling
+
+    The blocking listener needs the psycopg driver. Without it (or off
+    Postgres) the bus keeps working as a plain polling outbox.
+    """
+
+    CHANNEL = 'car_rental_events'
+
+    # Safety-net poll when no notification arrives
+    IDLE_POLL_INTERVAL = 5.0
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self._listener = None
+        self._listen_failed = False
+
+    def _after_insert(self, connection, event_id):
+        if connection.dialect.name != 'postgresql':
+            return
+        connection.execute(text('SELECT pg_notify(:channel, :payload)'),
+                           {'channel': self.CHANNEL, 'payload': str(event_id)})
+
+    def _wait(self):
+        listener = self._connect_listener()
+        if listener is None or self._gap_since is not None:
+            super()._wait()
+            return
+        try:
+            for _ in listener.notifies(timeout=self.IDLE_POLL_INTERVAL, stop_after=1):
+                pass
+        except Exception as e:
+            logger.warning(f'Event bus listener lost: {e}')
+            self._listener = None
+            super()._wait()
+
+    def _connect_listener(self):
+        """Open the dedicated LISTEN connection (None if unavailable)"""
+        if self._listener is not None or self._listen_failed:
+            return self._listener
+        try:
+            import psycopg
+        except ImportError:
+            logger.warning('psycopg not installed, polling the outbox instead of LISTEN/NOTIFY')
+            self._listen_failed = True
+            return None
+        
+        try:
+            from sqlalchemy.engine import make_url
+            url = make_url(self.app.config['SQLALCHEMY_DATABASE_URI']).set(drivername='postgresql')
+            self._listener = psycopg.connect(url.render_as_string(hide_password=False), autocommit=True)
+            self._listener.execute(f'LISTEN {self.CHANNEL}')
+        except Exception as e:
+            logger.warning(f'LISTEN connection failed, polling until the next attempt: {e}')
+            self._listener = None
+        return self._listener
+
+    def stop(self):
+        super().stop()
+        if self._listener is not None:
+            try:
+                self._listener.close()
+            except Exception:
+                pass
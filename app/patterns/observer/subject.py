@@ -1,22 +1,64 @@
-from abc import ABC, abstractmethod
-
-class Subject:
-    """Subject class for Observer pattern - manages observers and notifications"""
-    
-    def __init__(self):
-        self._observers = []
-    
-    def attach(self, observer):
-        """Attach an observer"""
-        if observer not in self._observers:
-            self._observers.append(observer)
-    
-    def detach(self, observer):
-        """Detach an observer"""
-        if observer in self._observers:
-            self._observers.remove(observer)
-    
-    def notify(self, event_type, data):
-        """Notify all observers of an event"""
-        for observer in self._observers:
-            observer.update(event_type, data)
+from abc import ABC, abstractmethod
+from app.patterns.observer.dispatcher import AsyncDispatcher
+from app.patterns.observer.event_bus import EventBus
+
+class Subject:
+    """Subject class for Observer pattern - manages observers and notifications
+    
+    With `async_dispatch=True` observers are called on background worker
+    threads (see AsyncDispatcher) so slow observers add no latency to the
+    request. Observers that must run in the caller's thread, e.g. because
+    they use the request session, set `synchronous = True`.
+    
+    Observers with `broadcast = True` are not called directly: the event is
+    published once on the event bus, which delivers it to their store in
+    every worker (see EventBus).
+    """
+    
+    def __init__(self, async_dispatch=False, dispatcher=None, bus=None):
+        self._observers = []
+        self.async_dispatch = async_dispatch
+        self._dispatcher = dispatcher
+        self._bus = bus
+    
+    @property
+    def dispatcher(self):
+        """Dispatcher used in async mode (the shared one unless given)"""
+        if self._dispatcher is None:
+            self._dispatcher = AsyncDispatcher.shared()
+        return self._dispatcher
+    
+    @property
+    def bus(self):
+        """Event bus for broadcast observers (the worker's shared one unless given)"""
+        return self._bus or EventBus.shared()
+    
+    def attach(self, observer):
+        """Attach an observer"""
+        if observer not in self._observers:
+            self._observers.append(observer)
+    
+    def detach(self, observer):
+        """Detach an observer"""
+        if observer in self._observers:
+            self._observers.remove(observer)
+    
+    def notify(self, event_type, data):
+        """Notify all observers of an event"""
+        broadcast = False
+        for observer in self._observers:
+            if getattr(observer, 'broadcast', False):
+                broadcast = True
+            elif self.async_dispatch and not getattr(observer, 'synchronous', False):
+                self.dispatcher.submit(observer, event_type, data)
+            else:
+                observer.update(event_type, data)
+        
+        if broadcast:
+            self.bus.publish(event_type, data)
+    
+    def flush(self, timeout=None):
+        """Wait for queued async notifications to be delivered"""
+        if self.async_dispatch:
+            return self.dispatcher.flush(timeout)
+        return True
@@ -1,29 +1,56 @@
-from abc import ABC, abstractmethod
-
-class CarState(ABC):
-    """Abstract base class for car states"""
-    
-    @abstractmethod
-    def can_book(self):
-        """Check if car can be booked in this state"""
-        pass
-    
-    @abstractmethod
-    def book(self, car):
-        """Attempt to book the car"""
-        pass
-    
-    @abstractmethod
-    def complete_service(self, car):
-        """Complete service and transition state"""
-        pass
-    
-    @abstractmethod
-    def start_maintenance(self, car):
-        """Start maintenance"""
-        pass
-    
-    @abstractmethod
-    def get_state_name(self):
-        """Get the name of this state"""
-        pass
+from abc import ABC, abstractmethod
+
+class CarState(ABC):
+    """Abstract base class for car states
+    
+    States carry no per-car data, so each state class has one shared
+    (flyweight) instance: `AvailableState()` always returns the same object.
+    Each state declares its transitions as {action: next state name}; they
+    are compiled into a single (state, action) -> next state table by
+    `StateTransitions`, which the actions below look up.
+    """
+    
+    name = None
+    transitions = {}
+    
+    _instances = {}
+    
+    def __new__(cls):
+        instance = CarState._instances.get(cls)
+        if instance is None:
+            instance = CarState._instances.setdefault(cls, super().__new__(cls))
+        return instance
+    
+    @abstractmethod
+    def can_book(self):
+        """Check if car can be booked in this state"""
+        pass
+    
+    def book(self, car):
+        """Attempt to book the car"""
+        return self._apply(car, 'book')
+    
+    def start_service(self, car):
+        """Send the car into service"""
+        return self._apply(car, 'start_service')
+    
+    def complete_service(self, car):
+        """Complete service and transition state"""
+        return self._apply(car, 'complete_service')
+    
+    def start_maintenance(self, car):
+        """Start maintenance"""
+        return self._apply(car, 'start_maintenance')
+    
+    def get_state_name(self):
+        """Get the name of this state"""
+        return self.name
+    
+    def _apply(self, car, action):
+        """Move the car to the table's next state; False if the action is not allowed"""
+        from .transitions import StateTransitions
+        next_state = StateTransitions.next_state(self.name, action)
+        if next_state is None:
+            return False
+        car.set_state(next_state)
+        return True
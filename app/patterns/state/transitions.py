@@ -0,0 +1,51 @@
+from .available import AvailableState
+from .booked import BookedState
+from .in_service import InServiceState
+from .maintenance import MaintenanceState
+from .out_of_range import OutOfRangeState
+
+_STATES = {state.name: state for state in (
+    AvailableState(), BookedState(), InServiceState(), MaintenanceState(), OutOfRangeState()
+)}
+
+_TABLE = {(name, action): _STATES[target]
+          for name, state in _STATES.items()
+          for action, target in state.transitions.items()}
+
+class StateTransitions:
+    """Precomputed transition table over the shared car state instances
+    
+    Built once at import from the transitions each state declares. Lookups
+    are dict hits on state names, so validating a status change for many
+    cars costs no allocation per car.
+    """
+    
+    STATES = _STATES
+    
+    # (state name, action) -> next state
+    TABLE = _TABLE
+    
+    # state name -> state names reachable with one action
+    REACHABLE = {name: frozenset(target.name for (source, _), target in _TABLE.items() if source == name)
+                 for name in _STATES}
+    
+    @classmethod
+    def get_state(cls, name, default=None):
+        """Get the shared state instance for a status name"""
+        return cls.STATES.get(name, default)
+    
+    @classmethod
+    def next_state(cls, name, action):
+        """Get the state an action leads to from `name` (None if not allowed)"""
+        return cls.TABLE.get((name, action))
+    
+    @classmethod
+    def check(cls, current, target):
+        """Get the reason a change from `current` to `target` is refused (None if allowed)"""
+        if target not in cls.STATES:
+            return f'Invalid status: {target}'
+        if current == target:
+            return f'Car is already {target}'
+        if target not in cls.REACHABLE.get(current, ()):
+            return f'Cannot change status from {current} to {target}'
+        return None
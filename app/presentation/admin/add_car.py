@@ -1,46 +1,80 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash
-from flask_login import login_required
-from app.services.fleet_service import FleetService
-
-add_car_bp = Blueprint('add_car', __name__, url_prefix='/admin')
-fleet_service = FleetService()
-
-@add_car_bp.route('/add-car', methods=['GET', 'POST'])
-@login_required
-def add_car():
-    """Add new car to fleet using Abstract Factory pattern"""
-    if request.method == 'POST':
-        license_plate = request.form.get('license_plate')
-        model = request.form.get('model')
-        category = request.form.get('category')
-        rental_lat = request.form.get('rental_lat')
-        rental_lng = request.form.get('rental_lng')
-        
-        # Validate inputs
-        if not license_plate or not model or not category:
-            flash('All required fields must be filled', 'error')
-            return render_template('admin/add_car.html')
-        
-        # Convert coordinates
-        try:
-            rental_lat = float(rental_lat) if rental_lat else None
-            rental_lng = float(rental_lng) if rental_lng else None
-        except ValueError:
-            flash('Invalid coordinate values', 'error')
-            return render_template('admin/add_car.html')
-        
-        result = fleet_service.add_car(
-            license_plate=license_plate,
-            model=model,
-            category=category,
-            rental_lat=rental_lat,
-            rental_lng=rental_lng
-        )
-        
-        if result['success']:
-            flash(f'Car {license_plate} added successfully to {category} fleet!', 'success')
-            return redirect(url_for('manage_fleet.fleet'))
-        else:
-            flash(result.get('message', 'Failed to add car'), 'error')
-        
-    return render_template('admin/add_car.html')
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask_login import login_required
+from app.services.fleet_import_service import FleetImportService
+from app.services.fleet_service import FleetService
+import io
+
+add_car_bp = Blueprint('add_car', __name__, url_prefix='/admin')
+fleet_service = FleetService()
+
+@add_car_bp.route('/add-car', methods=['GET', 'POST'])
+@login_required
+def add_car():
+    """Add new car to fleet using Abstract Factory pattern"""
+    if request.method == 'POST':
+        license_plate = request.form.get('license_plate')
+        model = request.form.get('model')
+        category = request.form.get('category')
+        rental_lat = request.form.get('rental_lat')
+        rental_lng = request.form.get('rental_lng')
+        
+        # Validate inputs
+        if not license_plate or not model or not category:
+            flash('All required fields must be filled', 'error')
+            return render_template('admin/add_car.html')
+        
+        # Convert coordinates
+        try:
+            rental_lat = float(rental_lat) if rental_lat else None
+            rental_lng = float(rental_lng) if rental_lng else None
+        except ValueError:
+            flash('Invalid coordinate values', 'error')
+            return render_template('admin/add_car.html')
+        
+        result = fleet_service.add_car(
+            license_plate=license_plate,
+            model=model,
+            category=category,
+            rental_lat=rental_lat,
+            rental_lng=rental_lng
+        )
+        
+        if result['success']:
+            flash(f'Car {license_plate} added successfully to {category} fleet!', 'success')
+            return redirect(url_for('manage_fleet.fleet'))
+        else:
+            flash(result.get('message', 'Failed to add car'), 'error')
+        
+    return render_template('admin/add_car.html')
+
+@add_car_bp.route('/import-fleet', methods=['POST'])
+@login_required
+def import_fleet():
+    """Add cars in bulk from an uploaded CSV or JSONL file"""
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        flash('Choose a CSV or JSONL file to import', 'error')
+        return render_template('admin/add_car.html')
+    
+    file_format = FleetImportService.get_format(upload.filename)
+    if not file_format:
+        flash('Unsupported file type, use .csv or .jsonl', 'error')
+        return render_template('admin/add_car.html')
+    
+    # Werkzeug spools large uploads to disk; read it row by row from there
+    stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+    result = FleetImportService().import_file(stream, file_format)
+    
+    if 'processed' not in result:
+        flash(result['message'], 'error')
+        return render_template('admin/add_car.html')
+    
+    if not result['success']:
+        # Batches before the unreadable part are already committed
+        flash(f"{result['message']}. Imported {result['imported']} of the "
+              f"{result['processed']} cars read before it", 'error')
+    elif result['imported']:
+        flash(f"Imported {result['imported']} of {result['processed']} cars", 'success')
+    else:
+        flash('No cars were imported', 'warning')
+    return render_template('admin/add_car.html', import_result=result)
@@ -1,19 +1,41 @@
-from flask import Blueprint, render_template
-from flask_login import login_required, current_user
-from app.services.fleet_service import FleetService
-from app.services.booking_service import BookingService
-
-admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
-fleet_service = FleetService()
-booking_service = BookingService()
-
-@admin_bp.route('/dashboard')
-@login_required
-def dashboard():
-    """Admin dashboard showing fleet and booking statistics"""
-    stats = fleet_service.get_fleet_statistics()
-    active_bookings = booking_service.get_active_bookings()
-    return render_template('admin/dashboard_enhanced.html', 
-                         stats=stats, 
-                         active_bookings=active_bookings,
-                         current_user=current_user)
+from flask import Blueprint, render_template, request, jsonify
+from flask_login import login_required, current_user
+from app.services.fleet_service import FleetService
+from app.services.booking_service import BookingService
+from app.patterns.observer.admin_notifier import AdminNotifier
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+fleet_service = FleetService()
+booking_service = BookingService()
+notifier = AdminNotifier()
+
+@admin_bp.route('/dashboard')
+@login_required
+def dashboard():
+    """Admin dashboard showing fleet and booking statistics"""
+    stats = fleet_service.get_fleet_statistics()
+    active_bookings = booking_service.get_active_bookings(with_car=True)
+    return render_template('admin/dashboard_enhanced.html', 
+                         stats=stats, 
+                         active_bookings=active_bookings,
+                         current_user=current_user)
+
+@admin_bp.route('/notifications')
+@login_required
+def notifications():
+    """Poll admin notifications newer than ?since=<id> (latest ones without it)"""
+    limit = min(request.args.get('limit', 50, type=int), 200)
+    since = request.args.get('since', type=int)
+    
+    if since is None:
+        items = notifier.get_recent_notifications(limit) if limit > 0 else []
+        last_id = notifier.get_last_id()
+    else:
+        items = notifier.get_notifications_since(since, limit)
+        last_id = items[-1]['id'] if items else since
+    
+    return jsonify({
+        'success': True,
+        'notifications': items,
+        'last_id': last_id
+    })
@@ -1,64 +1,129 @@
-from flask import Blueprint, render_template, request, jsonify, flash, session, redirect, url_for
-from flask_login import login_required
-from app.services.tracking_service import TrackingService
-from app.services.fleet_service import FleetService
-
-tracking_bp = Blueprint('tracking', __name__, url_prefix='/admin')
-tracking_service = TrackingService()
-fleet_service = FleetService()
-
-@tracking_bp.route('/tracking')
-@login_required
-def tracking():
-    """Vehicle tracking with Observer pattern notifications"""
-    cars = fleet_service.get_all_cars()
-    out_of_range = tracking_service.get_out_of_range_cars()
-    
-    # Check for pending notifications from Observer pattern
-    if 'pending_notification' in session:
-        notification = session.pop('pending_notification')
-        flash(notification['message'], notification['type'])
-    
-    return render_template('admin/tracking.html', cars=cars, out_of_range=out_of_range)
-
-@tracking_bp.route('/tracking/update-location/<int:car_id>', methods=['POST'])
-@login_required
-def update_location(car_id):
-    """Update car location and trigger Observer notifications"""
-    data = request.get_json()
-    latitude = data.get('latitude')
-    longitude = data.get('longitude')
-    
-    result = tracking_service.update_location(car_id, latitude, longitude)
-    return jsonify(result)
-
-@tracking_bp.route('/tracking/simulate-out-of-range/<int:car_id>')
-@login_required
-def simulate_out_of_range(car_id):
-    """Simulate out-of-range notification for testing Observer pattern"""
-    from app.data.car_repository import CarRepository
-    
-    car = CarRepository.get_by_id(car_id)
-    if car:
-        # Simulate location far from rental point (100 km away)
-        if car.rental_location_lat and car.rental_location_lng:
-            # Move car 1 degree away (approximately 111 km)
-            new_lat = car.rental_location_lat + 1.0
-            new_lng = car.rental_location_lng + 1.0
-            
-            result = tracking_service.update_location(car_id, new_lat, new_lng)
-            # Don't add extra flash here, let the Observer pattern handle it
-        else:
-            flash('Car has no rental location set.', 'warning')
-    else:
-        flash('Car not found.', 'error')
-    
-    # Redirect to tracking page to show notification
-    return redirect(url_for('tracking.tracking'))
-
-@tracking_bp.route('/tracking/history/<int:car_id>')
-@login_required
-def location_history(car_id):
-    """View location history for a vehicle"""
-    history = tracking_service.get_location_history(car_id)
-    return render_template('admin/location_history.html', history=history, car_id=car_id)
+from flask import Blueprint, Response, render_template, request, jsonify, flash, redirect, url_for
+from flask_login import login_required
+from app.services.tracking_service import TrackingService
+from app.services.tracking_stream import TrackingStream
+from app.services.fleet_service import FleetService
+from app.patterns.observer.admin_notifier import AdminNotifier
+import json
+import threading
+import time
+
+tracking_bp = Blueprint('tracking', __name__, url_prefix='/admin')
+tracking_service = TrackingService()
+fleet_service = FleetService()
+notifier = AdminNotifier()
+TrackingStream.start()
+
+# Seconds between SSE keep-alive comments, and before a stream is closed so
+# the browser reconnects (resuming from Last-Event-ID) and frees its thread
+STREAM_HEARTBEAT = 15
+STREAM_MAX_SECONDS = 300
+
+# Open streams per worker, so live tabs cannot take every gunicorn thread
+# (render.yaml runs 8); clients over the limit are told to retry later
+STREAM_MAX_CLIENTS = 4
+STREAM_BUSY_RETRY_MS = 30000
+stream_slots = threading.BoundedSemaphore(STREAM_MAX_CLIENTS)
+
+@tracking_bp.route('/tracking')
+@login_required
+def tracking():
+    """Vehicle tracking with Observer pattern notifications"""
+    cars = fleet_service.get_all_cars()
+    out_of_range = tracking_service.get_out_of_range_cars()
+    
+    # Observer notifications are polled from /admin/notifications; a redirect
+    # after a simulated event passes the cursor so that event is shown too
+    notification_cursor = request.args.get('since', type=int)
+    
+    positions = tracking_service.get_positions(cars)
+    
+    # Taken before rendering so the live stream resumes from what the page shows
+    stream_cursor = TrackingStream.get_last_id()
+    
+    return render_template('admin/tracking.html', cars=cars, out_of_range=out_of_range,
+                           positions=positions, notification_cursor=notification_cursor,
+                           stream_cursor=stream_cursor)
+
+@tracking_bp.route('/tracking/stream')
+@login_required
+def tracking_stream():
+    """Server-Sent Events stream of car position and status patches"""
+    cursor = request.headers.get('Last-Event-ID', type=int)
+    if cursor is None:
+        cursor = request.args.get('since', TrackingStream.get_last_id(), type=int)
+    
+    def events(cursor):
+        if not stream_slots.acquire(blocking=False):
+            yield f'retry: {STREAM_BUSY_RETRY_MS}\n\n'
+            return
+        try:
+            yield 'retry: 3000\n\n'
+            deadline = time.monotonic() + STREAM_MAX_SECONDS
+            while time.monotonic() < deadline:
+                cursor, patches = TrackingStream.wait(cursor, STREAM_HEARTBEAT)
+                if patches:
+                    yield f'id: {cursor}\nevent: patch\ndata: {json.dumps(patches)}\n\n'
+                else:
+                    yield ': keep-alive\n\n'
+        finally:
+            stream_slots.release()
+    
+    return Response(events(cursor), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@tracking_bp.route('/tracking/update-location/<int:car_id>', methods=['POST'])
+@login_required
+def update_location(car_id):
+    """Update car location and trigger Observer notifications"""
+    data = request.get_json()
+    latitude = data.get('latitude')
+    longitude = data.get('longitude')
+    
+    result = tracking_service.update_location(car_id, latitude, longitude)
+    return jsonify(result)
+
+@tracking_bp.route('/tracking/sweep', methods=['POST'])
+@login_required
+def sweep_fleet():
+    """Re-check every tracked car against its geofence in one pass"""
+    result = tracking_service.sweep_fleet()
+    return jsonify(result)
+
+@tracking_bp.route('/tracking/simulate-out-of-range/<int:car_id>')
+@login_required
+def simulate_out_of_range(car_id):
+    """Simulate out-of-range notification for testing Observer pattern"""
+    from app.data.car_repository import CarRepository
+    
+    car = CarRepository.get_by_id(car_id)
+    if car:
+        # Simulate location far from rental point (100 km away)
+        if car.rental_location_lat and car.rental_location_lng:
+            # Move car 1 degree away (approximately 111 km)
+            new_lat = car.rental_location_lat + 1.0
+            new_lng = car.rental_location_lng + 1.0
+            
+            # Report the car beyond its zone for the whole geofence dwell time
+            cursor = notifier.get_last_id()
+            now = time.time()
+            result = tracking_service.ingest_batch([
+                {'car_id': car_id, 'lat': new_lat, 'lng': new_lng, 'ts': now - tracking_service.min_dwell},
+                {'car_id': car_id, 'lat': new_lat, 'lng': new_lng, 'ts': now}
+            ])
+            # Don't add extra flash here, let the Observer pattern handle it
+            return redirect(url_for('tracking.tracking', since=cursor))
+        else:
+            flash('Car has no rental location set.', 'warning')
+    else:
+        flash('Car not found.', 'error')
+    
+    # Redirect to tracking page to show notification
+    return redirect(url_for('tracking.tracking'))
+
+@tracking_bp.route('/tracking/history/<int:car_id>')
+@login_required
+def location_history(car_id):
+    """View location history for a vehicle"""
+    history = tracking_service.get_location_history(car_id)
+    return render_template('admin/location_history.html', history=history, car_id=car_id)
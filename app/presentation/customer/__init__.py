@@ -1 +1 @@
-# Customer booking module
+# Customer booking module
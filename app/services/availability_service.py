@@ -0,0 +1,67 @@
+from app.data.booking_repository import BookingRepository
+from app.data.car_repository import CarRepository
+from app.utils.interval_tree import IntervalTree
+from config import Config
+from datetime import datetime
+import threading
+import time
+
+class AvailabilityService:
+    """Date-range availability engine backed by the bookings table
+
+    Listing cars free for a period excludes overlapping bookings in SQL
+    (NOT EXISTS), so only free cars are loaded. The per-car check before a
+    booking first consults interval trees built from active bookings that
+    have not ended yet: a cached overlap refuses the car without a query,
+    otherwise the indexed overlap query decides. The trees are shared by
+    every instance in the worker and rebuilt after
+    `Config.AVAILABILITY_CACHE_TTL` seconds or after a booking change made
+    through this service.
+    """
+
+    # Statuses that rule out any new booking regardless of dates
+    BLOCKING_STATUSES = ('maintenance', 'in_service', 'out_of_range')
+
+    _trees = {}
+    _built_at = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.cache_ttl = Config.AVAILABILITY_CACHE_TTL
+
+    def is_car_available(self, car, start_date, end_date):
+        """Check used before creating a booking (a free answer always comes from the database)"""
+        if car.status in self.BLOCKING_STATUSES:
+            return False
+        tree = self._get_trees().get(car.id)
+        if tree is not None and tree.overlaps(start_date, end_date):
+            return False
+        return not BookingRepository.has_overlapping_booking(car.id, start_date, end_date)
+
+    def get_available_cars(self, start_date, end_date, category=None):
+        """Get cars with no active booking overlapping [start_date, end_date)"""
+        return CarRepository.get_bookable(self.BLOCKING_STATUSES, start_date, end_date, category)
+
+    @classmethod
+    def invalidate(cls):
+        """Force the interval trees to be rebuilt on next use"""
+        with cls._lock:
+            cls._built_at = None
+
+    def _get_trees(self):
+        """Get the per-car interval trees, rebuilding them when stale"""
+        cls = type(self)
+        with cls._lock:
+            now = time.monotonic()
+            if cls._built_at is None or now - cls._built_at > self.cache_ttl:
+                cls._trees = self._build_trees()
+                cls._built_at = now
+            return cls._trees
+
+    @staticmethod
+    def _build_trees():
+        """Load current and future active bookings into one tree per car"""
+        periods = {}
+        for car_id, start_date, end_date, booking_id in BookingRepository.get_active_periods(datetime.now()):
+            periods.setdefault(car_id, []).append((start_date, end_date, booking_id))
+        return {car_id: IntervalTree(intervals) for car_id, intervals in periods.items()}
@@ -1,114 +1,210 @@
-from app.data.booking_repository import BookingRepository
-from app.data.car_repository import CarRepository
-from app.patterns.observer.subject import Subject
-from datetime import datetime
-
-class BookingService:
-    """Service for managing bookings using State and Observer patterns"""
-    
-    def __init__(self):
-        self.notification_system = Subject()
-    
-    def create_booking(self, car_id, customer_name, customer_phone, customer_cnic,
-                      start_date, end_date, pricing_strategy='base'):
-        """Create a new booking"""
-        # Check if car exists and is available
-        car = CarRepository.get_by_id(car_id)
-        if not car:
-            return {'success': False, 'message': 'Car not found'}
-        
-        if car.status != 'available':
-            return {'success': False, 'message': f'Car is not available (current status: {car.status})'}
-        
-        # Calculate duration
-        duration_days = (end_date - start_date).days
-        if duration_days < 1:
-            return {'success': False, 'message': 'Rental duration must be at least 1 day'}
-        
-        # Calculate price (simple calculation)
-        total_amount = car.price_tier * duration_days
-        price_info = {'total': total_amount}
-        
-        # Generate access code
-        from app.domain.booking import Booking as BookingDomain
-        temp_booking = BookingDomain(None, car_id, customer_name, customer_phone,
-                                    customer_cnic, start_date, end_date, price_info['total'])
-        access_code = temp_booking.access_code
-        
-        # Create booking
-        booking = BookingRepository.create(
-            car_id=car_id,
-            customer_name=customer_name,
-            customer_phone=customer_phone,
-            customer_cnic=customer_cnic,
-            start_date=start_date,
-            end_date=end_date,
-            total_amount=price_info['total'],
-            access_code=access_code
-        )
-        
-        # Update car status to booked
-        CarRepository.update_status(car_id, 'booked')
-        
-        # Notify observers
-        self.notification_system.notify('car_booked', {
-            'car_id': car_id,
-            'license_plate': car.license_plate,
-            'customer_name': customer_name,
-            'booking_id': booking.id
-        })
-        
-        return {
-            'success': True,
-            'booking': booking,
-            'price_info': price_info,
-            'access_code': access_code
-        }
-    
-    def complete_booking(self, booking_id):
-        """Complete a booking and return car to available"""
-        booking = BookingRepository.get_by_id(booking_id)
-        if not booking:
-            return {'success': False, 'message': 'Booking not found'}
-        
-        # Update booking status
-        BookingRepository.update_status(booking_id, 'completed')
-        
-        # Update car status back to available
-        car = CarRepository.update_status(booking.car_id, 'available')
-        
-        # Notify observers
-        self.notification_system.notify('booking_completed', {
-            'booking_id': booking_id,
-            'car_id': booking.car_id,
-            'license_plate': car.license_plate if car else 'Unknown'
-        })
-        
-        return {'success': True, 'message': 'Booking completed successfully'}
-    
-    def cancel_booking(self, booking_id):
-        """Cancel a booking"""
-        booking = BookingRepository.get_by_id(booking_id)
-        if not booking:
-            return {'success': False, 'message': 'Booking not found'}
-        
-        BookingRepository.update_status(booking_id, 'cancelled')
-        CarRepository.update_status(booking.car_id, 'available')
-        
-        return {'success': True, 'message': 'Booking cancelled successfully'}
-    
-    def get_all_bookings(self):
-        """Get all bookings"""
-        return BookingRepository.get_all()
-    
-    def get_booking_by_id(self, booking_id):
-        """Get booking by ID"""
-        return BookingRepository.get_by_id(booking_id)
-    
-    def get_active_bookings(self):
-        """Get active bookings"""
-        return BookingRepository.get_active_bookings()
-    
-    def verify_access_code(self, access_code):
-        """Verify booking access code"""
-        return BookingRepository.get_by_access_code(access_code)
+from app.data.booking_repository import BookingRepository
+from app.data.car_repository import CarRepository
+from app.data.unit_of_work import UnitOfWork
+from app.patterns.observer.subject import Subject
+from app.patterns.observer.admin_notifier import AdminNotifier
+from app.services.availability_service import AvailabilityService
+from datetime import datetime
+
+class BookingService:
+    """Service for managing bookings using State and Observer patterns"""
+    
+    # Candidates tried by book_any_car before giving up on a category
+    ALLOCATION_ATTEMPTS = 5
+    
+    def __init__(self):
+        self.notification_system = Subject()
+        self.notification_system.attach(AdminNotifier())
+        self.availability = AvailabilityService()
+    
+    def create_booking(self, car_id, customer_name, customer_phone, customer_cnic,
+                      start_date, end_date, pricing_strategy='base'):
+        """Create a new booking"""
+        # Read, create and status change commit together (one transaction)
+        with UnitOfWork():
+            # Lock the car so concurrent bookings for it are serialized
+            car = CarRepository.lock_by_id(car_id)
+            if not car:
+                return {'success': False, 'message': 'Car not found'}
+            
+            # Calculate duration
+            duration_days = (end_date - start_date).days
+            if duration_days < 1:
+                return {'success': False, 'message': 'Rental duration must be at least 1 day'}
+            
+            # Check the requested period against the car's existing bookings
+            if not self.availability.is_car_available(car, start_date, end_date):
+                if car.status in AvailabilityService.BLOCKING_STATUSES:
+                    return {'success': False, 'message': f'Car is not available (current status: {car.status})'}
+                return {'success': False, 'message': 'Car is already booked for the selected dates'}
+            
+            booking, price_info = self._book_locked_car(
+                car, customer_name, customer_phone, customer_cnic, start_date, end_date)
+            license_plate = car.license_plate
+        
+        return self._booking_created(booking, license_plate, price_info)
+    
+    def book_any_car(self, category, customer_name, customer_phone, customer_cnic,
+                     start_date, end_date, pricing_strategy='base'):
+        """Book whichever car of a category is free for the requested dates
+        
+        Candidates locked by concurrent requests are skipped rather than
+        waited for, so a burst of customers is spread across the category.
+        """
+        if (end_date - start_date).days < 1:
+            return {'success': False, 'message': 'Rental duration must be at least 1 day'}
+        
+        with UnitOfWork():
+            skipped = []
+            for _ in range(self.ALLOCATION_ATTEMPTS):
+                car = CarRepository.lock_first_bookable(
+                    category, start_date, end_date,
+                    AvailabilityService.BLOCKING_STATUSES, skipped)
+                if not car:
+                    break
+                # Re-check under the lock: a booking committed after the
+                # candidate query started is not visible to that query
+                if self.availability.is_car_available(car, start_date, end_date):
+                    booking, price_info = self._book_locked_car(
+                        car, customer_name, customer_phone, customer_cnic, start_date, end_date)
+                    license_plate = car.license_plate
+                    break
+                skipped.append(car.id)
+                car = None
+            
+            if not car:
+                return {'success': False, 'conflict': True,
+                        'message': f'No {category} cars available for the selected dates'}
+        
+        return self._booking_created(booking, license_plate, price_info)
+    
+    def _book_locked_car(self, car, customer_name, customer_phone, customer_cnic,
+                         start_date, end_date):
+        """Create the booking for a car already locked by the current unit of work"""
+        # Calculate price (simple calculation)
+        total_amount = car.price_tier * (end_date - start_date).days
+        price_info = {'total': total_amount}
+        
+        # Generate access code
+        from app.domain.booking import Booking as BookingDomain
+        temp_booking = BookingDomain(None, car.id, customer_name, customer_phone,
+                                    customer_cnic, start_date, end_date, price_info['total'])
+        
+        # Create booking
+        booking = BookingRepository.create(
+            car_id=car.id,
+            customer_name=customer_name,
+            customer_phone=customer_phone,
+            customer_cnic=customer_cnic,
+            start_date=start_date,
+            end_date=end_date,
+            total_amount=price_info['total'],
+            access_code=temp_booking.access_code
+        )
+        
+        # Mark the car as booked only once the rental period has started
+        if start_date.date() <= datetime.now().date() and car.status == 'available':
+            CarRepository.update_status(car.id, 'booked')
+        
+        return booking, price_info
+    
+    def _booking_created(self, booking, license_plate, price_info):
+        """Refresh availability and notify observers once a booking is committed"""
+        AvailabilityService.invalidate()
+        
+        # Notify observers
+        self.notification_system.notify('car_booked', {
+            'car_id': booking.car_id,
+            'license_plate': license_plate,
+            'customer_name': booking.customer_name,
+            'booking_id': booking.id
+        })
+        
+        return {
+            'success': True,
+            'booking': booking,
+            'price_info': price_info,
+            'access_code': booking.access_code
+        }
+    
+    def complete_booking(self, booking_id):
+        """Complete a booking and return car to available"""
+        with UnitOfWork():
+            booking = BookingRepository.get_by_id(booking_id)
+            if not booking:
+                return {'success': False, 'message': 'Booking not found'}
+            
+            # Update booking status
+            car_id = booking.car_id
+            BookingRepository.update_status(booking_id, 'completed')
+            
+            # Update car status back to available unless another rental is running
+            car = self._release_car(car_id)
+            license_plate = car.license_plate if car else 'Unknown'
+        
+        AvailabilityService.invalidate()
+        
+        # Notify observers
+        self.notification_system.notify('booking_completed', {
+            'booking_id': booking_id,
+            'car_id': car_id,
+            'license_plate': license_plate
+        })
+        
+        return {'success': True, 'message': 'Booking completed successfully'}
+    
+    def cancel_booking(self, booking_id):
+        """Cancel a booking"""
+        with UnitOfWork():
+            booking = BookingRepository.get_by_id(booking_id)
+            if not booking:
+                return {'success': False, 'message': 'Booking not found'}
+            
+            BookingRepository.update_status(booking_id, 'cancelled')
+            self._release_car(booking.car_id)
+        
+        AvailabilityService.invalidate()
+        
+        return {'success': True, 'message': 'Booking cancelled successfully'}
+    
+    def start_due_rentals(self, now=None):
+        """Mark cars booked once their booking's rental period has started
+
+        Bookings made ahead of time leave the car available; run this
+        periodically (see sweep_geofence.py) so running rentals show as booked.
+        """
+        now = now or datetime.now()
+        with UnitOfWork():
+            car_ids = BookingRepository.get_started_car_ids(now)
+            statuses = CarRepository.get_statuses(car_ids, lock=True)
+            started = [car_id for car_id, status in statuses.items() if status == 'available']
+            if started:
+                CarRepository.bulk_update_status(started, 'booked')
+        return {'success': True, 'started': started}
+    
+    def _release_car(self, car_id):
+        """Return a car to available if no other active booking covers today"""
+        now = datetime.now()
+        if BookingRepository.has_overlapping_booking(car_id, now, now):
+            return CarRepository.get_by_id(car_id)
+        return CarRepository.update_status(car_id, 'available')
+    
+    def _car_options(self, with_car):
+        """Loader options for views that render booking.car on every row"""
+        return (BookingRepository.with_car(),) if with_car else ()
+    
+    def get_all_bookings(self, with_car=False):
+        """Get all bookings"""
+        return BookingRepository.get_all(self._car_options(with_car))
+    
+    def get_booking_by_id(self, booking_id, with_car=False):
+        """Get booking by ID"""
+        return BookingRepository.get_by_id(booking_id, self._car_options(with_car))
+    
+    def get_active_bookings(self, with_car=False):
+        """Get active bookings"""
+        return BookingRepository.get_active_bookings(self._car_options(with_car))
+    
+    def verify_access_code(self, access_code, with_car=False):
+        """Verify booking access code"""
+        return BookingRepository.get_by_access_code(access_code, self._car_options(with_car))
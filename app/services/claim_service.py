@@ -1,89 +1,101 @@
-from app.data.claim_repository import ClaimRepository
-from app.data.car_repository import CarRepository
-from app.patterns.cor.minor_damage import MinorDamageHandler
-from app.patterns.cor.major_damage import MajorDamageHandler
-from app.patterns.cor.insurance_handler import InsuranceHandler
-from app.patterns.observer.subject import Subject
-
-class ClaimService:
-    """Service for processing damage claims using Chain of Responsibility"""
-    
-    def __init__(self):
-        self.notification_system = Subject()
-        
-        # Set up the chain of responsibility
-        self.minor_handler = MinorDamageHandler()
-        self.major_handler = MajorDamageHandler()
-        self.insurance_handler = InsuranceHandler()
-        
-        # Chain: Minor -> Major -> Insurance
-        self.minor_handler.set_next(self.major_handler)
-        self.major_handler.set_next(self.insurance_handler)
-    
-    def file_claim(self, car_id, booking_id, damage_type, description, estimated_cost):
-        """File a new damage claim"""
-        car = CarRepository.get_by_id(car_id)
-        if not car:
-            return {'success': False, 'message': 'Car not found'}
-        
-        # Create the claim
-        claim = ClaimRepository.create(
-            car_id=car_id,
-            booking_id=booking_id,
-            damage_type=damage_type,
-            description=description,
-            estimated_cost=estimated_cost
-        )
-        
-        # Process through chain of responsibility
-        claim_data = {
-            'id': claim.id,
-            'car_id': car_id,
-            'estimated_cost': estimated_cost,
-            'damage_type': damage_type,
-            'description': description
-        }
-        
-        result = self.minor_handler.handle(claim_data)
-        
-        # Update claim with processing result
-        ClaimRepository.update_status(
-            claim.id,
-            result['status'],
-            result['handler']
-        )
-        
-        # Notify observers
-        self.notification_system.notify('damage_claim_filed', {
-            'claim_id': claim.id,
-            'car_id': car_id,
-            'license_plate': car.license_plate,
-            'estimated_cost': estimated_cost,
-            'status': result['status']
-        })
-        
-        return {
-            'success': True,
-            'claim': claim,
-            'processing_result': result
-        }
-    
-    def get_all_claims(self):
-        """Get all claims"""
-        return ClaimRepository.get_all()
-    
-    def get_pending_claims(self):
-        """Get pending claims"""
-        return ClaimRepository.get_pending_claims()
-    
-    def get_claims_by_car(self, car_id):
-        """Get all claims for a specific car"""
-        return ClaimRepository.get_by_car(car_id)
-    
-    def approve_claim(self, claim_id):
-        """Approve a claim"""
-        return ClaimRepository.update_status(claim_id, 'approved')
-    
-    def reject_claim(self, claim_id):
-        """Reject a claim"""
-        return ClaimRepository.update_status(claim_id, 'rejected')
+from app.data.claim_repository import ClaimRepository
+from app.data.car_repository import CarRepository
+from app.data.unit_of_work import UnitOfWork
+from app.patterns.cor.minor_damage import MinorDamageHandler
+from app.patterns.cor.major_damage import MajorDamageHandler
+from app.patterns.cor.insurance_handler import InsuranceHandler
+from app.patterns.observer.subject import Subject
+from app.patterns.observer.admin_notifier import AdminNotifier
+
+class ClaimService:
+    """Service for processing damage claims using Chain of Responsibility"""
+    
+    def __init__(self):
+        self.notification_system = Subject()
+        self.notification_system.attach(AdminNotifier())
+        
+        # Set up the chain of responsibility
+        self.minor_handler = MinorDamageHandler()
+        self.major_handler = MajorDamageHandler()
+        self.insurance_handler = InsuranceHandler()
+        
+        # Chain: Minor -> Major -> Insurance
+        self.minor_handler.set_next(self.major_handler)
+        self.major_handler.set_next(self.insurance_handler)
+    
+    def file_claim(self, car_id, booking_id, damage_type, description, estimated_cost):
+        """File a new damage claim"""
+        # Claim creation and its processing result commit together
+        with UnitOfWork():
+            car = CarRepository.get_by_id(car_id)
+            if not car:
+                return {'success': False, 'message': 'Car not found'}
+            
+            # Create the claim
+            claim = ClaimRepository.create(
+                car_id=car_id,
+                booking_id=booking_id,
+                damage_type=damage_type,
+                description=description,
+                estimated_cost=estimated_cost
+            )
+            
+            # Process through chain of responsibility
+            claim_data = {
+                'id': claim.id,
+                'car_id': car_id,
+                'estimated_cost': estimated_cost,
+                'damage_type': damage_type,
+                'description': description
+            }
+            
+            result = self.minor_handler.handle(claim_data)
+            
+            # Update claim with processing result
+            ClaimRepository.update_status(
+                claim.id,
+                result['status'],
+                result['handler']
+            )
+            
+            license_plate = car.license_plate
+            claim_id = claim.id
+        
+        # Notify observers
+        self.notification_system.notify('damage_claim_filed', {
+            'claim_id': claim_id,
+            'car_id': car_id,
+            'license_plate': license_plate,
+            'estimated_cost': estimated_cost,
+            'status': result['status']
+        })
+        
+        return {
+            'success': True,
+            'claim': claim,
+            'processing_result': result
+        }
+    
+    def _car_options(self, with_car):
+        """Loader options for views that render claim.car on every row"""
+        return (ClaimRepository.with_car(),) if with_car else ()
+    
+    def get_all_claims(self, with_car=False):
+        """Get all claims"""
+        return ClaimRepository.get_all(self._car_options(with_car))
+    
+    def get_pending_claims(self, with_car=False):
+        """Get pending claims"""
+        return ClaimRepository.get_pending_claims(self._car_options(with_car))
+    
+    def get_claims_by_car(self, car_id):
+        """Get all claims for a specific car"""
+        return ClaimRepository.get_by_car(car_id)
+    
+    def approve_claim(self, claim_id):
+        """Approve a claim"""
+        return ClaimRepository.update_status(claim_id, 'approved')
+    
+    def reject_claim(self, claim_id):
+        """Reject a claim"""
+        return ClaimRepository.update_status(claim_id, 'rejected')
@@ -0,0 +1,182 @@
+from app.data.car_repository import CarRepository
+from app.data.unit_of_work import UnitOfWork
+from app.services.fleet_service import FleetService
+from app.utils.exceptions import ValidationException
+from app.utils.validators_enhanced import Validator
+from config import Config
+from sqlalchemy.exc import IntegrityError
+import csv
+import json
+import os
+
+class FleetImportService:
+    """Streams cars from a CSV or JSONL file into the fleet in batches
+
+    Rows are read one at a time and validated like cars added from the
+    admin form. Each category's factory defaults (price tier, tracker,
+    maintenance interval) are resolved once per import, and valid rows are
+    inserted `batch_size` at a time with one executemany INSERT, each batch
+    in its own transaction. Plates already in the fleet, including rows of
+    earlier batches, are found with one query per batch, so only the
+    current batch is held in memory however large the file is. Rejected
+    rows are counted and the first `max_errors` are listed in the report;
+    they never abort the import.
+    """
+
+    FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+    def __init__(self, batch_size=None, max_errors=None):
+        self.batch_size = batch_size or Config.FLEET_IMPORT_BATCH_SIZE
+        self.max_errors = Config.FLEET_IMPORT_MAX_ERRORS if max_errors is None else max_errors
+        self._defaults = {}
+
+    @classmethod
+    def get_format(cls, filename):
+        """Get the import format of a file from its extension (None if unsupported)"""
+        return cls.FORMATS.get(os.path.splitext(filename or '')[1].lower())
+
+    def import_file(self, stream, file_format, progress=None):
+        """Import the cars of a text stream in `file_format` ('csv' or 'jsonl')
+
+        `progress(result)` is called after each batch with the running totals.
+        """
+        if file_format not in ('csv', 'jsonl'):
+            return {'success': False, 'message': f'Unsupported import format: {file_format}'}
+
+        rows = self._read_csv(stream) if file_format == 'csv' else self._read_jsonl(stream)
+        result = {'success': True, 'processed': 0, 'imported': 0, 'duplicates': 0,
+                  'failed': 0, 'errors': []}
+        batch = {}
+        try:
+            for line, values in rows:
+                result['processed'] += 1
+                car, error = self._parse(values)
+                if error is not None:
+                    self._reject(result, line, values, error)
+                    continue
+                if car['license_plate'] in batch:
+                    result['duplicates'] += 1
+                    self._reject(result, line, car, 'Duplicate license plate in file', count=False)
+                    continue
+                batch[car['license_plate']] = (line, car)
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, result, progress)
+                    batch = {}
+        except (csv.Error, UnicodeDecodeError) as e:
+            result['success'] = False
+            result['message'] = f'Could not read file: {e}'
+        self._flush(batch, result, progress)
+
+        if result['imported']:
+            FleetService.invalidate_statistics()
+        return result
+
+    def _read_csv(self, stream):
+        """Yield (line, values) for each CSV record, header names normalised"""
+        reader = csv.DictReader(stream)
+        if reader.fieldnames:
+            reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        for values in reader:
+            yield reader.line_num, values
+
+    def _read_jsonl(self, stream):
+        """Yield (line, values) for each non-blank JSONL line"""
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                values = json.loads(text)
+            except ValueError:
+                values = None
+            yield line, values if isinstance(values, dict) else {'_error': 'Invalid JSON object'}
+
+    def _parse(self, values):
+        """Validate one row; get (car fields, None) or (None, error message)"""
+        if '_error' in values:
+            return None, values['_error']
+        try:
+            license_plate = Validator.validate_license_plate(self._text(values.get('license_plate')))
+            category = Validator.validate_category(self._text(values.get('category')))
+        except ValidationException as e:
+            return None, e.message
+
+        model = Validator.sanitize_string(self._text(values.get('model')), max_length=100)
+        if not model:
+            return None, 'Model is required'
+
+        try:
+            rental_lat = self._coordinate(values.get('rental_lat'), 90)
+            rental_lng = self._coordinate(values.get('rental_lng'), 180)
+        except ValueError:
+            return None, 'Invalid coordinate values'
+        if (rental_lat is None) != (rental_lng is None):
+            return None, 'Rental latitude and longitude must be given together'
+
+        car = dict(self._get_defaults(category), license_plate=license_plate, model=model,
+                   category=category, rental_lat=rental_lat, rental_lng=rental_lng)
+        return car, None
+
+    @staticmethod
+    def _text(value):
+        """Get a field as a string (JSONL values may be numbers or null)"""
+        return None if value is None else str(value)
+
+    @staticmethod
+    def _coordinate(value, limit):
+        """Parse an optional coordinate within [-limit, limit]"""
+        if value is None or str(value).strip() == '':
+            return None
+        coordinate = float(value)
+        if not -limit <= coordinate <= limit:
+            raise ValueError(coordinate)
+        return coordinate
+
+    def _get_defaults(self, category):
+        """Resolve a category's factory defaults once per import"""
+        if category not in self._defaults:
+            factory = FleetService.FACTORY_MAP[category]()
+            tracker_config = factory.create_tracker()
+            self._defaults[category] = {
+                'price_tier': factory.create_car()['price_tier'],
+                'tracker_type': tracker_config['type'],
+                'tracker_update_interval': tracker_config['update_interval'],
+                'interval_km': factory.create_maintenance_profile()['interval_km']
+            }
+        return self._defaults[category]
+
+    def _flush(self, batch, result, progress):
+        """Insert one batch, skipping plates already in the fleet"""
+        if not batch:
+            return
+        for attempt in range(2):
+            existing = CarRepository.get_existing_plates(batch.keys())
+            for plate in existing:
+                line, car = batch.pop(plate)
+                result['duplicates'] += 1
+                self._reject(result, line, car, 'License plate already exists', count=False)
+            if not batch:
+                break
+            try:
+                with UnitOfWork():
+                    CarRepository.bulk_create([car for _, car in batch.values()])
+            except IntegrityError:
+                if attempt == 0:
+                    continue  # a plate was added concurrently: look again
+                for line, car in batch.values():
+                    self._reject(result, line, car, 'Could not insert car')
+                break
+            result['imported'] += len(batch)
+            break
+        if progress:
+            progress(result)
+
+    def _reject(self, result, line, values, error, count=True):
+        """Count a rejected row and list it while under `max_errors`"""
+        if count:
+            result['failed'] += 1
+        if len(result['errors']) < self.max_errors:
+            result['errors'].append({
+                'line': line,
+                'license_plate': values.get('license_plate'),
+                'error': error
+            })
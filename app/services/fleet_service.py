@@ -1,98 +1,247 @@
-from app.data.car_repository import CarRepository
-from app.patterns.abstact_factory.economy_vehicle_factory import EconomyVehicleFactory
-from app.patterns.abstact_factory.luxury_vehicle_factory import LuxuryVehicleFactory
-from app.patterns.abstact_factory.suv_vehicle_factory import SUVVehicleFactory
-from app.patterns.observer.subject import Subject
-
-class FleetService:
-    """Service for managing fleet operations using Abstract Factory pattern"""
-    
-    FACTORY_MAP = {
-        'economy': EconomyVehicleFactory,
-        'luxury': LuxuryVehicleFactory,
-        'suv': SUVVehicleFactory
-    }
-    
-    def __init__(self):
-        self.notification_system = Subject()
-    
-    def add_car(self, license_plate, model, category, rental_lat=None, rental_lng=None):
-        """Add a new car to the fleet using appropriate factory"""
-        # Get the factory for this category
-        factory_class = self.FACTORY_MAP.get(category)
-        if not factory_class:
-            return {'success': False, 'message': f'Invalid category: {category}'}
-        
-        factory = factory_class()
-        
-        # Create car configuration from factory
-        car_config = factory.create_car()
-        tracker_config = factory.create_tracker()
-        access_config = factory.create_access_system()
-        maintenance_config = factory.create_maintenance_profile()
-        
-        # Save to database with tracker information
-        car = CarRepository.create(
-            license_plate=license_plate,
-            model=model,
-            category=category,
-            price_tier=car_config['price_tier'],
-            tracker_type=tracker_config['type'],
-            tracker_update_interval=tracker_config['update_interval'],
-            rental_lat=rental_lat,
-            rental_lng=rental_lng
-        )
-        
-        return {
-            'success': True,
-            'car': car,
-            'config': car_config,
-            'tracker': tracker_config,
-            'access': access_config,
-            'maintenance': maintenance_config
-        }
-    
-    def get_all_cars(self):
-        """Get all cars in the fleet"""
-        return CarRepository.get_all()
-    
-    def get_car_by_id(self, car_id):
-        """Get a specific car by ID"""
-        return CarRepository.get_by_id(car_id)
-    
-    def get_cars_by_status(self, status):
-        """Get cars filtered by status"""
-        return CarRepository.get_by_status(status)
-    
-    def get_available_cars(self):
-        """Get all available cars"""
-        return CarRepository.get_available_cars()
-    
-    def update_car_status(self, car_id, new_status):
-        """Update car status"""
-        car = CarRepository.update_status(car_id, new_status)
-        
-        # Notify observers of status change
-        if car:
-            self.notification_system.notify('car_status_changed', {
-                'car_id': car_id,
-                'license_plate': car.license_plate,
-                'new_status': new_status
-            })
-        
-        return car
-    
-    def get_fleet_statistics(self):
-        """Get fleet statistics"""
-        all_cars = self.get_all_cars()
-        
-        stats = {
-            'total_cars': len(all_cars),
-            'available_cars': len([c for c in all_cars if c.status == 'available']),
-            'booked_cars': len([c for c in all_cars if c.status == 'booked']),
-            'in_service_cars': len([c for c in all_cars if c.status == 'in_service']),
-            'maintenance_cars': len([c for c in all_cars if c.status == 'maintenance']),
-            'out_of_range_cars': len([c for c in all_cars if c.status == 'out_of_range'])
-        }
-        
-        return stats
+from app.data.car_repository import CarRepository
+from app.data.unit_of_work import UnitOfWork
+from app.domain.geofence import GeofenceEvaluator
+from app.domain.spatial_grid import SpatialGrid
+from app.patterns.abstact_factory.economy_vehicle_factory import EconomyVehicleFactory
+from app.patterns.abstact_factory.luxury_vehicle_factory import LuxuryVehicleFactory
+from app.patterns.abstact_factory.suv_vehicle_factory import SUVVehicleFactory
+from app.patterns.observer.subject import Subject
+from app.patterns.observer.admin_notifier import AdminNotifier
+from app.patterns.state.transitions import StateTransitions
+from config import Config
+import threading
+import time
+
+class FleetService:
+    """Service for managing fleet operations using Abstract Factory pattern"""
+    
+    FACTORY_MAP = {
+        'economy': EconomyVehicleFactory,
+        'luxury': LuxuryVehicleFactory,
+        'suv': SUVVehicleFactory
+    }
+    
+    STATUSES = ('available', 'booked', 'in_service', 'maintenance', 'out_of_range')
+    
+    MAX_BULK_SIZE = 10000
+    
+    # Statistics cache shared by every FleetService instance in the worker
+    _stats_cache = None
+    _stats_cached_at = 0.0
+    _stats_lock = threading.Lock()
+    
+    def __init__(self):
+        self.notification_system = Subject()
+        self.notification_system.attach(AdminNotifier())
+    
+    def add_car(self, license_plate, model, category, rental_lat=None, rental_lng=None):
+        """Add a new car to the fleet using appropriate factory"""
+        # Get the factory for this category
+        factory_class = self.FACTORY_MAP.get(category)
+        if not factory_class:
+            return {'success': False, 'message': f'Invalid category: {category}'}
+        
+        factory = factory_class()
+        
+        # Create car configuration from factory
+        car_config = factory.create_car()
+        tracker_config = factory.create_tracker()
+        access_config = factory.create_access_system()
+        maintenance_config = factory.create_maintenance_profile()
+        
+        # Save to database with tracker information
+        car = CarRepository.create(
+            license_plate=license_plate,
+            model=model,
+            category=category,
+            price_tier=car_config['price_tier'],
+            tracker_type=tracker_config['type'],
+            tracker_update_interval=tracker_config['update_interval'],
+            rental_lat=rental_lat,
+            rental_lng=rental_lng,
+            interval_km=maintenance_config['interval_km']
+        )
+        self.invalidate_statistics()
+        
+        return {
+            'success': True,
+            'car': car,
+            'config': car_config,
+            'tracker': tracker_config,
+            'access': access_config,
+            'maintenance': maintenance_config
+        }
+    
+    def get_all_cars(self):
+        """Get all cars in the fleet"""
+        return CarRepository.get_all()
+    
+    def get_car_by_id(self, car_id):
+        """Get a specific car by ID"""
+        return CarRepository.get_by_id(car_id)
+    
+    def get_cars_by_status(self, status):
+        """Get cars filtered by status"""
+        return CarRepository.get_by_status(status)
+    
+    def get_cars_page(self, status=None, category=None, limit=50, offset=0, after_id=None):
+        """Get one page of cars with filters applied in SQL"""
+        return CarRepository.get_page(status, category, limit, offset, after_id)
+    
+    def count_cars(self, status=None, category=None):
+        """Count cars matching the given filters"""
+        return CarRepository.count(status, category)
+    
+    def get_nearby_cars(self, latitude, longitude, radius_km, status=None, limit=50):
+        """Get (car, distance_km) pairs within radius_km, nearest first
+
+        Candidates come from the location_cell index; exact haversine
+        distances are then computed only for those candidates.
+        """
+        candidates = CarRepository.get_in_cells(
+            SpatialGrid.cell_ranges(latitude, longitude, radius_km), status)
+        if not candidates:
+            return []
+        
+        distances = GeofenceEvaluator(radius_km).distances(
+            [car.current_location_lat for car in candidates],
+            [car.current_location_lng for car in candidates],
+            [latitude] * len(candidates),
+            [longitude] * len(candidates)
+        ).tolist()
+        
+        nearby = [(car, distance) for car, distance in zip(candidates, distances)
+                  if distance <= radius_km]
+        nearby.sort(key=lambda pair: pair[1])
+        return nearby[:limit]
+    
+    def get_available_cars(self):
+        """Get all available cars"""
+        return CarRepository.get_available_cars()
+    
+    def validate_status_changes(self, car_ids, new_status):
+        """Check a status change for many cars against the State transition table
+
+        Reads only (id, status) pairs. Returns (allowed car ids, {car_id:
+        reason} for the cars that cannot make the change).
+        """
+        return self._check_status_changes(car_ids, CarRepository.get_statuses(car_ids), new_status)
+    
+    @staticmethod
+    def _check_status_changes(car_ids, statuses, new_status):
+        """Split car ids by whether their current status can change to `new_status`"""
+        allowed = []
+        refused = {}
+        for car_id in car_ids:
+            current = statuses.get(car_id)
+            reason = 'Car not found' if current is None else StateTransitions.check(current, new_status)
+            if reason:
+                refused[car_id] = reason
+            else:
+                allowed.append(car_id)
+        return allowed, refused
+    
+    def update_car_status(self, car_id, new_status):
+        """Update car status if the State pattern allows the transition"""
+        with UnitOfWork():
+            car = CarRepository.lock_by_id(car_id)
+            if not car:
+                return {'success': False, 'message': 'Car not found', 'not_found': True}
+            reason = StateTransitions.check(car.status, new_status)
+            if reason:
+                return {'success': False, 'message': reason}
+            old_status = car.status
+            CarRepository.update_status(car_id, new_status)
+        
+        # Notify observers of status change
+        self.invalidate_statistics()
+        self.notification_system.notify('car_status_changed', {
+            'car_id': car_id,
+            'license_plate': car.license_plate,
+            'old_status': old_status,
+            'new_status': new_status
+        })
+        
+        return {'success': True, 'car': car}
+    
+    def bulk_update_status(self, car_ids, new_status):
+        """Move many cars to `new_status` in one transaction
+
+        Cars are locked and validated against the State transition table,
+        the allowed ones are updated with set-based UPDATEs and one
+        aggregated `fleet_status_changed` event is sent. Cars that cannot
+        make the change are reported individually in `failed`.
+        """
+        if new_status not in StateTransitions.STATES:
+            return {'success': False, 'message': f'Invalid status: {new_status}'}
+        car_ids = list(dict.fromkeys(car_ids))
+        if len(car_ids) > self.MAX_BULK_SIZE:
+            return {'success': False, 'message': f'Bulk update exceeds {self.MAX_BULK_SIZE} cars'}
+        
+        with UnitOfWork():
+            statuses = CarRepository.get_statuses(car_ids, lock=True)
+            allowed, refused = self._check_status_changes(car_ids, statuses, new_status)
+            if allowed:
+                # Leaving maintenance schedules the next service (see update_status)
+                CarRepository.bulk_mark_serviced(
+                    [car_id for car_id in allowed if statuses[car_id] == 'maintenance'])
+                CarRepository.bulk_update_status(allowed, new_status)
+        
+        if allowed:
+            self.invalidate_statistics()
+            self.notification_system.notify('fleet_status_changed', {
+                'new_status': new_status,
+                'car_ids': allowed,
+                'count': len(allowed),
+                'failed': len(refused)
+            })
+        
+        return {
+            'success': True,
+            'updated': allowed,
+            'failed': [{'car_id': car_id, 'error': reason} for car_id, reason in refused.items()]
+        }
+    
+    def get_fleet_statistics(self, max_age=None):
+        """Get fleet statistics from one GROUP BY query
+
+        Results are cached for `max_age` seconds (default
+        `Config.FLEET_STATS_CACHE_TTL`); pass 0 to always hit the database.
+        """
+        if max_age is None:
+            max_age = Config.FLEET_STATS_CACHE_TTL
+        
+        cls = type(self)
+        with cls._stats_lock:
+            if cls._stats_cache is not None and time.monotonic() - cls._stats_cached_at < max_age:
+                return dict(cls._stats_cache)
+        
+        by_status = dict.fromkeys(self.STATUSES, 0)
+        by_category = {category: 0 for category in self.FACTORY_MAP}
+        total = 0
+        for status, category, count in CarRepository.count_by_status_and_category():
+            total += count
+            by_status[status] = by_status.get(status, 0) + count
+            by_category[category] = by_category.get(category, 0) + count
+        
+        stats = {
+            'total_cars': total,
+            'available_cars': by_status['available'],
+            'booked_cars': by_status['booked'],
+            'in_service_cars': by_status['in_service'],
+            'maintenance_cars': by_status['maintenance'],
+            'out_of_range_cars': by_status['out_of_range'],
+            'by_category': by_category
+        }
+        
+        with cls._stats_lock:
+            cls._stats_cache = stats
+            cls._stats_cached_at = time.monotonic()
+        
+        return dict(stats)
+    
+    @classmethod
+    def invalidate_statistics(cls):
+        """Drop cached statistics after a fleet change made in this worker"""
+        with cls._stats_lock:
+            cls._stats_cache = None
@@ -0,0 +1,205 @@
+from app.data.car_repository import CarRepository
+from app.data.unit_of_work import UnitOfWork
+from app.patterns.observer.admin_notifier import AdminNotifier
+from app.patterns.observer.alert_logger import AlertLogger
+from app.patterns.observer.event_bus import EventBus
+from app.patterns.observer.subject import Subject
+from app.services.tracking_stream import TrackingStream
+from config import Config
+from datetime import datetime, timedelta
+import atexit
+import heapq
+import threading
+
+class HeartbeatMonitor:
+    """Detects trackers that stopped reporting, without scanning history
+
+    Every fix TrackingService publishes on the event bus moves the car's
+    deadline to its fix time plus `TRACKER_OFFLINE_MISSED_INTERVALS` update
+    intervals. Deadlines live in a min-heap (O(log n) per fix, superseded
+    entries are skipped when popped) and a background thread sleeps until
+    the earliest one. A car whose deadline passes is flagged offline with a
+    conditional UPDATE, so only one worker emits its `tracker_offline`
+    event; its next fix clears the flag.
+    """
+
+    DEFAULT_INTERVAL = 300  # seconds, BasicGPS
+
+    # Seconds to sleep when no deadline is pending
+    IDLE_WAIT = 60
+    
+    # Seconds before an expired car whose offline flag could not be written is retried
+    RETRY_DELAY = 30
+
+    _heap = []  # (deadline, car_id), may hold superseded entries
+    _deadlines = {}  # car_id -> (deadline, last_seen, interval)
+    _offline = set()
+    _reported = set()  # offline cars that reported again, flag to clear
+    _changed = threading.Condition()
+    _app = None
+    _thread = None
+    _stopped = threading.Event()
+    _notification_system = None
+
+    @classmethod
+    def start(cls, app):
+        """Subscribe to tracking events and start the monitor thread (once)"""
+        with cls._changed:
+            if cls._thread is not None:
+                return
+            cls._app = app
+            cls._thread = threading.Thread(target=cls._run, name='heartbeat-monitor', daemon=True)
+        EventBus.shared().subscribe(cls._receive)
+        cls._thread.start()
+        atexit.register(cls.stop)
+
+    @classmethod
+    def stop(cls):
+        """Stop the monitor thread"""
+        cls._stopped.set()
+        with cls._changed:
+            cls._changed.notify_all()
+
+    @classmethod
+    def _receive(cls, event_id, event_type, data):
+        """Event bus subscriber: record the fixes of a tracking update"""
+        if event_type != TrackingStream.EVENT_TYPE:
+            return
+        for patch in data.get('cars', []):
+            if 'timestamp' in patch:
+                cls.record(patch['car_id'], datetime.fromisoformat(patch['timestamp']),
+                           patch.get('tracker_update_interval'))
+
+    @classmethod
+    def record(cls, car_id, timestamp, interval):
+        """Move a car's deadline after a fix"""
+        interval = interval or cls.DEFAULT_INTERVAL
+        deadline = timestamp + timedelta(seconds=interval * Config.TRACKER_OFFLINE_MISSED_INTERVALS)
+        with cls._changed:
+            current = cls._deadlines.get(car_id)
+            if current and current[1] >= timestamp:
+                return
+            cls._deadlines[car_id] = (deadline, timestamp, interval)
+            heapq.heappush(cls._heap, (deadline, car_id))
+            if len(cls._heap) > 4 * len(cls._deadlines) + 64:
+                # Drop superseded entries once they dominate the heap
+                cls._heap = [(entry[0], key) for key, entry in cls._deadlines.items()]
+                heapq.heapify(cls._heap)
+
+            if car_id in cls._offline:
+                cls._offline.discard(car_id)
+                cls._reported.add(car_id)
+                cls._changed.notify_all()
+            elif cls._heap[0] == (deadline, car_id):
+                cls._changed.notify_all()  # earlier than what the thread waits for
+
+    @classmethod
+    def _run(cls):
+        """Seed deadlines from the cars table, then wait for them to pass"""
+        cls._seed()
+        while not cls._stopped.is_set():
+            with cls._changed:
+                expired, reported = cls._collect()
+                if not (expired or reported):
+                    cls._changed.wait(cls._next_wait())
+                    continue
+            cls._process(expired, reported)
+
+    @classmethod
+    def _seed(cls):
+        """Start from every car's last known fix (one cars query, no history scan)"""
+        try:
+            with cls._app.app_context():
+                rows = CarRepository.get_heartbeat_rows()
+        except Exception:
+            cls._app.logger.exception('Heartbeat monitor could not load trackers')
+            return
+        for car_id, last_seen, interval, offline in rows:
+            cls.record(car_id, last_seen, interval)
+            if offline:
+                with cls._changed:
+                    cls._offline.add(car_id)
+
+    @classmethod
+    def _collect(cls):
+        """Pop the deadlines that passed (caller holds the lock)"""
+        now = datetime.now()
+        expired = []
+        while cls._heap and cls._heap[0][0] <= now:
+            deadline, car_id = heapq.heappop(cls._heap)
+            current = cls._deadlines.get(car_id)
+            if current is None or current[0] != deadline or car_id in cls._offline:
+                continue
+            cls._offline.add(car_id)
+            expired.append((car_id, current[1], current[2]))
+        reported, cls._reported = cls._reported, set()
+        return expired, reported
+
+    @classmethod
+    def _next_wait(cls):
+        """Seconds until the earliest deadline (caller holds the lock)"""
+        if not cls._heap:
+            return cls.IDLE_WAIT
+        remaining = (cls._heap[0][0] - datetime.now()).total_seconds()
+        return min(max(remaining, 0), cls.IDLE_WAIT)
+
+    @classmethod
+    def _process(cls, expired, reported):
+        """Write offline flag changes and notify observers of new offline trackers"""
+        pending = {car_id: (last_seen, interval) for car_id, last_seen, interval in expired}
+        try:
+            with cls._app.app_context():
+                if reported:
+                    with UnitOfWork():
+                        CarRepository.clear_tracker_offline(reported)
+
+                now = datetime.now()
+                claimed = {}
+                for car_id, last_seen, interval in expired:
+                    with cls._changed:
+                        if car_id not in cls._offline:
+                            continue  # reported again meanwhile
+                    with UnitOfWork():
+                        if CarRepository.mark_tracker_offline(car_id, last_seen, now):
+                            claimed[car_id] = (last_seen, interval)
+                    del pending[car_id]
+                if not claimed:
+                    return
+
+                notification_system = cls._get_notification_system()
+                for car in CarRepository.get_by_ids(list(claimed)):
+                    last_seen, interval = claimed[car.id]
+                    notification_system.notify('tracker_offline', {
+                        'car_id': car.id,
+                        'license_plate': car.license_plate,
+                        'model': car.model,
+                        'tracker_type': car.tracker_type or 'BasicGPS',
+                        'last_seen': last_seen.isoformat(),
+                        'tracker_update_interval': interval,
+                        'silent_seconds': int((now - last_seen).total_seconds())
+                    })
+        except Exception:
+            cls._app.logger.exception('Heartbeat monitor failed to process trackers')
+            cls._retry(pending)
+    
+    @classmethod
+    def _retry(cls, pending):
+        """Reschedule expired cars whose offline flag was not written"""
+        retry_at = datetime.now() + timedelta(seconds=cls.RETRY_DELAY)
+        with cls._changed:
+            for car_id, (last_seen, interval) in pending.items():
+                current = cls._deadlines.get(car_id)
+                if car_id not in cls._offline or current is None or current[1] != last_seen:
+                    continue  # reported again meanwhile
+                cls._offline.discard(car_id)
+                cls._deadlines[car_id] = (retry_at, last_seen, interval)
+                heapq.heappush(cls._heap, (retry_at, car_id))
+
+    @classmethod
+    def _get_notification_system(cls):
+        """Subject notifying admins of offline trackers (created on first use)"""
+        if cls._notification_system is None:
+            cls._notification_system = Subject(async_dispatch=True)
+            cls._notification_system.attach(AdminNotifier())
+            cls._notification_system.attach(AlertLogger())
+        return cls._notification_system
@@ -0,0 +1,98 @@
+from app.data.location_repository import LocationRepository
+from app.data.unit_of_work import UnitOfWork
+from app.domain.track_simplifier import TrackSimplifier
+from config import Config
+from datetime import datetime, timedelta
+
+class HistoryCompactionService:
+    """Simplifies location history older than the full-resolution period
+
+    Each car's old history is processed one day at a time: the day's track
+    is simplified with `TrackSimplifier` and the dropped rows are deleted in
+    batches of `batch_size`, each batch in its own short transaction. Only
+    rows older than the cutoff are touched, so tracking ingest can keep
+    inserting while a compaction runs. A per-car watermark records the
+    compacted days, so later runs only look at days that have aged past
+    the cutoff since.
+    """
+
+    WINDOW = timedelta(days=1)
+
+    def __init__(self, keep_days=None, method=None, tolerance_m=None, bucket_seconds=None,
+                 batch_size=None):
+        self.keep_days = Config.HISTORY_FULL_RESOLUTION_DAYS if keep_days is None else keep_days
+        self.batch_size = Config.HISTORY_COMPACTION_BATCH_SIZE if batch_size is None else batch_size
+        if self.batch_size <= 0:
+            raise ValueError("Compaction batch size must be positive")
+        self.simplifier = TrackSimplifier(
+            Config.HISTORY_COMPACTION_METHOD if method is None else method,
+            tolerance_m=Config.HISTORY_TOLERANCE_METERS if tolerance_m is None else tolerance_m,
+            bucket_seconds=Config.HISTORY_BUCKET_SECONDS if bucket_seconds is None else bucket_seconds
+        )
+
+    def get_cutoff(self, now=None):
+        """Get the start of the day before which history is compacted"""
+        cutoff = (now or datetime.now()) - timedelta(days=self.keep_days)
+        return cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def compact(self, now=None, progress=None):
+        """Compact every car's old history
+
+        `progress(car_id, day, scanned, deleted)` is called after each day.
+        """
+        cutoff = self.get_cutoff(now)
+        totals = {'cutoff': cutoff, 'cars': 0, 'days': 0, 'scanned': 0, 'deleted': 0}
+
+        for car_id in LocationRepository.get_car_ids():
+            days = self.compact_car(car_id, cutoff, progress)
+            if days:
+                totals['cars'] += 1
+                totals['days'] += len(days)
+                totals['scanned'] += sum(scanned for scanned, _ in days)
+                totals['deleted'] += sum(deleted for _, deleted in days)
+        return totals
+
+    def compact_car(self, car_id, cutoff, progress=None):
+        """Compact one car's days before `cutoff`; get [(scanned, deleted)] per day"""
+        start = LocationRepository.get_compacted_until(car_id)
+        if start is None:
+            first = LocationRepository.get_first_timestamp(car_id, cutoff)
+            if first is None:
+                return []
+            start = first.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        days = []
+        while start < cutoff:
+            end = min(start + self.WINDOW, cutoff)
+            scanned, deleted = self._compact_window(car_id, start, end)
+            if scanned:
+                days.append((scanned, deleted))
+                if progress:
+                    progress(car_id, start, scanned, deleted)
+                start = end
+                continue
+            # Skip straight to the next day with history
+            following = LocationRepository.get_first_timestamp(car_id, cutoff, after=end)
+            if following is None:
+                with UnitOfWork():
+                    LocationRepository.set_compacted_until(car_id, cutoff)
+                break
+            start = following.replace(hour=0, minute=0, second=0, microsecond=0)
+        return days
+
+    def _compact_window(self, car_id, start, end):
+        """Simplify one car's track in [start, end) and advance its watermark"""
+        rows = LocationRepository.get_track(car_id, start, end)
+        dropped = []
+        if rows:
+            ids, latitudes, longitudes, timestamps, out_of_range = zip(*rows)
+            keep = self.simplifier.keep_mask(latitudes, longitudes, timestamps,
+                                             [bool(flag) for flag in out_of_range])
+            dropped = [row_id for row_id, kept in zip(ids, keep) if not kept]
+
+        for i in range(0, len(dropped), self.batch_size):
+            with UnitOfWork():
+                LocationRepository.delete_ids(dropped[i:i + self.batch_size])
+        with UnitOfWork():
+            LocationRepository.set_compacted_until(car_id, end)
+        return len(rows), len(dropped)
@@ -0,0 +1,128 @@
+from app.data.car_repository import CarRepository
+from app.data.unit_of_work import UnitOfWork
+from app.patterns.observer.event_bus import EventBus
+from app.services.tracking_stream import TrackingStream
+from config import Config
+from flask import current_app
+import atexit
+import threading
+
+class PositionCache:
+    """Write-behind cache of every tracked car's last known position
+
+    TrackingService records each car's newest fix here instead of updating
+    the cars row on every fix. The cache is shared by every instance in the
+    worker. A background thread writes the positions that changed to
+    `cars.current_location_*` in one batched UPDATE every
+    `Config.POSITION_FLUSH_INTERVAL` seconds and at shutdown. LocationHistory
+    rows are still inserted per fix, so they remain the durable record.
+
+    Live tracking patches are coalesced the same way: the newest patch per
+    car is kept and all of them are published as one event bus message per
+    flush, so a fix never costs an extra outbox write on the request thread.
+    """
+
+    _positions = {}  # car_id -> (latitude, longitude, timestamp)
+    _dirty = set()
+    _patches = {}  # car_id -> live tracking patch waiting to be published
+    _lock = threading.Lock()
+    _app = None
+    _thread = None
+    _stopped = threading.Event()
+
+    @classmethod
+    def put(cls, car_id, latitude, longitude, timestamp):
+        """Record a fix unless a newer one is already cached"""
+        with cls._lock:
+            cached = cls._positions.get(car_id)
+            if cached and cached[2] >= timestamp:
+                return
+            cls._positions[car_id] = (latitude, longitude, timestamp)
+            cls._dirty.add(car_id)
+        cls._start()
+
+    @classmethod
+    def add_patches(cls, patches):
+        """Queue live tracking patches, merged per car, for the next flush"""
+        with cls._lock:
+            for patch in patches:
+                previous = cls._patches.get(patch['car_id'])
+                cls._patches[patch['car_id']] = dict(previous, **patch) if previous else patch
+        cls._start()
+
+    @classmethod
+    def publish_patches(cls):
+        """Publish the queued patches as one event (needs an app context)"""
+        with cls._lock:
+            patches, cls._patches = list(cls._patches.values()), {}
+        if patches:
+            EventBus.shared().publish(TrackingStream.EVENT_TYPE, {'cars': patches})
+        return len(patches)
+
+    @classmethod
+    def get(cls, car_id):
+        """Get the cached (latitude, longitude, timestamp) of a car, if any"""
+        with cls._lock:
+            return cls._positions.get(car_id)
+
+    @classmethod
+    def get_many(cls, car_ids):
+        """Get cached positions for many cars as a dict"""
+        with cls._lock:
+            return {car_id: cls._positions[car_id] for car_id in car_ids if car_id in cls._positions}
+
+    @classmethod
+    def flush(cls):
+        """Write positions changed since the last flush (needs an app context)"""
+        with cls._lock:
+            rows = [(car_id,) + cls._positions[car_id] for car_id in cls._dirty]
+            cls._dirty.clear()
+        if not rows:
+            return 0
+
+        try:
+            with UnitOfWork():
+                CarRepository.bulk_update_positions(rows)
+        except Exception:
+            # Keep them for the next flush unless a newer fix has arrived
+            with cls._lock:
+                cls._dirty.update(row[0] for row in rows)
+            raise
+        return len(rows)
+
+    @classmethod
+    def _start(cls):
+        """Start the flush thread on first use"""
+        if cls._thread is not None:
+            return
+        with cls._lock:
+            if cls._thread is not None:
+                return
+            cls._app = current_app._get_current_object()
+            cls._thread = threading.Thread(target=cls._run, name='position-flush', daemon=True)
+            cls._thread.start()
+        atexit.register(cls._shutdown)
+
+    @classmethod
+    def _run(cls):
+        """Flush on a fixed interval until shutdown"""
+        while not cls._stopped.wait(Config.POSITION_FLUSH_INTERVAL):
+            cls._flush_in_app()
+
+    @classmethod
+    def _flush_in_app(cls):
+        with cls._app.app_context():
+            try:
+                cls.flush()
+            except Exception as e:
+                print(f"Error flushing car positions: {e}")
+            try:
+                cls.publish_patches()
+            except Exception as e:
+                print(f"Error publishing tracking patches: {e}")
+
+    @classmethod
+    def _shutdown(cls):
+        """Stop the flush thread and write what is still pending"""
+        cls._stopped.set()
+        cls._flush_in_app()
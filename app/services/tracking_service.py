@@ -1,93 +1,498 @@
-from app.data.car_repository import CarRepository
-from app.models import db, LocationHistory
-from app.patterns.observer.subject import Subject
-from app.patterns.observer.admin_notifier import AdminNotifier
-from app.patterns.observer.alert_logger import AlertLogger
-from app.domain.location import Location
-from config import Config
-from datetime import datetime
-
-class TrackingService:
-    """Service for tracking car locations and detecting out-of-range vehicles"""
-    
-    def __init__(self):
-        self.notification_system = Subject()
-        # Attach observers (Observer Pattern)
-        self.notification_system.attach(AdminNotifier())
-        self.notification_system.attach(AlertLogger())
-        self.max_distance = Config.MAX_ALLOWED_DISTANCE
-    
-    def update_location(self, car_id, latitude, longitude):
-        """Update car location and check for out-of-range"""
-        car = CarRepository.get_by_id(car_id)
-        if not car:
-            return {'success': False, 'message': 'Car not found'}
-        
-        # Update current location
-        CarRepository.update_location(car_id, latitude, longitude)
-        
-        # Save to location history
-        location_record = LocationHistory(
-            car_id=car_id,
-            latitude=latitude,
-            longitude=longitude,
-            timestamp=datetime.now()
-        )
-        
-        # Check if out of range
-        if car.rental_location_lat and car.rental_location_lng:
-            car_domain = CarRepository.to_domain(car)
-            is_out_of_range = car_domain.is_out_of_range(self.max_distance)
-            
-            location_record.is_out_of_range = is_out_of_range
-            
-            if is_out_of_range and car.status != 'out_of_range':
-                # Car just went out of range
-                CarRepository.update_status(car_id, 'out_of_range')
-                
-                # Send alert with comprehensive vehicle details
-                self.notification_system.notify('car_out_of_range', {
-                    'car_id': car_id,
-                    'license_plate': car.license_plate,
-                    'model': car.model,
-                    'category': car.category,
-                    'tracker_type': car.tracker_type or 'BasicGPS',
-                    'distance': car_domain.calculate_distance_from_rental(),
-                    'max_allowed': self.max_distance,
-                    'current_location': (latitude, longitude),
-                    'rental_location': (car.rental_location_lat, car.rental_location_lng)
-                })
-            
-            elif not is_out_of_range and car.status == 'out_of_range':
-                # Car returned to range
-                CarRepository.update_status(car_id, 'booked')  # or available
-                
-                self.notification_system.notify('car_returned_to_range', {
-                    'car_id': car_id,
-                    'license_plate': car.license_plate,
-                    'model': car.model
-                })
-        
-        db.session.add(location_record)
-        db.session.commit()
-        
-        return {
-            'success': True,
-            'location': {
-                'latitude': location_record.latitude,
-                'longitude': location_record.longitude,
-                'timestamp': location_record.timestamp.isoformat(),
-                'is_out_of_range': location_record.is_out_of_range
-            },
-            'is_out_of_range': location_record.is_out_of_range
-        }
-    
-    def get_location_history(self, car_id, limit=50):
-        """Get location history for a car"""
-        return LocationHistory.query.filter_by(car_id=car_id)\
-            .order_by(LocationHistory.timestamp.desc())\
-            .limit(limit).all()
-    
-    def get_out_of_range_cars(self):
-        """Get all cars currently out of range"""
-        return CarRepository.get_by_status('out_of_range')
+from app.data.car_repository import CarRepository
+from app.data.location_repository import LocationRepository
+from app.data.track_archive import TrackArchive
+from app.data.unit_of_work import UnitOfWork
+from app.domain.geofence import GeofenceEvaluator
+from app.domain.ingest_policy import IngestPolicy
+from app.patterns.observer.subject import Subject
+from app.patterns.observer.admin_notifier import AdminNotifier
+from app.patterns.observer.alert_logger import AlertLogger
+from app.services.position_cache import PositionCache
+from config import Config
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+import numpy as np
+import threading
+
+class TrackingService:
+    """Service for tracking car locations and detecting out-of-range vehicles"""
+
+    MAX_BATCH_SIZE = 10000
+
+    # Last history fix stored per car, shared by every instance in the worker
+    _last_stored = {}
+    _last_stored_lock = threading.Lock()
+
+    def __init__(self):
+        # Alerts are logged off the request thread (async dispatch)
+        self.notification_system = Subject(async_dispatch=True)
+        # Attach observers (Observer Pattern)
+        self.notification_system.attach(AdminNotifier())
+        self.notification_system.attach(AlertLogger())
+        self.max_distance = Config.MAX_ALLOWED_DISTANCE
+        self.exit_distance = Config.GEOFENCE_EXIT_DISTANCE
+        self.reentry_distance = Config.GEOFENCE_REENTRY_DISTANCE
+        self.min_dwell = Config.GEOFENCE_MIN_DWELL_SECONDS
+        self.alert_window = Config.GEOFENCE_ALERT_WINDOW_SECONDS
+        self.geofence = GeofenceEvaluator(self.exit_distance)
+        self.ingest_policy = IngestPolicy(Config.LOCATION_MIN_MOVE_METERS)
+        self.max_speed = Config.ODOMETER_MAX_SPEED_KMH
+        self.archive = TrackArchive()
+
+    def update_location(self, car_id, latitude, longitude):
+        """Update car location and check for out-of-range"""
+        result = self.ingest_batch([{
+            'car_id': car_id,
+            'lat': latitude,
+            'lng': longitude
+        }])
+
+        if not result['success']:
+            return result
+        if result['rejected']:
+            return {'success': False, 'message': result['rejected'][0]['error']}
+
+        fix = result['fixes'][0]
+        return {
+            'success': True,
+            'location': {
+                'latitude': fix['latitude'],
+                'longitude': fix['longitude'],
+                'timestamp': fix['timestamp'].isoformat(),
+                'is_out_of_range': fix['is_out_of_range']
+            },
+            'is_out_of_range': fix['is_out_of_range']
+        }
+
+    def ingest_batch(self, points):
+        """Ingest many GPS fixes in a single transaction
+
+        Each point is a dict with car_id, lat/latitude, lng/longitude and an
+        optional ts/timestamp (ISO 8601 string or epoch seconds). History rows
+        are bulk-inserted and status changes written in one transaction,
+        each car's last position goes to the write-behind PositionCache, and
+        observers are notified only after the commit succeeds. Fixes faster
+        than the car's tracker interval or barely moved are not stored in
+        history (see IngestPolicy), except those that change range status.
+        """
+        if len(points) > self.MAX_BATCH_SIZE:
+            return {'success': False, 'message': f'Batch exceeds {self.MAX_BATCH_SIZE} points'}
+
+        fixes, rejected = self._parse_points(points)
+        cars = {car.id: car for car in CarRepository.get_by_ids({f['car_id'] for f in fixes})}
+
+        # Geofence every fix of the batch in one vectorized pass
+        fixes.sort(key=itemgetter('car_id', 'timestamp'))
+        rejected.extend({'index': f['index'], 'error': 'Car not found'}
+                        for f in fixes if f['car_id'] not in cars)
+        fixes = [f for f in fixes if f['car_id'] in cars]
+        self._evaluate_geofence(fixes, cars)
+
+        # Apply each car's fixes in time order
+        last_stored = self._get_last_stored({f['car_id'] for f in fixes})
+        previous = self._get_previous_positions(cars.values())
+        history_rows = []
+        events = []
+        last_fixes = []
+        for car_id, car_fixes in groupby(fixes, key=itemgetter('car_id')):
+            car = cars[car_id]
+            car_fixes = list(car_fixes)
+            events.extend(self._apply_range_transitions(car, car_fixes))
+            events.extend(self._advance_odometer(car, car_fixes, previous.get(car_id)))
+            last_fixes.append(car_fixes[-1])
+
+            for fix in car_fixes:
+                if not (fix.get('transition') or self.ingest_policy.should_store(
+                        fix, last_stored.get(car_id), car.tracker_update_interval)):
+                    continue
+                history_rows.append({
+                    'car_id': car_id,
+                    'latitude': fix['latitude'],
+                    'longitude': fix['longitude'],
+                    'is_out_of_range': fix['is_out_of_range'],
+                    'timestamp': fix['timestamp']
+                })
+                last_stored[car_id] = (fix['latitude'], fix['longitude'], fix['timestamp'])
+
+        # Built before the commit expires the loaded cars
+        patches = [{
+            'car_id': fix['car_id'],
+            'latitude': fix['latitude'],
+            'longitude': fix['longitude'],
+            'timestamp': fix['timestamp'].isoformat(),
+            'status': cars[fix['car_id']].status,
+            'tracker_update_interval': cars[fix['car_id']].tracker_update_interval
+        } for fix in last_fixes]
+
+        with UnitOfWork():
+            LocationRepository.bulk_add(history_rows)
+
+        with self._last_stored_lock:
+            self._last_stored.update(last_stored)
+
+        # Last positions are written behind, in batches (see PositionCache)
+        for fix in last_fixes:
+            PositionCache.put(fix['car_id'], fix['latitude'], fix['longitude'], fix['timestamp'])
+
+        for event_type, data in events:
+            self.notification_system.notify(event_type, data)
+        self._publish_patches(patches)
+
+        fixes.sort(key=itemgetter('index'))
+        rejected.sort(key=itemgetter('index'))
+        return {
+            'success': True,
+            'accepted': len(fixes),
+            'stored': len(history_rows),
+            'rejected': rejected,
+            'cars_updated': len({f['car_id'] for f in fixes}),
+            'out_of_range': sorted({d['car_id'] for e, d in events if e == 'car_out_of_range'}),
+            'fixes': fixes
+        }
+
+    def _get_last_stored(self, car_ids):
+        """Get the last stored history fix per car, loading unknown cars in one query"""
+        with self._last_stored_lock:
+            known = {car_id: self._last_stored[car_id] for car_id in car_ids
+                     if car_id in self._last_stored}
+        missing = [car_id for car_id in car_ids if car_id not in known]
+        if missing:
+            known.update(LocationRepository.get_last_points(missing))
+        return known
+
+    @staticmethod
+    def _get_previous_positions(cars):
+        """Get {car_id: (latitude, longitude, timestamp)} of each car's last known fix"""
+        previous = PositionCache.get_many([car.id for car in cars])
+        for car in cars:
+            if car.id not in previous and car.location_updated_at is not None \
+                    and car.current_location_lat is not None and car.current_location_lng is not None:
+                previous[car.id] = (car.current_location_lat, car.current_location_lng,
+                                    car.location_updated_at)
+        return previous
+
+    def _advance_odometer(self, car, car_fixes, previous):
+        """Add the distance of a car's ordered fixes to its odometer
+
+        Only the legs between consecutive fixes are measured, starting from
+        the last known position, so the cost is O(1) per fix regardless of
+        history. Legs faster than `ODOMETER_MAX_SPEED_KMH` are GPS glitches.
+        Returns a maintenance_required event when the next service is reached.
+        """
+        points = [(f['latitude'], f['longitude'], f['timestamp']) for f in car_fixes]
+        if previous and previous[2] < points[0][2]:
+            points.insert(0, previous)
+        if len(points) < 2:
+            return []
+
+        latitudes, longitudes, timestamps = zip(*points)
+        legs = self.geofence.distances(latitudes[1:], longitudes[1:], latitudes[:-1], longitudes[:-1])
+        hours = np.array([(b - a).total_seconds() for a, b in zip(timestamps, timestamps[1:])]) / 3600
+        distance = float(legs[(hours > 0) & (legs <= hours * self.max_speed)].sum())
+        if not distance:
+            return []
+
+        after = CarRepository.add_odometer(car, distance)
+        before = after - distance
+        if car.service_due_km is None or not before < car.service_due_km <= after:
+            return []
+        return [('maintenance_required', {
+            'car_id': car.id,
+            'license_plate': car.license_plate,
+            'model': car.model,
+            'odometer_km': round(after, 1),
+            'interval_km': car.interval_km,
+            'service_due_km': car.service_due_km
+        })]
+
+    def _evaluate_geofence(self, fixes, cars):
+        """Set distance and is_out_of_range on every fix in one NumPy pass"""
+        rental = [self._rental_location(cars[f['car_id']]) for f in fixes]
+        distances, out_of_range = self.geofence.evaluate(
+            [f['latitude'] for f in fixes],
+            [f['longitude'] for f in fixes],
+            [lat for lat, lng in rental],
+            [lng for lat, lng in rental]
+        )
+        for fix, distance, is_out in zip(fixes, distances.tolist(), out_of_range.tolist()):
+            fix['distance'] = distance
+            fix['is_out_of_range'] = is_out
+
+    @staticmethod
+    def _rental_location(car):
+        """Get a car's rental coordinates, NaN when no rental location is set"""
+        if car.rental_location_lat and car.rental_location_lng:
+            return car.rental_location_lat, car.rental_location_lng
+        return float('nan'), float('nan')
+
+    def _apply_range_transitions(self, car, car_fixes):
+        """Apply out-of-range/returned transitions for a car's ordered fixes
+
+        A car leaves its zone only after staying beyond the exit distance for
+        the minimum dwell time, and counts as back only after staying within
+        the smaller re-entry distance as long (hysteresis), so a car driving
+        along the boundary does not flip status on every fix. Each fix's
+        is_out_of_range is set to the car's resulting status.
+        """
+        events = []
+        for fix in car_fixes:
+            now = fix['timestamp']
+            is_out = car.status == 'out_of_range'
+            if is_out:
+                crossing = fix['distance'] < self.reentry_distance
+            else:
+                crossing = fix['distance'] > self.exit_distance
+            
+            if not crossing:
+                car.range_pending_since = None
+            else:
+                if car.range_pending_since is None:
+                    car.range_pending_since = now
+                if (now - car.range_pending_since).total_seconds() >= self.min_dwell:
+                    car.range_pending_since = None
+                    fix['transition'] = True
+                    if is_out:
+                        # Car returned to range
+                        car.status = 'booked'  # or available
+                    else:
+                        # Car just went out of range
+                        car.status = 'out_of_range'
+                        events.extend(self._out_of_range_alert(
+                            car, fix['distance'], (fix['latitude'], fix['longitude']), now))
+            
+            if car.status != 'out_of_range':
+                events.extend(self._returned_alert(car, now))
+            fix['is_out_of_range'] = car.status == 'out_of_range'
+        return events
+    
+    def _out_of_range_alert(self, car, distance, current_location, now):
+        """Alert for a car leaving its zone, unless its last alert is still open
+
+        An open alert means the admin was told the car is out and has not
+        been told it returned, so a repeat excursion adds nothing new.
+        """
+        if car.range_alert_open:
+            return []
+        car.range_alert_open = True
+        car.range_alert_at = now
+        return [('car_out_of_range', self._out_of_range_event(car, distance, current_location))]
+    
+    def _returned_alert(self, car, now):
+        """Close an open alert once the car is back and the alert window has passed
+
+        Returning within the window is held back, so a car that flaps back
+        out is reported once; a later fix or the next sweep sends the
+        deferred returned alert.
+        """
+        if not car.range_alert_open:
+            return []
+        if car.range_alert_at and (now - car.range_alert_at).total_seconds() < self.alert_window:
+            return []
+        car.range_alert_open = False
+        return [('car_returned_to_range', self._returned_event(car))]
+    
+    def _out_of_range_event(self, car, distance, current_location):
+        """Build the alert payload with comprehensive vehicle details"""
+        return {
+            'car_id': car.id,
+            'license_plate': car.license_plate,
+            'model': car.model,
+            'category': car.category,
+            'tracker_type': car.tracker_type or 'BasicGPS',
+            'distance': distance,
+            'max_allowed': self.max_distance,
+            'current_location': current_location,
+            'rental_location': (car.rental_location_lat, car.rental_location_lng)
+        }
+
+    @staticmethod
+    def _returned_event(car):
+        """Build the payload for a car coming back into its allowed zone"""
+        return {
+            'car_id': car.id,
+            'license_plate': car.license_plate,
+            'model': car.model
+        }
+
+    def sweep_fleet(self):
+        """Re-check every tracked car's last position against its geofence
+
+        Reads only the coordinate columns, evaluates the whole fleet in one
+        vectorized pass and writes status changes with set-based UPDATEs.
+        Meant to be run periodically (see sweep_geofence.py).
+        """
+        PositionCache.flush()
+        rows = CarRepository.get_geofence_rows()
+        if not rows:
+            return {'success': True, 'checked': 0, 'out_of_range': [], 'returned': []}
+
+        car_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        coords = np.array([row[2:6] for row in rows], dtype=np.float64)
+        coords[coords == 0] = np.nan  # unset coordinates, as in the domain check
+        distances, out_of_range = self.geofence.evaluate(
+            coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3])
+
+        # Hysteresis: leave beyond the exit distance, return within re-entry
+        was_out = np.array([row[1] == 'out_of_range' for row in rows], dtype=bool)
+        crossing = np.where(was_out, distances < self.reentry_distance, out_of_range)
+        
+        # Same minimum dwell as ingest: a crossing changes status only once it
+        # has been pending that long; crossings seen first here start the clock
+        now = datetime.now()
+        dwell_start = now - timedelta(seconds=self.min_dwell)
+        pending = np.array([row[6] is not None for row in rows], dtype=bool)
+        dwelled = np.array([row[6] is not None and row[6] <= dwell_start for row in rows], dtype=bool)
+        went_out = car_ids[crossing & dwelled & ~was_out].tolist()
+        came_back = car_ids[crossing & dwelled & was_out].tolist()
+        started = car_ids[crossing & ~pending].tolist()
+        distance_by_id = dict(zip(car_ids.tolist(), distances.tolist()))
+        
+        deferred = CarRepository.get_pending_return_alert_ids(
+            now - timedelta(seconds=self.alert_window))
+        
+        events = []
+        with UnitOfWork():
+            if started:
+                CarRepository.bulk_set_range_pending(started, now)
+            if went_out or came_back:
+                CarRepository.bulk_set_range_pending(went_out + came_back, None)
+            if went_out:
+                CarRepository.bulk_update_status(went_out, 'out_of_range')
+            if came_back:
+                CarRepository.bulk_update_status(came_back, 'booked')
+            
+            for car in CarRepository.get_by_ids(set(went_out + came_back + deferred)):
+                if car.status == 'out_of_range':
+                    events.extend(self._out_of_range_alert(
+                        car, distance_by_id[car.id],
+                        (car.current_location_lat, car.current_location_lng), now))
+                else:
+                    events.extend(self._returned_alert(car, now))
+        
+        for event_type, data in events:
+            self.notification_system.notify(event_type, data)
+        self._publish_patches(
+            [{'car_id': car_id, 'status': 'out_of_range'} for car_id in went_out] +
+            [{'car_id': car_id, 'status': 'booked'} for car_id in came_back])
+        
+        return {
+            'success': True,
+            'checked': len(rows),
+            'out_of_range': went_out,
+            'returned': came_back
+        }
+
+    @staticmethod
+    def _publish_patches(patches):
+        """Queue changed positions and statuses for live tracking views (see TrackingStream)"""
+        if patches:
+            PositionCache.add_patches(patches)
+
+    def _parse_points(self, points):
+        """Validate raw points into fixes, collecting per-point errors"""
+        fixes = []
+        rejected = []
+        now = datetime.now()
+        for index, point in enumerate(points):
+            try:
+                car_id = point['car_id']
+                # JSON integers only, as for bulk status ids: no 1.9, true or "7"
+                if not isinstance(car_id, int) or isinstance(car_id, bool):
+                    raise ValueError('car_id must be an integer')
+                latitude = float(point['lat'] if 'lat' in point else point['latitude'])
+                longitude = float(point['lng'] if 'lng' in point else point['longitude'])
+                if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+                    raise ValueError('coordinates out of bounds')
+                timestamp = self._parse_timestamp(point.get('ts', point.get('timestamp')), now)
+                if timestamp > now + timedelta(seconds=Config.TRACKER_MAX_CLOCK_SKEW_SECONDS):
+                    raise ValueError('timestamp is in the future')
+            except (KeyError, TypeError, ValueError, AttributeError, OverflowError, OSError) as e:
+                rejected.append({'index': index, 'error': f'Invalid point: {e}'})
+                continue
+
+            fixes.append({
+                'index': index,
+                'car_id': car_id,
+                'latitude': latitude,
+                'longitude': longitude,
+                'timestamp': timestamp
+            })
+        return fixes, rejected
+
+    @staticmethod
+    def _parse_timestamp(value, default):
+        """Parse an ISO 8601 string or epoch seconds into a naive local datetime"""
+        if value is None:
+            return default
+        if isinstance(value, bool):
+            raise TypeError('timestamp must be ISO 8601 or epoch seconds')
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value)
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+
+    def get_location_history(self, car_id, limit=50):
+        """Get location history for a car"""
+        return LocationRepository.get_history(car_id, limit)
+
+    def archive_history(self, before=None, progress=None):
+        """Append location history before `before` (default: today) to the track archive
+
+        Only rows newer than each car's last archived fix are exported, so
+        it can run repeatedly. `progress(car_id, archived)` is called per car.
+        """
+        before = before or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        totals = {'cars': 0, 'archived': 0}
+        for car_id in LocationRepository.get_car_ids():
+            after = self.archive.get_last_timestamp(car_id)
+            archived = 0
+            for rows in LocationRepository.iter_track_batches(car_id, after, before):
+                timestamps, latitudes, longitudes, out_of_range = zip(*rows)
+                archived += self.archive.append(car_id, timestamps, latitudes, longitudes,
+                                                [bool(flag) for flag in out_of_range])
+            if archived:
+                totals['cars'] += 1
+                totals['archived'] += archived
+                if progress:
+                    progress(car_id, archived)
+        return totals
+
+    def get_archived_track(self, car_id, start=None, end=None):
+        """Get a car's archived fixes in [start, end) as memory-mapped NumPy columns"""
+        return self.archive.read(car_id, start, end)
+
+    def get_archived_distance(self, car_id, start=None, end=None):
+        """Get the distance in km driven by a car over its archived fixes in [start, end)"""
+        track = self.archive.read(car_id, start, end)
+        if len(track) < 2:
+            return 0.0
+        legs = self.geofence.distances(track.latitude[1:], track.longitude[1:],
+                                       track.latitude[:-1], track.longitude[:-1])
+        return float(legs.sum())
+
+    def get_positions(self, cars):
+        """Get {car_id: (latitude, longitude)} for loaded cars, preferring cached fixes
+
+        A cached fix is used unless the row holds a newer position (e.g. a
+        location reset written directly, or a fix flushed by another worker).
+        """
+        cached = PositionCache.get_many([car.id for car in cars])
+        positions = {}
+        for car in cars:
+            fix = cached.get(car.id)
+            if fix and (car.location_updated_at is None or fix[2] >= car.location_updated_at):
+                positions[car.id] = fix[:2]
+            elif car.current_location_lat is not None and car.current_location_lng is not None:
+                positions[car.id] = (car.current_location_lat, car.current_location_lng)
+        return positions
+    
+    def get_out_of_range_cars(self):
+        """Get all cars currently out of range"""
+        return CarRepository.get_by_status('out_of_range')
+
+    def get_offline_trackers(self):
+        """Get cars whose tracker stopped reporting (see HeartbeatMonitor)"""
+        return CarRepository.get_tracker_offline()
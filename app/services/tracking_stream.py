@@ -0,0 +1,70 @@
+from app.patterns.observer.event_bus import EventBus
+from collections import OrderedDict
+import threading
+
+class TrackingStream:
+    """Live car position and status patches for the admin tracking page
+
+    TrackingService publishes one `car_positions_updated` event per ingest
+    batch or sweep on the event bus. Each worker keeps only the newest
+    patch per car, keyed by the bus event id that last changed it, so
+    every SSE client of the worker is served from memory: a client waits
+    for ids past its cursor and receives just the cars that changed since,
+    merged into one message however many fixes arrived in between.
+    """
+
+    EVENT_TYPE = 'car_positions_updated'
+
+    _patches = OrderedDict()  # car_id -> (event_id, patch), oldest change first
+    _last_id = 0
+    _changed = threading.Condition()
+    _subscribed = False
+
+    @classmethod
+    def start(cls):
+        """Subscribe the worker's stream to the event bus (once)"""
+        with cls._changed:
+            if cls._subscribed:
+                return
+            cls._subscribed = True
+        EventBus.shared().subscribe(cls._receive)
+
+    @classmethod
+    def get_last_id(cls):
+        """Get the id of the newest change, the cursor for a new client"""
+        with cls._changed:
+            return cls._last_id
+
+    @classmethod
+    def _receive(cls, event_id, event_type, data):
+        """Event bus subscriber: merge the patches of one event"""
+        if event_type != cls.EVENT_TYPE:
+            return
+        with cls._changed:
+            for patch in data.get('cars', []):
+                car_id = patch['car_id']
+                previous = cls._patches.pop(car_id, None)
+                merged = dict(previous[1], **patch) if previous else patch
+                cls._patches[car_id] = (event_id, merged)
+            cls._last_id = max(cls._last_id, event_id)
+            cls._changed.notify_all()
+
+    @classmethod
+    def wait(cls, after_id, timeout):
+        """Wait up to `timeout` seconds for changes after `after_id`
+
+        Returns (last_id, patches), with an empty list when nothing changed.
+        """
+        with cls._changed:
+            if cls._last_id <= after_id:
+                cls._changed.wait(timeout)
+            if after_id > cls._last_id:
+                # Cursor from another process generation: resend what is known
+                after_id = 0
+            patches = []
+            for event_id, patch in reversed(cls._patches.values()):
+                if event_id <= after_id:
+                    break
+                patches.append(patch)
+            patches.reverse()
+            return max(cls._last_id, after_id), patches
@@ -0,0 +1,81 @@
+"""
+Augmented interval tree for fast overlap queries on booking periods
+"""
+
+
+class _Node:
+    """Tree node holding one interval and the max end date of its subtree"""
+
+    __slots__ = ('start', 'end', 'payload', 'max_end', 'left', 'right')
+
+    def __init__(self, start, end, payload):
+        self.start = start
+        self.end = end
+        self.payload = payload
+        self.max_end = end
+        self.left = None
+        self.right = None
+
+
+class IntervalTree:
+    """Balanced interval tree over half-open [start, end) intervals
+
+    The tree is built once from a batch of intervals (sorted by start, median
+    as root), so lookups are O(log n + k) without any rebalancing logic.
+    """
+
+    def __init__(self, intervals=()):
+        items = sorted(intervals, key=lambda item: item[0])
+        self._size = len(items)
+        self._root = self._build(items, 0, len(items))
+
+    def _build(self, items, lo, hi):
+        """Build a balanced subtree from items[lo:hi]"""
+        if lo >= hi:
+            return None
+
+        mid = (lo + hi) // 2
+        start, end, payload = items[mid]
+        node = _Node(start, end, payload)
+        node.left = self._build(items, lo, mid)
+        node.right = self._build(items, mid + 1, hi)
+
+        for child in (node.left, node.right):
+            if child and child.max_end > node.max_end:
+                node.max_end = child.max_end
+        return node
+
+    def __len__(self):
+        return self._size
+
+    def overlaps(self, start, end):
+        """Check whether any stored interval overlaps [start, end)"""
+        node = self._root
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            if node.max_end <= start:
+                continue
+            if node.start < end and node.end > start:
+                return True
+            if node.left:
+                stack.append(node.left)
+            if node.right and node.start < end:
+                stack.append(node.right)
+        return False
+
+    def find_overlapping(self, start, end):
+        """Get payloads of all stored intervals overlapping [start, end)"""
+        results = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            if node.max_end <= start:
+                continue
+            if node.start < end and node.end > start:
+                results.append(node.payload)
+            if node.left:
+                stack.append(node.left)
+            if node.right and node.start < end:
+                stack.append(node.right)
+        return results
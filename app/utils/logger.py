@@ -1,74 +1,74 @@
-"""
-Professional logging configuration for the application
-"""
-import logging
-import os
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
-
-def setup_logger(app):
-    """Configure application-wide logging"""
-    
-    # Create logs directory if it doesn't exist
-    log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Set log level based on environment
-    log_level = logging.DEBUG if app.debug else logging.INFO
-    
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '[%(asctime)s] %(levelname)s in %(module)s (%(pathname)s:%(lineno)d): %(message)s'
-    )
-    simple_formatter = logging.Formatter(
-        '[%(asctime)s] %(levelname)s: %(message)s'
-    )
-    
-    # File handler for all logs
-    file_handler = RotatingFileHandler(
-        os.path.join(log_dir, 'app.log'),
-        maxBytes=10485760,  # 10MB
-        backupCount=10
-    )
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(detailed_formatter)
-    
-    # File handler for errors only
-    error_handler = RotatingFileHandler(
-        os.path.join(log_dir, 'errors.log'),
-        maxBytes=10485760,
-        backupCount=10
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(detailed_formatter)
-    
-    # Stream handler for console
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(simple_formatter)
-    
-    # Configure app logger
-    app.logger.setLevel(log_level)
-    app.logger.addHandler(file_handler)
-    app.logger.addHandler(error_handler)
-    app.logger.addHandler(console_handler)
-    
-    # Prevent duplicate logs
-    app.logger.propagate = False
-    
-    app.logger.info('='*50)
-    app.logger.info(f'Application started at {datetime.now()}')
-    app.logger.info(f'Environment: {"Development" if app.debug else "Production"}')
-    app.logger.info('='*50)
-    
-    return app.logger
-
-
-class LoggerMixin:
-    """Mixin class to add logging capabilities to any class"""
-    
-    @property
-    def logger(self):
-        if not hasattr(self, '_logger'):
-            self._logger = logging.getLogger(self.__class__.__name__)
-        return self._logger
+"""
+Professional logging configuration for the application
+"""
+import logging
+import os
+from logging.handlers import RotatingFileHandler
+from datetime import datetime
+
+def setup_logger(app):
+    """Configure application-wide logging"""
+    
+    # Create logs directory if it doesn't exist
+    log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    
+    # Set log level based on environment
+    log_level = logging.DEBUG if app.debug else logging.INFO
+    
+    # Create formatters
+    detailed_formatter = logging.Formatter(
+        '[%(asctime)s] %(levelname)s in %(module)s (%(pathname)s:%(lineno)d): %(message)s'
+    )
+    simple_formatter = logging.Formatter(
+        '[%(asctime)s] %(levelname)s: %(message)s'
+    )
+    
+    # File handler for all logs
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, 'app.log'),
+        maxBytes=10485760,  # 10MB
+        backupCount=10
+    )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(detailed_formatter)
+    
+    # File handler for errors only
+    error_handler = RotatingFileHandler(
+        os.path.join(log_dir, 'errors.log'),
+        maxBytes=10485760,
+        backupCount=10
+    )
+    error_handler.setLevel(logging.ERROR)
+    error_handler.setFormatter(detailed_formatter)
+    
+    # Stream handler for console
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(simple_formatter)
+    
+    # Configure app logger
+    app.logger.setLevel(log_level)
+    app.logger.addHandler(file_handler)
+    app.logger.addHandler(error_handler)
+    app.logger.addHandler(console_handler)
+    
+    # Prevent duplicate logs
+    app.logger.propagate = False
+    
+    app.logger.info('='*50)
+    app.logger.info(f'Application started at {datetime.now()}')
+    app.logger.info(f'Environment: {"Development" if app.debug else "Production"}')
+    app.logger.info('='*50)
+    
+    return app.logger
+
+
+class LoggerMixin:
+    """Mixin class to add logging capabilities to any class"""
+    
+    @property
+    def logger(self):
+        if not hasattr(self, '_logger'):
+            self._logger = logging.getLogger(self.__class__.__name__)
+        return self._logger
@@ -0,0 +1,59 @@
+"""
+Fixed-capacity, thread-safe ring buffer with monotonically increasing ids
+"""
+from collections import deque
+from itertools import islice
+import threading
+
+
+class RingBuffer:
+    """Keeps the newest `capacity` items; each append gets the next id
+
+    Ids keep increasing after old items are evicted, so readers can poll
+    with the last id they saw and receive only newer items. Callers may
+    supply their own increasing ids (e.g. event bus ids), gaps allowed.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._items = deque(maxlen=capacity)
+        self._last_id = 0
+        self._lock = threading.Lock()
+
+    def append(self, item, item_id=None):
+        """Store a dict, setting its 'id' (next id unless given), and return it"""
+        with self._lock:
+            self._last_id = item_id if item_id is not None else self._last_id + 1
+            item['id'] = self._last_id
+            self._items.append(item)
+            return item
+
+    def since(self, after_id=0, limit=None):
+        """Get items with id > after_id, oldest first"""
+        with self._lock:
+            # Walk back from the newest item: cost is the number of new items
+            items = []
+            for item in reversed(self._items):
+                if item['id'] <= after_id:
+                    break
+                items.append(item)
+        items.reverse()
+        return items[:limit] if limit is not None else items
+
+    def latest(self, limit):
+        """Get the newest `limit` items, oldest first"""
+        with self._lock:
+            return list(islice(self._items, max(0, len(self._items) - limit), None))
+
+    @property
+    def last_id(self):
+        """Id of the newest item ever appended (0 if none)"""
+        return self._last_id
+
+    def clear(self):
+        """Drop all items (ids keep increasing)"""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
@@ -0,0 +1,27 @@
+"""
+Location history archive script
+Appends location history recorded before today to the columnar track archive
+(TRACK_ARCHIVE_DIR), read by TrackingService for route replay and distance
+analytics. Incremental: run it nightly, before compact_history.py so the
+archive keeps full-resolution tracks.
+"""
+
+from app import create_app
+from app.services.tracking_service import TrackingService
+
+def report_progress(car_id, archived):
+    """Print the result of one archived car"""
+    print(f"  Car {car_id}: {archived} points archived")
+
+def archive_history():
+    """Export new location history rows to the track archive"""
+    app = create_app()
+    
+    with app.app_context():
+        service = TrackingService()
+        print(f"Archiving location history to {service.archive.root}...")
+        result = service.archive_history(progress=report_progress)
+        print(f"Archived {result['archived']} points of {result['cars']} cars")
+
+if __name__ == '__main__':
+    archive_history()
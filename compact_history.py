@@ -0,0 +1,35 @@
+"""
+Location history compaction script
+Keeps full resolution for the last HISTORY_FULL_RESOLUTION_DAYS days and
+simplifies each car's older track, deleting the dropped rows in small batches.
+Safe to run while trackers keep reporting; schedule it (e.g. a nightly Render
+cron job). Pass --vacuum to let Postgres reuse the freed space right away.
+"""
+
+import sys
+from app import create_app
+from app.data.location_repository import LocationRepository
+from app.services.history_compaction_service import HistoryCompactionService
+
+def report_progress(car_id, day, scanned, deleted):
+    """Print the result of one compacted day"""
+    print(f"  Car {car_id} {day:%Y-%m-%d}: {scanned} points, {deleted} removed")
+
+def compact_history(vacuum=False):
+    """Compact location history older than the full-resolution period"""
+    app = create_app()
+    
+    with app.app_context():
+        service = HistoryCompactionService()
+        print(f"Compacting location history before {service.get_cutoff():%Y-%m-%d} "
+              f"({service.simplifier.method})...")
+        result = service.compact(progress=report_progress)
+        print(f"Compacted {result['days']} days of {result['cars']} cars")
+        print(f"  - Points scanned: {result['scanned']}")
+        print(f"  - Points removed: {result['deleted']}")
+        
+        if vacuum and LocationRepository.vacuum():
+            print("  ✓ Vacuumed location_history")
+
+if __name__ == '__main__':
+    compact_history(vacuum='--vacuum' in sys.argv)
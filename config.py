@@ -1,51 +1,124 @@
-import os
-from datetime import timedelta
-
-basedir = os.path.abspath(os.path.dirname(__file__))
-
-class Config:
-    """Base configuration class with production support"""
-    
-    # Secret key for session management
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
-    
-    # Database configuration
-    # Use PostgreSQL on Render.com (production), SQLite locally (development)
-    DATABASE_URL = os.environ.get('DATABASE_URL')
-    
-    # Render provides postgres:// — prefer psycopg3 driver for newer Python versions
-    # Convert scheme and ensure SQLAlchemy uses psycopg3 (postgresql+psycopg://)
-    if DATABASE_URL:
-        # Normalize scheme for pg8000 driver
-        if DATABASE_URL.startswith('postgres://'):
-            DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql+pg8000://', 1)
-        elif DATABASE_URL.startswith('postgresql://'):
-            DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+pg8000://', 1)
-
-        # Leave SSL query params (e.g., sslmode=require) unchanged — the pg8000 dialect
-        # handles SSL options in its own way. If the DB provider requires SSL, include
-        # the appropriate parameters (e.g., ?sslmode=require) in the supplied DATABASE_URL.
-        pass
-
-    SQLALCHEMY_DATABASE_URI = DATABASE_URL or 'sqlite:///' + os.path.join(basedir, 'database', 'car_rental.db')
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
-    
-    # Session configuration
-    PERMANENT_SESSION_LIFETIME = timedelta(hours=2)
-    SESSION_COOKIE_SECURE = os.environ.get('FLASK_ENV') == 'production'
-    SESSION_COOKIE_HTTPONLY = True
-    SESSION_COOKIE_SAMESITE = 'Lax'
-    
-    # Flask configuration
-    # Safer default: only enable DEBUG when FLASK_ENV is explicitly set to 'development'
-    DEBUG = os.environ.get('FLASK_ENV', '').lower() == 'development'
-    
-    # Geofencing settings (in kilometers)
-    MAX_ALLOWED_DISTANCE = 50  # km from rental location
-    
-    # Pricing tiers
-    PRICING_TIERS = {
-        'economy': 30,    # $ per day
-        'luxury': 100,
-        'suv': 65
-    }
+import os
+from datetime import timedelta
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+
+class Config:
+    """Base configuration class with production support"""
+    
+    # Secret key for session management
+    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
+    
+    # Database configuration
+    # Use PostgreSQL on Render.com (production), SQLite locally (development)
+    DATABASE_URL = os.environ.get('DATABASE_URL')
+    
+    # Render provides postgres:// — prefer psycopg3 driver for newer Python versions
+    # Convert scheme and ensure SQLAlchemy uses psycopg3 (postgresql+psycopg://)
+    if DATABASE_URL:
+        # Normalize scheme for pg8000 driver
+        if DATABASE_URL.startswith('postgres://'):
+            DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql+pg8000://', 1)
+        elif DATABASE_URL.startswith('postgresql://'):
+            DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+pg8000://', 1)
+
+        # Leave SSL query params (e.g., sslmode=require) unchanged — the pg8000 dialect
+        # handles SSL options in its own way. If the DB provider requires SSL, include
+        # the appropriate parameters (e.g., ?sslmode=require) in the supplied DATABASE_URL.
+        pass
+
+    SQLALCHEMY_DATABASE_URI = DATABASE_URL or 'sqlite:///' + os.path.join(basedir, 'database', 'car_rental.db')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # Session configuration
+    PERMANENT_SESSION_LIFETIME = timedelta(hours=2)
+    SESSION_COOKIE_SECURE = os.environ.get('FLASK_ENV') == 'production'
+    SESSION_COOKIE_HTTPONLY = True
+    SESSION_COOKIE_SAMESITE = 'Lax'
+    
+    # Flask configuration
+    # Safer default: only enable DEBUG when FLASK_ENV is explicitly set to 'development'
+    DEBUG = os.environ.get('FLASK_ENV', '').lower() == 'development'
+    
+    # Geofencing settings (in kilometers)
+    MAX_ALLOWED_DISTANCE = 50  # km from rental location
+    
+    # Hysteresis: a car leaves its zone beyond the exit distance and only
+    # counts as back inside the (smaller) re-entry distance; either crossing
+    # must persist for the dwell time before the status changes
+    GEOFENCE_EXIT_DISTANCE = MAX_ALLOWED_DISTANCE
+    GEOFENCE_REENTRY_DISTANCE = 45
+    GEOFENCE_MIN_DWELL_SECONDS = 60
+    # Repeated out-of-range/returned alerts for a car within this window are coalesced
+    GEOFENCE_ALERT_WINDOW_SECONDS = 300
+    
+    # Fixes timestamped more than this many seconds ahead of the server clock
+    # are rejected, so one bad tracker clock cannot freeze a car's position
+    TRACKER_MAX_CLOCK_SKEW_SECONDS = 300
+    
+    # Seconds between write-behind flushes of cached car positions to the cars table
+    POSITION_FLUSH_INTERVAL = 5
+    
+    # Location history throttling: fixes closer than the car's tracker interval
+    # or that moved less than this many metres are not stored
+    LOCATION_MIN_MOVE_METERS = 50
+    
+    # Tracker heartbeat monitor: a tracker is offline after missing this many
+    # of its update intervals in a row
+    TRACKER_OFFLINE_MISSED_INTERVALS = 3
+    
+    # Odometer: legs implying a faster speed are GPS glitches and not counted
+    ODOMETER_MAX_SPEED_KMH = 250
+    
+    # Location history compaction (compact_history.py): history older than
+    # this many days is simplified with HISTORY_COMPACTION_METHOD
+    # ('douglas_peucker' within HISTORY_TOLERANCE_METERS, or 'bucket' keeping
+    # one point per HISTORY_BUCKET_SECONDS); rows are deleted in batches
+    HISTORY_FULL_RESOLUTION_DAYS = int(os.environ.get('HISTORY_FULL_RESOLUTION_DAYS', 30))
+    HISTORY_COMPACTION_METHOD = os.environ.get('HISTORY_COMPACTION_METHOD', 'douglas_peucker')
+    HISTORY_TOLERANCE_METERS = 25
+    HISTORY_BUCKET_SECONDS = 300
+    HISTORY_COMPACTION_BATCH_SIZE = 1000
+    
+    # Columnar memory-mapped archive of location history (archive_history.py)
+    TRACK_ARCHIVE_DIR = os.environ.get('TRACK_ARCHIVE_DIR') or os.path.join(basedir, 'archive', 'tracks')
+
+    # Availability engine: seconds before per-car booking interval trees are rebuilt
+    AVAILABILITY_CACHE_TTL = 30
+    
+    # Seconds fleet statistics may be served from cache (0 disables caching)
+    FLEET_STATS_CACHE_TTL = 10
+    
+    # Fleet import (import_fleet.py / admin upload): rows inserted per batch,
+    # and how many rejected rows are listed in the import report
+    FLEET_IMPORT_BATCH_SIZE = 1000
+    FLEET_IMPORT_MAX_ERRORS = 100
+    
+    # Async observer dispatch: worker threads and bounded queue size
+    OBSERVER_ASYNC_WORKERS = 2
+    OBSERVER_QUEUE_SIZE = 1000
+    
+    # Alert log rotation (logs/alerts.log)
+    ALERT_LOG_MAX_BYTES = 10485760  # 10MB
+    ALERT_LOG_BACKUP_COUNT = 5
+    
+    # Admin notifications: ring buffer size, and whether to store them in the
+    # notifications table instead (the event bus already shares them across workers)
+    NOTIFICATION_CAPACITY = 500
+    NOTIFICATIONS_PERSIST = os.environ.get('NOTIFICATIONS_PERSIST', 'false').lower() == 'true'
+    
+    # Event bus delivering observer events to every worker: inprocess, outbox
+    # or postgres (outbox + LISTEN/NOTIFY, needs psycopg which is not in
+    # requirements.txt); default depends on the database
+    EVENT_BUS = os.environ.get('EVENT_BUS') or (
+        'outbox' if SQLALCHEMY_DATABASE_URI.startswith('postgresql') else 'inprocess')
+    EVENT_BUS_POLL_INTERVAL = 1.0  # seconds between outbox polls
+    EVENT_BUS_BATCH_SIZE = 500
+    EVENT_OUTBOX_RETENTION = 3600  # seconds events stay in the outbox
+
+    # Pricing tiers
+    PRICING_TIERS = {
+        'economy': 30,    # $ per day
+        'luxury': 100,
+        'suv': 65
+    }
@@ -0,0 +1,46 @@
+"""
+Fleet import script
+Adds cars from a CSV or JSONL file (columns/keys: license_plate, model,
+category, optional rental_lat and rental_lng). The file is streamed row by
+row and inserted in batches of FLEET_IMPORT_BATCH_SIZE; invalid rows and
+plates already in the fleet are reported without stopping the import.
+
+Usage: python import_fleet.py cars.csv
+"""
+
+import sys
+from app import create_app
+from app.services.fleet_import_service import FleetImportService
+
+def report_progress(result):
+    """Print the running totals after each batch"""
+    print(f"  {result['processed']} rows read, {result['imported']} imported")
+
+def import_fleet(path):
+    """Import the cars of one CSV or JSONL file"""
+    file_format = FleetImportService.get_format(path)
+    if not file_format:
+        print("Unsupported file type, use .csv or .jsonl")
+        return False
+    
+    app = create_app()
+    
+    with app.app_context():
+        print(f"Importing fleet from {path}...")
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            result = FleetImportService().import_file(f, file_format, progress=report_progress)
+        
+        print(f"Imported {result['imported']} of {result['processed']} cars")
+        print(f"  - Duplicates: {result['duplicates']}")
+        print(f"  - Failed: {result['failed']}")
+        for error in result['errors']:
+            print(f"    line {error['line']} ({error['license_plate']}): {error['error']}")
+        if not result['success']:
+            print(f"✗ {result['message']}")
+        return result['success']
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: python import_fleet.py <file.csv|file.jsonl>")
+        sys.exit(1)
+    sys.exit(0 if import_fleet(sys.argv[1]) else 1)
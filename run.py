@@ -1,8 +1,16 @@
-from app import create_app
-
-app = create_app()
-
-if __name__ == "__main__":
-    # host='0.0.0.0' allows access from other devices on same network
-    # Use your computer's local IP address on your phone to access
-    app.run(host='0.0.0.0', port=5000, debug=True)
+from app import create_app
+from app.patterns.observer.event_bus import EventBus
+from app.services.heartbeat_monitor import HeartbeatMonitor
+
+app = create_app()
+
+# Background consumers run in the web workers only (not in CLI scripts, which
+# would claim overdue trackers and exit before notifying anyone, or poll the
+# event outbox for nobody)
+EventBus.shared().start()
+HeartbeatMonitor.start(app)
+
+if __name__ == "__main__":
+    # host='0.0.0.0' allows access from other devices on same network
+    # Use your computer's local IP address on your phone to access
+    app.run(host='0.0.0.0', port=5000, debug=True)
@@ -0,0 +1,27 @@
+"""
+Fleet-wide geofence sweep
+Re-checks every tracked car's last known position against its rental zone.
+Schedule it (e.g. a Render cron job every few minutes) to catch cars whose
+trackers stopped reporting while outside the allowed distance. It first marks
+cars booked whose booking's rental period has started since the last run.
+"""
+
+from app import create_app
+from app.services.booking_service import BookingService
+from app.services.tracking_service import TrackingService
+
+def sweep_geofence():
+    """Run one geofence sweep over the whole fleet"""
+    app = create_app()
+    
+    with app.app_context():
+        started = BookingService().start_due_rentals()['started']
+        print(f"Started {len(started)} rentals")
+        
+        result = TrackingService().sweep_fleet()
+        print(f"Checked {result['checked']} cars")
+        print(f"  - Went out of range: {len(result['out_of_range'])}")
+        print(f"  - Returned to range: {len(result['returned'])}")
+
+if __name__ == '__main__':
+    sweep_geofence()
@@ -0,0 +1,48 @@
+"""Shared fixtures: the Flask app on a throwaway SQLite database"""
+import os
+import tempfile
+
+# Config reads the environment when first imported, so set it before any
+# test module imports the app
+os.environ['FLASK_ENV'] = 'development'
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
+os.environ.pop('EVENT_BUS', None)
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def app():
+    from app import create_app
+    app = create_app()
+    app.config['TESTING'] = True
+    return app
+
+
+@pytest.fixture
+def db(app):
+    """Empty tables inside an app context"""
+    from app.models import db
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def make_car(db):
+    """Create and commit a car with sensible defaults"""
+    from app.models import Car
+    plates = iter(range(1, 100000))
+
+    def make_car(**fields):
+        fields.setdefault('license_plate', f'TST-{next(plates):04d}')
+        fields.setdefault('model', 'Test Car')
+        fields.setdefault('category', 'economy')
+        fields.setdefault('price_tier', 50.0)
+        car = Car(**fields)
+        db.session.add(car)
+        db.session.commit()
+        return car
+    return make_car
@@ -0,0 +1,98 @@
+"""Database tests for BookingService.book_any_car car allocation"""
+from datetime import datetime, timedelta
+import threading
+import pytest
+from app.data.unit_of_work import UnitOfWork
+from app.models import Booking, Car
+from app.services.availability_service import AvailabilityService
+from app.services.booking_service import BookingService
+
+START = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=7)
+END = START + timedelta(days=3)
+
+
+@pytest.fixture
+def service(db, monkeypatch):
+    # Interval trees are worker-wide; never reuse those of another test
+    monkeypatch.setattr(AvailabilityService, '_built_at', None)
+    return BookingService()
+
+
+def book(service, category='economy', start=START, end=END):
+    return service.book_any_car(category, 'Test Customer', '03001234567', '12345-1234567-1',
+                                start, end)
+
+
+def booked_car_ids(db):
+    db.session.expire_all()
+    return sorted(car_id for car_id, in db.session.query(Booking.car_id))
+
+
+def test_books_lowest_free_car_of_category(service, make_car, db):
+    make_car(category='suv')
+    first = make_car()
+    second = make_car()
+
+    assert book(service)['success']
+    assert book(service)['success']
+    result = book(service)
+
+    assert result['conflict']
+    assert booked_car_ids(db) == [first.id, second.id]
+
+
+def test_skips_blocking_statuses_and_overlapping_bookings(service, make_car, db):
+    make_car(status='maintenance')
+    taken = make_car()
+    free = make_car()
+    db.session.add(Booking(car_id=taken.id, customer_name='Other', customer_phone='0300',
+                           customer_cnic='1', start_date=START - timedelta(days=1),
+                           end_date=START + timedelta(days=1), total_amount=100.0))
+    db.session.commit()
+
+    assert book(service)['success']
+    assert booked_car_ids(db) == [taken.id, free.id]
+
+
+def test_candidate_is_locked_with_skip_locked(service, make_car, monkeypatch):
+    make_car()
+    calls = []
+    lock = UnitOfWork.lock
+
+    def recording_lock(query, skip_locked=False):
+        calls.append(skip_locked)
+        return lock(query, skip_locked)
+    monkeypatch.setattr(UnitOfWork, 'lock', staticmethod(recording_lock))
+
+    assert book(service)['success']
+    assert calls == [True]
+
+
+def test_candidate_booked_after_query_is_skipped(service, make_car, db, monkeypatch):
+    # The re-check under the lock sees a booking the candidate query missed
+    raced = make_car()
+    other = make_car()
+    is_car_available = service.availability.is_car_available
+    monkeypatch.setattr(service.availability, 'is_car_available',
+                        lambda car, start, end: car.id != raced.id and is_car_available(car, start, end))
+
+    assert book(service)['success']
+    assert booked_car_ids(db) == [other.id]
+
+
+def test_concurrent_requests_get_different_cars(service, make_car, db, app):
+    cars = [make_car().id for _ in range(2)]
+    results = []
+
+    def worker():
+        with app.app_context():
+            results.append(book(BookingService()))
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(bool(r['success']) for r in results) == [False, True, True]
+    assert booked_car_ids(db) == cars
+    assert all(db.session.get(Car, car_id).status == 'available' for car_id in cars)
@@ -0,0 +1,61 @@
+"""Database tests for FleetService.bulk_update_status"""
+import pytest
+from app.models import Car
+from app.services.fleet_service import FleetService
+
+
+@pytest.fixture
+def service(db):
+    return FleetService()
+
+
+def statuses(db, *cars):
+    db.session.expire_all()
+    return [db.session.get(Car, car.id).status for car in cars]
+
+
+def test_allowed_cars_change_and_refused_are_reported(service, make_car, db):
+    free = make_car(status='available')
+    booked = make_car(status='booked')
+    idle = make_car(status='available')
+
+    result = service.bulk_update_status([free.id, booked.id, 9999, idle.id, free.id], 'maintenance')
+
+    assert result['success']
+    assert result['updated'] == [free.id, idle.id]
+    assert result['failed'] == [
+        {'car_id': booked.id, 'error': 'Cannot change status from booked to maintenance'},
+        {'car_id': 9999, 'error': 'Car not found'},
+    ]
+    assert statuses(db, free, booked, idle) == ['maintenance', 'booked', 'maintenance']
+
+
+def test_no_allowed_car_changes_nothing(service, make_car, db):
+    car = make_car(status='available')
+
+    result = service.bulk_update_status([car.id], 'available')
+
+    assert result['updated'] == []
+    assert result['failed'] == [{'car_id': car.id, 'error': 'Car is already available'}]
+    assert statuses(db, car) == ['available']
+
+
+def test_leaving_maintenance_schedules_next_service(service, make_car, db):
+    serviced = make_car(status='maintenance', odometer_km=1200.0, interval_km=5000)
+    untracked = make_car(status='maintenance', interval_km=None)
+
+    service.bulk_update_status([serviced.id, untracked.id], 'available')
+
+    db.session.expire_all()
+    assert db.session.get(Car, serviced.id).service_due_km == 6200.0
+    assert db.session.get(Car, untracked.id).service_due_km is None
+    assert statuses(db, serviced, untracked) == ['available', 'available']
+
+
+def test_invalid_status_or_oversized_batch_is_refused(service, make_car, db):
+    car = make_car()
+
+    assert not service.bulk_update_status([car.id], 'stolen')['success']
+    oversized = list(range(1, FleetService.MAX_BULK_SIZE + 2))
+    assert not service.bulk_update_status(oversized, 'maintenance')['success']
+    assert statuses(db, car) == ['available']
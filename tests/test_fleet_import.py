@@ -0,0 +1,110 @@
+"""Database tests for FleetImportService batching and duplicate handling"""
+import io
+import pytest
+from app.data.car_repository import CarRepository
+from app.models import Car
+from app.services.fleet_import_service import FleetImportService
+
+HEADER = 'license_plate,model,category,rental_lat,rental_lng\n'
+
+
+def csv_file(*rows):
+    return io.StringIO(HEADER + ''.join(row + '\n' for row in rows))
+
+
+def plates(db):
+    db.session.expire_all()
+    return sorted(plate for plate, in db.session.query(Car.license_plate))
+
+
+def test_imports_valid_rows_in_batches(db):
+    batches = []
+    result = FleetImportService(batch_size=2).import_file(csv_file(
+        'ABC-101,Corolla,economy,24.86,67.00',
+        'abc-102,Civic,Economy,,',
+        'ABC-103,,economy,,',
+        'ABC-104,Land Cruiser,suv,24.86,',
+        'ABC-105,S-Class,luxury,,',
+    ), 'csv', progress=lambda r: batches.append(r['imported']))
+
+    assert result['success']
+    assert (result['processed'], result['imported'], result['failed']) == (5, 3, 2)
+    assert [e['line'] for e in result['errors']] == [4, 5]
+    assert batches == [2, 3]
+    assert plates(db) == ['ABC-101', 'ABC-102', 'ABC-105']
+    car = Car.query.filter_by(license_plate='ABC-105').one()
+    assert car.price_tier and car.interval_km and car.service_due_km == car.interval_km
+
+
+def test_duplicates_in_file_and_fleet_are_skipped(db, make_car):
+    make_car(license_plate='ABC-201')
+    result = FleetImportService(batch_size=2).import_file(io.StringIO(
+        '{"license_plate": "ABC-201", "model": "Corolla", "category": "economy"}\n'
+        '{"license_plate": "ABC-202", "model": "Civic", "category": "economy"}\n'
+        '{"license_plate": "ABC-202", "model": "Civic", "category": "economy"}\n'
+        '\n'
+        '{"license_plate": "ABC-203", "model": "Vitz", "category": "economy"}\n'
+        '{"license_plate": "ABC-203", "model": "Vitz", "category": "economy"}\n'
+        'not json\n'
+    ), 'jsonl')
+
+    assert (result['imported'], result['duplicates'], result['failed']) == (2, 3, 1)
+    # Repeats in a later batch are found in the fleet; invalid rows are
+    # listed as read, plates when their batch is flushed
+    assert [(e['line'], e['error']) for e in result['errors']] == [
+        (1, 'License plate already exists'),
+        (3, 'License plate already exists'),
+        (7, 'Invalid JSON object'),
+        (6, 'License plate already exists'),
+    ]
+    assert plates(db) == ['ABC-201', 'ABC-202', 'ABC-203']
+
+
+def test_concurrent_insert_is_retried(db, make_car, monkeypatch):
+    # The first lookup misses a plate added concurrently, so the INSERT fails
+    make_car(license_plate='ABC-301')
+    lookups = []
+    get_existing_plates = CarRepository.get_existing_plates
+
+    def racing_lookup(license_plates):
+        lookups.append(sorted(license_plates))
+        return set() if len(lookups) == 1 else get_existing_plates(license_plates)
+    monkeypatch.setattr(CarRepository, 'get_existing_plates', staticmethod(racing_lookup))
+
+    result = FleetImportService().import_file(csv_file(
+        'ABC-301,Corolla,economy,,',
+        'ABC-302,Civic,economy,,',
+    ), 'csv')
+
+    assert len(lookups) == 2
+    assert (result['imported'], result['duplicates'], result['failed']) == (1, 1, 0)
+    assert plates(db) == ['ABC-301', 'ABC-302']
+
+
+def test_batch_failing_twice_is_reported(db, make_car, monkeypatch):
+    make_car(license_plate='ABC-401')
+    monkeypatch.setattr(CarRepository, 'get_existing_plates', staticmethod(lambda plates: set()))
+
+    result = FleetImportService().import_file(csv_file(
+        'ABC-401,Corolla,economy,,',
+        'ABC-402,Civic,economy,,',
+    ), 'csv')
+
+    assert (result['imported'], result['failed']) == (0, 2)
+    assert {e['error'] for e in result['errors']} == {'Could not insert car'}
+    assert plates(db) == ['ABC-401']
+
+
+def test_unsupported_format_is_refused(db):
+    assert not FleetImportService().import_file(io.StringIO(''), 'xlsx')['success']
+
+
+def test_repeat_within_a_batch_is_a_file_duplicate(db):
+    result = FleetImportService().import_file(csv_file(
+        'ABC-501,Corolla,economy,,',
+        'ABC-501,Corolla,economy,,',
+    ), 'csv')
+
+    assert (result['imported'], result['duplicates']) == (1, 1)
+    assert result['errors'] == [
+        {'line': 3, 'license_plate': 'ABC-501', 'error': 'Duplicate license plate in file'}]
@@ -0,0 +1,103 @@
+"""Unit tests for the heartbeat monitor's deadline heap"""
+from datetime import datetime, timedelta
+import pytest
+from app.services.heartbeat_monitor import HeartbeatMonitor
+from config import Config
+
+
+@pytest.fixture(autouse=True)
+def monitor(monkeypatch):
+    # Fresh class-level state for every test (the thread is never started)
+    monkeypatch.setattr(HeartbeatMonitor, '_heap', [])
+    monkeypatch.setattr(HeartbeatMonitor, '_deadlines', {})
+    monkeypatch.setattr(HeartbeatMonitor, '_offline', set())
+    monkeypatch.setattr(HeartbeatMonitor, '_reported', set())
+    return HeartbeatMonitor
+
+
+def ago(seconds):
+    return datetime.now() - timedelta(seconds=seconds)
+
+
+def test_deadline_is_missed_intervals_after_fix(monitor):
+    seen = ago(10)
+    monitor.record(1, seen, 60)
+    deadline, last_seen, interval = monitor._deadlines[1]
+    assert deadline == seen + timedelta(seconds=60 * Config.TRACKER_OFFLINE_MISSED_INTERVALS)
+    assert (last_seen, interval) == (seen, 60)
+
+
+def test_missing_interval_uses_default(monitor):
+    seen = ago(10)
+    monitor.record(1, seen, None)
+    assert monitor._deadlines[1][2] == HeartbeatMonitor.DEFAULT_INTERVAL
+
+
+def test_collect_returns_only_passed_deadlines(monitor):
+    overdue = ago(3600)
+    monitor.record(1, overdue, 60)
+    monitor.record(2, ago(10), 60)
+    expired, reported = monitor._collect()
+    assert expired == [(1, overdue, 60)]
+    assert reported == set()
+    assert monitor._offline == {1}
+
+
+def test_expired_car_is_collected_once(monitor):
+    monitor.record(1, ago(3600), 60)
+    monitor._collect()
+    assert monitor._collect() == ([], set())
+
+
+def test_newer_fix_supersedes_heap_entry(monitor):
+    monitor.record(1, ago(3600), 60)
+    monitor.record(1, ago(10), 60)
+    assert len(monitor._heap) == 2
+    assert monitor._collect() == ([], set())
+    # The stale entry was popped and skipped; only the current deadline is left
+    assert monitor._heap == [(monitor._deadlines[1][0], 1)]
+
+
+def test_older_fix_is_ignored(monitor):
+    newest = ago(10)
+    monitor.record(1, newest, 60)
+    monitor.record(1, ago(3600), 60)
+    assert monitor._deadlines[1][1] == newest
+    assert len(monitor._heap) == 1
+
+
+def test_offline_car_reporting_again_is_cleared(monitor):
+    monitor.record(1, ago(3600), 60)
+    monitor._collect()
+    monitor.record(1, ago(10), 60)
+    assert monitor._offline == set()
+    assert monitor._collect() == ([], {1})
+
+
+def test_heap_is_rebuilt_when_stale_entries_dominate(monitor):
+    for seconds in range(200, 0, -1):
+        monitor.record(1, ago(seconds), 60)
+    assert len(monitor._heap) <= 4 * len(monitor._deadlines) + 64
+    assert (monitor._deadlines[1][0], 1) in monitor._heap
+
+
+def test_failed_offline_write_is_retried(monitor, monkeypatch):
+    class App:
+        class logger:
+            @staticmethod
+            def exception(message):
+                pass
+
+        @staticmethod
+        def app_context():
+            raise RuntimeError('database unavailable')
+
+    monkeypatch.setattr(HeartbeatMonitor, '_app', App)
+    seen = ago(3600)
+    monitor.record(1, seen, 60)
+    expired, reported = monitor._collect()
+    monitor._process(expired, reported)
+    assert monitor._offline == set()
+    retry_at, last_seen, _ = monitor._deadlines[1]
+    assert last_seen == seen and retry_at > datetime.now()
+    assert (retry_at, 1) in monitor._heap
@@ -0,0 +1,103 @@
+"""Database tests for HistoryCompactionService watermarks"""
+from datetime import datetime, timedelta
+import pytest
+from app.data.location_repository import LocationRepository
+from app.models import LocationHistory
+from app.services.history_compaction_service import HistoryCompactionService
+
+NOW = datetime(2025, 6, 30, 12, 0)  # keep_days=10: cutoff 2025-06-20 00:00
+
+
+@pytest.fixture
+def service(db):
+    return HistoryCompactionService(keep_days=10, method='bucket', bucket_seconds=600)
+
+
+def add_day(db, car_id, day, points=60):
+    """One fix a minute from 08:00, drifting north"""
+    start = datetime.combine(day, datetime.min.time()) + timedelta(hours=8)
+    LocationRepository.bulk_add([{
+        'car_id': car_id, 'latitude': 24.8 + i * 0.001, 'longitude': 67.0,
+        'is_out_of_range': False, 'timestamp': start + timedelta(minutes=i)
+    } for i in range(points)])
+    db.session.commit()
+
+
+def count(car_id, day):
+    start = datetime.combine(day, datetime.min.time())
+    return LocationHistory.query.filter(LocationHistory.car_id == car_id,
+                                        LocationHistory.timestamp >= start,
+                                        LocationHistory.timestamp < start + timedelta(days=1)).count()
+
+
+def test_compacts_only_days_before_cutoff(service, make_car, db):
+    car = make_car()
+    today = NOW.date()
+    older, old, recent = today - timedelta(days=20), today - timedelta(days=15), today - timedelta(days=5)
+    for day in (older, old, recent):
+        add_day(db, car.id, day)
+    days = []
+
+    result = service.compact(NOW, progress=lambda car_id, day, scanned, deleted: days.append(day.date()))
+
+    assert days == [older, old]
+    assert (result['cars'], result['days'], result['scanned']) == (1, 2, 120)
+    assert result['deleted'] == 120 - count(car.id, older) - count(car.id, old)
+    assert 7 <= count(car.id, old) < 60
+    assert count(car.id, recent) == 60
+    assert LocationRepository.get_compacted_until(car.id) == service.get_cutoff(NOW)
+
+
+def test_rerun_skips_compacted_days(service, make_car, db):
+    car = make_car()
+    add_day(db, car.id, NOW.date() - timedelta(days=15))
+    service.compact(NOW)
+
+    result = service.compact(NOW)
+
+    assert (result['days'], result['scanned'], result['deleted']) == (0, 0, 0)
+
+
+def test_later_run_starts_at_watermark(service, make_car, db):
+    car = make_car()
+    old, recent = NOW.date() - timedelta(days=15), NOW.date() - timedelta(days=5)
+    add_day(db, car.id, old)
+    add_day(db, car.id, recent)
+    service.compact(NOW)
+    days = []
+
+    later = NOW + timedelta(days=7)
+    result = service.compact(later, progress=lambda car_id, day, scanned, deleted: days.append(day.date()))
+
+    assert days == [recent]
+    assert result['scanned'] == 60
+    assert LocationRepository.get_compacted_until(car.id) == service.get_cutoff(later)
+
+
+def test_car_without_old_history_gets_no_watermark(service, make_car, db):
+    car = make_car()
+    add_day(db, car.id, NOW.date() - timedelta(days=2))
+
+    assert service.compact(NOW)['cars'] == 0
+    assert LocationRepository.get_compacted_until(car.id) is None
+
+
+def test_rows_are_deleted_in_batches(make_car, db, monkeypatch):
+    car = make_car()
+    add_day(db, car.id, NOW.date() - timedelta(days=15))
+    batches = []
+    delete_ids = LocationRepository.delete_ids
+    monkeypatch.setattr(LocationRepository, 'delete_ids',
+                        staticmethod(lambda ids: batches.append(len(ids)) or delete_ids(ids)))
+
+    service = HistoryCompactionService(keep_days=10, method='bucket', bucket_seconds=600, batch_size=10)
+    result = service.compact(NOW)
+
+    assert sum(batches) == result['deleted'] > 10
+    assert max(batches) == 10
+
+
+@pytest.mark.parametrize('batch_size', [0, -1])
+def test_batch_size_must_be_positive(batch_size):
+    with pytest.raises(ValueError):
+        HistoryCompactionService(batch_size=batch_size)
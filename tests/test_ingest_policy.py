@@ -0,0 +1,44 @@
+"""Unit tests for the location history ingest policy"""
+from datetime import datetime, timedelta
+from app.domain.ingest_policy import IngestPolicy
+
+START = datetime(2025, 1, 1, 10, 0)
+ORIGIN = (24.86, 67.0, START)
+
+
+def fix(seconds, latitude=24.86, longitude=67.0):
+    return {'latitude': latitude, 'longitude': longitude,
+            'timestamp': START + timedelta(seconds=seconds)}
+
+
+def test_first_fix_is_stored():
+    assert IngestPolicy(50).should_store(fix(0), None, 60)
+
+
+def test_fix_before_interval_is_not_stored():
+    assert not IngestPolicy(50).should_store(fix(30, latitude=25.0), ORIGIN, 60)
+
+
+def test_interval_slack_accepts_slightly_early_fix():
+    assert IngestPolicy(50).should_store(fix(55, latitude=25.0), ORIGIN, 60)
+
+
+def test_stationary_fix_is_not_stored():
+    # ~11 m north of the last stored fix
+    assert not IngestPolicy(50).should_store(fix(120, latitude=24.8601), ORIGIN, 60)
+
+
+def test_moved_fix_after_interval_is_stored():
+    # ~111 m north of the last stored fix
+    assert IngestPolicy(50).should_store(fix(120, latitude=24.861), ORIGIN, 60)
+
+
+def test_missing_interval_uses_default():
+    policy = IngestPolicy(50)
+    assert not policy.should_store(fix(IngestPolicy.DEFAULT_INTERVAL / 2, latitude=25.0), ORIGIN, None)
+    assert policy.should_store(fix(IngestPolicy.DEFAULT_INTERVAL, latitude=25.0), ORIGIN, None)
+
+
+def test_distance_m():
+    assert abs(IngestPolicy.distance_m(24.86, 67.0, 24.87, 67.0) - 1111.95) < 0.1
+    assert IngestPolicy.distance_m(24.86, 67.0, 24.86, 67.0) == 0
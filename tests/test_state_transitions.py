@@ -0,0 +1,45 @@
+"""Unit tests for the car state transition table"""
+import pytest
+from app.patterns.state.transitions import StateTransitions
+
+
+@pytest.mark.parametrize('current, target', [
+    ('available', 'booked'),
+    ('available', 'in_service'),
+    ('available', 'maintenance'),
+    ('booked', 'available'),
+    ('in_service', 'available'),
+    ('in_service', 'maintenance'),
+    ('maintenance', 'available'),
+    ('out_of_range', 'available'),
+])
+def test_allowed_changes(current, target):
+    assert StateTransitions.check(current, target) is None
+
+
+@pytest.mark.parametrize('current, target', [
+    ('booked', 'maintenance'),
+    ('maintenance', 'booked'),
+    ('out_of_range', 'booked'),
+    ('available', 'out_of_range'),
+])
+def test_refused_changes(current, target):
+    assert StateTransitions.check(current, target) == f'Cannot change status from {current} to {target}'
+
+
+def test_same_status_is_refused():
+    assert StateTransitions.check('booked', 'booked') == 'Car is already booked'
+
+
+def test_unknown_target_is_refused():
+    assert StateTransitions.check('available', 'stolen') == 'Invalid status: stolen'
+
+
+def test_unknown_current_status_reaches_nothing():
+    assert StateTransitions.check('stolen', 'available') == 'Cannot change status from stolen to available'
+
+
+def test_states_are_shared_instances():
+    state = StateTransitions.get_state('available')
+    assert StateTransitions.next_state('booked', 'complete_service') is state
+    assert type(state)() is state
@@ -0,0 +1,114 @@
+"""Tests for the columnar track archive and its export from location history"""
+from datetime import datetime, timedelta
+import numpy as np
+import pytest
+from app.data.location_repository import LocationRepository
+from app.data.track_archive import TrackArchive
+from app.services.tracking_service import TrackingService
+
+START = datetime(2025, 6, 1, 8, 0)
+
+
+def minutes(*offsets):
+    return [START + timedelta(minutes=m) for m in offsets]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return TrackArchive(str(tmp_path / 'tracks'))
+
+
+def test_round_trip_and_time_range(archive):
+    archive.append(7, minutes(0, 1), [24.1, 24.2], [67.1, 67.2], [False, True])
+    archive.append(7, minutes(2), [24.3], [67.3], [False])
+
+    track = archive.read(7)
+    assert track.timestamp.astype(datetime).tolist() == minutes(0, 1, 2)
+    assert track.latitude.tolist() == [24.1, 24.2, 24.3]
+    assert track.longitude.tolist() == [67.1, 67.2, 67.3]
+    assert track.out_of_range.tolist() == [False, True, False]
+    assert archive.count(7) == 3
+    assert archive.get_last_timestamp(7) == START + timedelta(minutes=2)
+
+    window = archive.read(7, START + timedelta(minutes=1), START + timedelta(minutes=2))
+    assert window.latitude.tolist() == [24.2]
+
+
+def test_empty_archive(archive):
+    assert archive.get_car_ids() == []
+    assert archive.count(1) == 0
+    assert archive.get_last_timestamp(1) is None
+    assert len(archive.read(1)) == 0
+
+
+def test_out_of_order_appends_are_refused(archive):
+    archive.append(1, minutes(5), [24.0], [67.0], [False])
+    with pytest.raises(ValueError):
+        archive.append(1, minutes(7, 6), [24.0, 24.0], [67.0, 67.0], [False, False])
+    with pytest.raises(ValueError):
+        archive.append(1, minutes(4), [24.0], [67.0], [False])
+    assert archive.count(1) == 1
+
+
+def test_partial_tail_is_dropped_on_next_append(archive):
+    # An append interrupted after writing latitude but before timestamp
+    archive.append(1, minutes(0), [24.0], [67.0], [False])
+    with open(archive._path(1, 'latitude'), 'ab') as f:
+        f.write(np.float64(99.0).tobytes())
+
+    archive.append(1, minutes(1), [24.5], [67.5], [True])
+
+    assert archive.read(1).latitude.tolist() == [24.0, 24.5]
+
+
+def test_car_ids_come_from_car_directories(archive, tmp_path):
+    archive.append(12, minutes(0), [24.0], [67.0], [False])
+    archive.append(3, minutes(0), [24.0], [67.0], [False])
+    (tmp_path / 'tracks' / 'notes').mkdir()
+
+    assert archive.get_car_ids() == [3, 12]
+
+
+@pytest.fixture
+def service(db, archive, tmp_path, monkeypatch):
+    # The alert logger creates logs/ in the working directory
+    monkeypatch.chdir(tmp_path)
+    service = TrackingService()
+    service.archive = archive
+    return service
+
+
+def add_history(db, car_id, timestamps):
+    LocationRepository.bulk_add([{
+        'car_id': car_id, 'latitude': 24.8 + i * 0.01, 'longitude': 67.0,
+        'is_out_of_range': i == 1, 'timestamp': timestamp
+    } for i, timestamp in enumerate(timestamps)])
+    db.session.commit()
+
+
+def test_history_export_round_trip(service, make_car, db):
+    car = make_car()
+    add_history(db, car.id, minutes(0, 10, 20) + [START + timedelta(days=1)])
+    before = START + timedelta(hours=12)
+
+    result = service.archive_history(before)
+
+    assert result == {'cars': 1, 'archived': 3}
+    track = service.get_archived_track(car.id)
+    assert track.timestamp.astype(datetime).tolist() == minutes(0, 10, 20)
+    assert track.latitude.tolist() == pytest.approx([24.8, 24.81, 24.82])
+    assert track.out_of_range.tolist() == [False, True, False]
+    # 0.02 degree of latitude is about 2.2 km
+    assert service.get_archived_distance(car.id) == pytest.approx(2.22, abs=0.01)
+
+
+def test_history_export_is_incremental(service, make_car, db):
+    car = make_car()
+    add_history(db, car.id, minutes(0, 10))
+    service.archive_history(START + timedelta(hours=1))
+
+    assert service.archive_history(START + timedelta(hours=1)) == {'cars': 0, 'archived': 0}
+
+    add_history(db, car.id, minutes(30, 40))
+    assert service.archive_history(START + timedelta(hours=1)) == {'cars': 1, 'archived': 2}
+    assert service.archive.count(car.id) == 4
@@ -0,0 +1,91 @@
+"""Database tests for TrackingService.ingest_batch"""
+from datetime import datetime, timedelta
+import pytest
+from app.models import Car, LocationHistory
+from app.services.position_cache import PositionCache
+from app.services.tracking_service import TrackingService
+
+RENTAL = (24.8607, 67.0011)
+
+
+@pytest.fixture
+def service(db, tmp_path, monkeypatch):
+    # The alert logger creates logs/ in the working directory
+    monkeypatch.chdir(tmp_path)
+    # Fresh worker-wide caches; positions are never flushed by a thread
+    monkeypatch.setattr(TrackingService, '_last_stored', {})
+    monkeypatch.setattr(PositionCache, '_positions', {})
+    monkeypatch.setattr(PositionCache, '_dirty', set())
+    monkeypatch.setattr(PositionCache, '_patches', {})
+    monkeypatch.setattr(PositionCache, '_start', classmethod(lambda cls: None))
+    service = TrackingService()
+    yield service
+    service.notification_system.flush(timeout=5)
+
+
+def at(minutes_ago):
+    return (datetime.now() - timedelta(minutes=minutes_ago)).replace(microsecond=0)
+
+
+def fix(car_id, lat, lng, minutes_ago):
+    return {'car_id': car_id, 'lat': lat, 'lng': lng, 'ts': at(minutes_ago).isoformat()}
+
+
+def test_stores_history_and_rejects_bad_points(service, make_car):
+    car = make_car(rental_location_lat=RENTAL[0], rental_location_lng=RENTAL[1],
+                   tracker_update_interval=60)
+    last = fix(car.id, 24.87, 67.01, 5)
+    result = service.ingest_batch([
+        fix(car.id, 24.86, 67.00, 10),
+        {'car_id': car.id, 'lat': 'north', 'lng': 67.0},
+        fix(9999, 24.86, 67.00, 10),
+        last,
+    ])
+
+    assert result['success']
+    assert result['accepted'] == 2
+    assert result['stored'] == 2
+    assert [r['index'] for r in result['rejected']] == [1, 2]
+    assert result['rejected'][1]['error'] == 'Car not found'
+    assert LocationHistory.query.filter_by(car_id=car.id).count() == 2
+    assert PositionCache.get(car.id) == (24.87, 67.01, datetime.fromisoformat(last['ts']))
+
+
+def test_fixes_within_tracker_interval_are_not_stored(service, make_car):
+    car = make_car(tracker_update_interval=300)
+    result = service.ingest_batch([
+        fix(car.id, 24.86, 67.00, 10),
+        fix(car.id, 24.87, 67.01, 9),
+        fix(car.id, 24.88, 67.02, 4),
+    ])
+
+    assert (result['accepted'], result['stored']) == (3, 2)
+    assert PositionCache.get(car.id)[:2] == (24.88, 67.02)
+
+
+def test_car_leaves_range_after_dwell(service, make_car, db):
+    car = make_car(status='booked', rental_location_lat=RENTAL[0],
+                   rental_location_lng=RENTAL[1], tracker_update_interval=30)
+    far = (RENTAL[0] + 1.0, RENTAL[1])  # ~111 km north
+
+    first = service.ingest_batch([fix(car.id, *far, 10)])
+    assert first['out_of_range'] == []
+
+    second = service.ingest_batch([fix(car.id, *far, 8)])
+    assert second['out_of_range'] == [car.id]
+    db.session.expire_all()
+    car = db.session.get(Car, car.id)
+    assert car.status == 'out_of_range'
+    assert car.range_alert_open
+
+
+def test_odometer_advances_with_fixes(service, make_car, db):
+    car = make_car(tracker_update_interval=30, odometer_km=100.0)
+    service.ingest_batch([
+        fix(car.id, 24.80, 67.00, 30),
+        fix(car.id, 24.90, 67.00, 20),
+    ])
+
+    db.session.expire_all()
+    # 0.1 degree of latitude is about 11.1 km
+    assert db.session.get(Car, car.id).odometer_km == pytest.approx(111.1, abs=0.2)
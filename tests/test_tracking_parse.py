@@ -0,0 +1,68 @@
+"""Unit tests for TrackingService fix parsing"""
+from datetime import datetime, timedelta
+import pytest
+from app.services.tracking_service import TrackingService
+from config import Config
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    # The alert logger creates logs/ in the working directory
+    monkeypatch.chdir(tmp_path)
+    return TrackingService()
+
+
+def test_parse_timestamp_defaults_when_missing():
+    now = datetime(2025, 1, 1, 10, 0)
+    assert TrackingService._parse_timestamp(None, now) == now
+
+
+def test_parse_timestamp_epoch_seconds():
+    assert TrackingService._parse_timestamp(1735725600, None) == datetime.fromtimestamp(1735725600)
+
+
+def test_parse_timestamp_iso_with_offset_is_local_and_naive():
+    parsed = TrackingService._parse_timestamp('2025-01-01T10:00:00+00:00', None)
+    assert parsed.tzinfo is None
+    assert parsed == datetime.fromisoformat('2025-01-01T10:00:00+00:00').astimezone().replace(tzinfo=None)
+
+
+def test_parse_points_accepts_aliases(service):
+    fixes, rejected = service._parse_points([
+        {'car_id': 3, 'latitude': '24.86', 'longitude': 67.0, 'timestamp': '2025-01-01T10:00:00'}
+    ])
+    assert rejected == []
+    assert fixes == [{'index': 0, 'car_id': 3, 'latitude': 24.86, 'longitude': 67.0,
+                      'timestamp': datetime(2025, 1, 1, 10, 0)}]
+
+
+@pytest.mark.parametrize('point', [
+    {'lat': 1, 'lng': 1},                          # no car
+    {'car_id': 1.9, 'lat': 1, 'lng': 1},           # car ids must be JSON integers
+    {'car_id': True, 'lat': 1, 'lng': 1},
+    {'car_id': '7', 'lat': 1, 'lng': 1},
+    {'car_id': 1, 'lat': 'x', 'lng': 1},           # not a number
+    {'car_id': 1, 'lat': 91, 'lng': 1},            # out of bounds
+    {'car_id': 1, 'lat': 1, 'lng': 1, 'ts': 'soon'},
+    {'car_id': 1, 'lat': 1, 'lng': 1, 'ts': True},   # not an epoch
+    {'car_id': 1, 'lat': 1, 'lng': 1, 'ts': 1e20},  # overflows datetime
+    {'car_id': 1, 'lat': 1, 'lng': 1, 'ts': 1e300},
+    {'car_id': 1, 'lat': 1, 'lng': 1, 'ts': '9999-12-31T23:59:59+00:00'},
+])
+def test_parse_points_rejects_bad_point_without_failing_batch(service, point):
+    fixes, rejected = service._parse_points([point, {'car_id': 2, 'lat': 1, 'lng': 1}])
+    assert [fix['car_id'] for fix in fixes] == [2]
+    assert [error['index'] for error in rejected] == [0]
+
+
+def test_parse_points_rejects_future_fix_beyond_clock_skew(service):
+    skew = timedelta(seconds=Config.TRACKER_MAX_CLOCK_SKEW_SECONDS)
+    too_late = (datetime.now() + skew + timedelta(minutes=5)).isoformat()
+    within = (datetime.now() + skew / 2).isoformat()
+    fixes, rejected = service._parse_points([
+        {'car_id': 1, 'lat': 1, 'lng': 1, 'ts': too_late},
+        {'car_id': 1, 'lat': 1, 'lng': 1, 'ts': within},
+        {'car_id': 1, 'lat': 1, 'lng': 1, 'ts': '2099-01-01T00:00:00'}
+    ])
+    assert [fix['index'] for fix in fixes] == [1]
+    assert [error['index'] for error in rejected] == [0, 2]
@@ -0,0 +1,34 @@
+"""
+Database schema upgrade script
+Adds columns and indexes introduced since the database was created.
+Idempotent: safe to run on every deploy (e.g. as part of the build/start command).
+"""
+
+from app import create_app
+from app.data.schema_upgrade import SchemaUpgrade
+
+def upgrade_database():
+    """Upgrade the configured database in place"""
+    app = create_app()
+    
+    with app.app_context():
+        print("Upgrading database schema...")
+        result = SchemaUpgrade.run()
+        
+        for column in result['columns_added']:
+            print(f"  ✓ Added column {column}")
+        for index in result['indexes_created']:
+            print(f"  ✓ Created index {index}")
+        if result['location_cells_backfilled']:
+            print(f"  ✓ Indexed location of {result['location_cells_backfilled']} cars")
+        if result['range_alerts_backfilled']:
+            print(f"  ✓ Opened range alerts for {result['range_alerts_backfilled']} out-of-range cars")
+        if result['maintenance_profiles_backfilled']:
+            print(f"  ✓ Set maintenance intervals of {result['maintenance_profiles_backfilled']} cars")
+        
+        if not (result['columns_added'] or result['indexes_created']):
+            print("Schema already up to date")
+        print("Database upgrade complete!")
+
+if __name__ == '__main__':
+    upgrade_database()